@@ -0,0 +1,42 @@
+# bench_select_skill.py
+import random
+import timeit
+
+from project_code.src.main import Attribute, CommandParser, Deputy, Event, Horse, Outlaw, Sheriff
+
+
+def _select_skill_by_scanning(character):
+    """The old CommandParser.select_skill, kept here as the baseline."""
+    return random.choice([attribute for attribute in character.__dict__.values() if isinstance(attribute, Attribute)])
+
+
+def main(number: int = 200_000):
+    party = [Sheriff(), Outlaw(), Deputy(), Horse()]
+    parser = CommandParser()
+    event = Event(parser, {"primary_attribute": "Strength", "secondary_attribute": "Dexterity"})
+
+    character = party[2]
+    scan = timeit.timeit(lambda: [a for a in character.__dict__.values() if isinstance(a, Attribute)], number=number)
+    cached = timeit.timeit(lambda: character.skills, number=number)
+    print(f"skill lookup  scan __dict__: {scan / number * 1e9:8.0f} ns/call")
+    print(f"skill lookup  cached skills: {cached / number * 1e9:8.0f} ns/call  ({scan / cached:.1f}x faster)")
+
+    scan = timeit.timeit(lambda: _select_skill_by_scanning(random.choice(party)), number=number)
+    cached = timeit.timeit(lambda: parser.select_skill(random.choice(party)), number=number)
+    print(f"select_skill  scan __dict__: {scan / number * 1e9:8.0f} ns/call")
+    print(f"select_skill  cached skills: {cached / number * 1e9:8.0f} ns/call  ({scan / cached:.1f}x faster)")
+
+    def resolve_scanning():
+        event.check(_select_skill_by_scanning(random.choice(party)))
+
+    def resolve_indexed():
+        event.check(parser.select_skill(random.choice(party)))
+
+    scan = timeit.timeit(resolve_scanning, number=number)
+    cached = timeit.timeit(resolve_indexed, number=number)
+    print(f"event resolve scan __dict__: {scan / number * 1e9:8.0f} ns/call")
+    print(f"event resolve cached skills: {cached / number * 1e9:8.0f} ns/call  ({scan / cached:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
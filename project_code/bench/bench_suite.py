@@ -0,0 +1,258 @@
+# bench_suite.py
+"""Timings for the game's hot paths, with JSON baselines and a regression check.
+
+    python -m project_code.bench.bench_suite run --save baseline.json
+    python -m project_code.bench.bench_suite compare baseline.json --threshold 0.10
+
+Each benchmark runs at several sizes. A result is the best time per operation over a few
+repeats, which is the least noisy number timeit can give on a shared machine.
+
+Timings only mean something on the machine that made them, so no baseline is committed:
+save one on your own machine before a change, then compare against it after.
+"""
+import argparse
+import io
+import json
+import platform
+import sys
+import time
+import timeit
+
+from project_code.src.main import CommandParser, Event, Game, Location, Sheriff, Outlaw, Deputy, Horse
+from project_code.src.MCTSParser import MCTSParser
+from project_code.src.OutputSink import NullSink
+from project_code.src.Seeds import make_rng
+from project_code.src.Simulation import HeadlessGame, SimulationReport
+
+SEED = 150
+BENCHMARKS = {}
+
+
+def benchmark(name: str, sizes=(1,)):
+    """Register a benchmark. The function takes a size and returns (callable, operations per call)."""
+    def register(setup):
+        BENCHMARKS[name] = (setup, tuple(sizes))
+        return setup
+    return register
+
+
+def _make_events(parser, count: int) -> list:
+    attributes = ("Strength", "Dexterity", "Intelligence", "Wisdom", "Charisma")
+    return [Event(parser, {"primary_attribute": attributes[index % 5], "secondary_attribute": attributes[index % 3],
+                           "prompt_text": f"Event {index}"}) for index in range(count)]
+
+
+def _make_party(size: int) -> list:
+    kinds = (Sheriff, Outlaw, Deputy, Horse)
+    return [kinds[index % len(kinds)]() for index in range(size)]
+
+
+@benchmark("game_init", sizes=(1, 10))
+def bench_game_init(size):
+    sink = NullSink()
+
+    def run():
+        for _ in range(size):
+            Game(CommandParser(), sink, SEED)
+    return run, size
+
+
+@benchmark("event_execute", sizes=(1, 4, 64))
+def bench_event_execute(size):
+    parser = CommandParser(make_rng(SEED, "parser"))
+    event = _make_events(parser, 1)[0]
+    party = _make_party(size)
+    sink = NullSink()
+    return lambda: event.execute(party, sink), 1
+
+
+@benchmark("select_skill", sizes=(1, 4, 64))
+def bench_select_skill(size):
+    parser = CommandParser()
+    Game(parser, NullSink(), SEED)
+    party = _make_party(size)
+
+    def run():
+        for character in party:
+            parser.select_skill(character)
+    return run, size
+
+
+@benchmark("get_event", sizes=(10, 1000, 100_000))
+def bench_get_event(size):
+    parser = CommandParser()
+    game = Game(parser, NullSink(), SEED)
+    location = Location("Bench", "A location with a large deck.")
+    game.add_location(location)
+    location.add_events(_make_events(parser, size))
+    draws = min(size, 1000)
+
+    def run():
+        for _ in range(draws):
+            location.get_event()
+    return run, draws
+
+
+@benchmark("dispatch", sizes=(1, 100))
+def bench_dispatch(size):
+    game = Game(CommandParser(), NullSink(), SEED)
+    game._check_current_state()
+    script = ["status", "look", "st", "help status", "nonsense"] * size
+
+    def run():
+        for line in script:
+            game.handle_command(line)
+    return run, len(script)
+
+
+@benchmark("headless_game", sizes=(2, 100, 1000))
+def bench_headless_game(size):
+    """A full game, with size events spread over the two locations."""
+    sink = NullSink()
+    # The extra events are built once, so the timing covers playing rather than event creation.
+    # Events resolve with their own parser, as a game's do.
+    extra_events = _make_events(CommandParser(make_rng(SEED, "parser")), size // 2 - 1) if size > 2 else []
+
+    def run():
+        game = HeadlessGame(CommandParser(), sink, SEED)
+        for location in game.locations:
+            location.add_events(extra_events)
+        game.play(SimulationReport())
+    return run, 1
+
+
+@benchmark("game_fork", sizes=(2, 1000))
+def bench_game_fork(size):
+    """Fork a game with size locations and play one turn in the fork."""
+    game = Game(CommandParser(), NullSink(), SEED)
+    events = _make_events(game.parser, 100)
+    for index in range(size - len(game.locations)):
+        location = Location(f"Bench {index}", "A location with a deck of its own.")
+        game.add_location(location)
+        location.add_events(list(events))
+    game._check_current_state()
+
+    def run():
+        game.fork().run_script(["execute"])
+    return run, 1
+
+
+@benchmark("game_fork_deck", sizes=(100, 1_000_000))
+def bench_game_fork_deck(size):
+    """Fork a game whose locations have shuffled decks of size events and play two turns in the
+    fork, so the second draws from a forked deck of that size."""
+    game = Game(CommandParser(), NullSink(), SEED)
+    event = _make_events(game.parser, 1)[0]
+    for location in game.locations:
+        # One event object repeated: the deck only cares how many cards it holds.
+        location.add_events([event] * (size - len(location.deck)))
+        location.deck.reshuffle()
+    game._check_current_state()
+
+    def run():
+        game.fork().run_script(["execute", "execute"])
+    return run, 1
+
+
+@benchmark("mcts_move", sizes=(50, 200))
+def bench_mcts_move(size):
+    """Choose one move with an MCTSParser searching size iterations, starting with an empty table."""
+    parser = MCTSParser(iterations=size)
+    game = Game(parser, NullSink(), SEED)
+    parser.game = game
+    game._check_current_state()
+
+    def run():
+        parser.table.clear()
+        parser.best_move()
+    return run, 1
+
+
+def measure(run, operations: int, repeat: int = 5, min_time: float = 0.2) -> float:
+    """Best time per operation, in nanoseconds."""
+    timer = timeit.Timer(run)
+    number, elapsed = timer.autorange()
+    number = max(1, int(number * min_time / max(elapsed, 1e-9)))
+    return min(timer.repeat(repeat, number)) / number / operations * 1e9
+
+
+def run_benchmarks(names=None, repeat: int = 5, min_time: float = 0.2, out=sys.stdout) -> dict:
+    results = {}
+    for name, (setup, sizes) in BENCHMARKS.items():
+        if names and name not in names:
+            continue
+        for size in sizes:
+            key = f"{name}[{size}]"
+            results[key] = measure(*setup(size), repeat=repeat, min_time=min_time)
+            out.write(f"{key:<28}{results[key]:>14.0f} ns/op\n")
+    return results
+
+
+def save_baseline(path: str, results: dict):
+    baseline = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    with open(path, "w") as baseline_file:
+        json.dump(baseline, baseline_file, indent=2, sort_keys=True)
+
+
+def load_baseline(path: str) -> dict:
+    with open(path) as baseline_file:
+        return json.load(baseline_file)["results"]
+
+
+def compare(baseline: dict, results: dict, threshold: float = 0.10, out=sys.stdout) -> list:
+    """Print the change for every benchmark in both sets and return the keys that got slower
+    by more than threshold (0.10 means 10%)."""
+    regressions = []
+    for key, current in results.items():
+        previous = baseline.get(key)
+        if previous is None:
+            out.write(f"{key:<28}{current:>14.0f} ns/op  (new)\n")
+            continue
+        change = current / previous - 1
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions.append(key)
+        elif change < -threshold:
+            flag = "  faster"
+        out.write(f"{key:<28}{current:>14.0f} ns/op  {change:+8.1%}{flag}\n")
+    return regressions
+
+
+def main(argv=None):
+    arguments = argparse.ArgumentParser(description="Benchmark the game's hot paths.")
+    commands = arguments.add_subparsers(dest="command", required=True)
+    run_command = commands.add_parser("run", help="run the benchmarks")
+    run_command.add_argument("--save", metavar="PATH", help="write the results as a JSON baseline")
+    compare_command = commands.add_parser("compare", help="run the benchmarks and compare with a baseline")
+    compare_command.add_argument("baseline", help="a JSON baseline written by run --save")
+    compare_command.add_argument("--threshold", type=float, default=0.10,
+                                 help="flag benchmarks slower than the baseline by more than this (default 0.10)")
+    for command in (run_command, compare_command):
+        command.add_argument("--only", nargs="+", metavar="NAME", choices=sorted(BENCHMARKS),
+                             help="run only these benchmarks")
+        command.add_argument("--repeat", type=int, default=5)
+        command.add_argument("--min-time", type=float, default=0.2, help="seconds per repeat (default 0.2)")
+    options = arguments.parse_args(argv)
+
+    if options.command == "run":
+        results = run_benchmarks(options.only, options.repeat, options.min_time)
+        if options.save:
+            save_baseline(options.save, results)
+        return 0
+    baseline = load_baseline(options.baseline)
+    results = run_benchmarks(options.only, options.repeat, options.min_time, out=io.StringIO())
+    regressions = compare(baseline, results, options.threshold)
+    if regressions:
+        print(f"{len(regressions)} regression(s) beyond {options.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
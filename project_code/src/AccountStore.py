@@ -0,0 +1,155 @@
+# AccountStore.py
+import hashlib
+import hmac
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS accounts (
+    username TEXT PRIMARY KEY,
+    salt BLOB NOT NULL,
+    password_hash BLOB NOT NULL,
+    iterations INTEGER NOT NULL,
+    legacy_points INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID
+"""
+
+
+def hash_password(password: str, salt: bytes, iterations: int) -> bytes:
+    return hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, iterations)
+
+
+class AccountStore:
+    """Usernames, salted password hashes and legacy points in a local SQLite database.
+
+    The accounts table is keyed on username with no separate rowid, so every login is a
+    single primary-key B-tree lookup and stays flat as the store grows. Connections are kept
+    in a pool and reused across sessions instead of being opened per login.
+    """
+
+    def __init__(self, path: str = ":memory:", pool_size: int = 4, iterations: int = 100_000):
+        if path == ":memory:":
+            # Every pooled connection has to see the same in-memory database.
+            path = f"file:accounts-{id(self)}?mode=memory&cache=shared"
+        self.path = path
+        self.iterations = iterations
+        self._pool = queue.LifoQueue()
+        self._pool_size = pool_size
+        self._opened = 0
+        # Every connection opened, pooled or borrowed, so close() can close them all.
+        self._connections = []
+        self._lock = threading.Lock()
+        # Keeps a shared in-memory database alive while the pool is empty.
+        self._keeper = self._connect()
+        self._keeper.execute(SCHEMA)
+        self._keeper.commit()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, uri=self.path.startswith("file:"), check_same_thread=False)
+        if "mode=memory" not in self.path:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+        with self._lock:
+            self._connections.append(connection)
+        return connection
+
+    @contextmanager
+    def connection(self):
+        """Borrow a pooled connection, opening a new one only while the pool is below pool_size."""
+        try:
+            connection = self._pool.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                can_open = self._opened < self._pool_size
+                if can_open:
+                    self._opened += 1
+            connection = self._connect() if can_open else self._pool.get()
+        try:
+            yield connection
+        finally:
+            self._pool.put(connection)
+
+    def create_account(self, username: str, password: str, legacy_points: int = 0):
+        """Add an account. Raises ValueError if the username is taken."""
+        salt = os.urandom(16)
+        password_hash = hash_password(password, salt, self.iterations)
+        with self.connection() as connection:
+            try:
+                with connection:
+                    connection.execute(
+                        "INSERT INTO accounts (username, salt, password_hash, iterations, legacy_points) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        (username, salt, password_hash, self.iterations, legacy_points))
+            except sqlite3.IntegrityError:
+                raise ValueError(f"The username {username!r} is already taken.") from None
+
+    def verify(self, username: str, password: str):
+        """Return the account's legacy points if the password matches, otherwise None."""
+        with self.connection() as connection:
+            row = connection.execute(
+                "SELECT salt, password_hash, iterations, legacy_points FROM accounts WHERE username = ?",
+                (username,)).fetchone()
+        if row is None:
+            return None
+        salt, password_hash, iterations, legacy_points = row
+        if not hmac.compare_digest(hash_password(password, salt, iterations), password_hash):
+            return None
+        return legacy_points
+
+    def get_legacy_points(self, username: str):
+        with self.connection() as connection:
+            row = connection.execute("SELECT legacy_points FROM accounts WHERE username = ?", (username,)).fetchone()
+        return row[0] if row else None
+
+    def set_legacy_points(self, username: str, legacy_points: int):
+        with self.connection() as connection, connection:
+            connection.execute("UPDATE accounts SET legacy_points = ? WHERE username = ?", (legacy_points, username))
+
+    def import_accounts(self, accounts, batch_size: int = 10_000, iterations: int = None) -> int:
+        """Bulk-insert accounts from an iterable of (username, password, legacy_points) tuples.
+
+        Rows are inserted in batches, one transaction per batch. Hashing dominates large imports,
+        so a lower iterations count can be passed for synthetic or pre-vetted data; each account
+        remembers its own count, so logins keep working. Returns the number of accounts added.
+        """
+        iterations = iterations or self.iterations
+        added = 0
+        batch = []
+        with self.connection() as connection:
+            for username, password, legacy_points in accounts:
+                salt = os.urandom(16)
+                batch.append((username, salt, hash_password(password, salt, iterations), iterations, legacy_points))
+                if len(batch) >= batch_size:
+                    added += self._insert_batch(connection, batch)
+                    batch = []
+            if batch:
+                added += self._insert_batch(connection, batch)
+        return added
+
+    @staticmethod
+    def _insert_batch(connection, batch) -> int:
+        with connection:
+            before = connection.total_changes
+            connection.executemany(
+                "INSERT OR IGNORE INTO accounts (username, salt, password_hash, iterations, legacy_points) "
+                "VALUES (?, ?, ?, ?, ?)", batch)
+            return connection.total_changes - before
+
+    def __len__(self):
+        with self.connection() as connection:
+            return connection.execute("SELECT COUNT(*) FROM accounts").fetchone()[0]
+
+    def close(self):
+        """Close every connection the store opened, including any still borrowed."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
+        while True:
+            try:
+                self._pool.get_nowait()
+            except queue.Empty:
+                break
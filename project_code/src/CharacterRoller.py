@@ -0,0 +1,115 @@
+# CharacterRoller.py
+from collections import Counter
+
+from project_code.src.main import Sheriff, Outlaw, Bartender, Snake, Bandit, Doctor, Mayor, Deputy, Horse
+from project_code.src.Roster import CharacterRoster, STRIDE
+from project_code.src.Seeds import make_rng, new_seed
+
+ARCHETYPES = (Sheriff, Outlaw, Bartender, Snake, Bandit, Doctor, Mayor, Deputy, Horse)
+
+MIN_VALUE = 0
+MAX_VALUE = 100
+# Every LEGACY_POINTS_PER_BONUS legacy points add 1 to every rolled stat, up to MAX_LEGACY_BONUS.
+LEGACY_POINTS_PER_BONUS = 10
+MAX_LEGACY_BONUS = 10
+
+
+def legacy_bonus(legacy_points: int) -> int:
+    return min(max(legacy_points, 0) // LEGACY_POINTS_PER_BONUS, MAX_LEGACY_BONUS)
+
+
+def _triangular_offsets(spread: int) -> list:
+    """The offset for each of the 256 byte values, so a uniform random byte gives an offset in
+    [-spread, spread] with a triangular distribution: values near the archetype are likelier."""
+    offsets = []
+    for byte in range(256):
+        u = (byte + 0.5) / 256
+        # Inverse CDF of the symmetric triangular distribution on [-1, 1].
+        x = (2 * u) ** 0.5 - 1 if u < 0.5 else 1 - (2 * (1 - u)) ** 0.5
+        offsets.append(round(x * spread))
+    return offsets
+
+
+class ClassDistribution:
+    """How one character class rolls: its default stats, spread either side of them.
+
+    A roll maps each random byte through a 256-entry table per attribute (base value +
+    offset + legacy bonus, already clamped), so bytes.translate does the whole arithmetic.
+    Attributes the class does not have always roll 0.
+    """
+
+    def __init__(self, character_class: type, spread: int = 10):
+        self.character_class = character_class
+        self.spread = spread
+        self.values, self.mask = CharacterRoster._row_values(character_class())
+        self._offsets = _triangular_offsets(spread)
+        self._tables = {}
+
+    def tables(self, bonus: int = 0) -> list:
+        """One translate() table per column, for this legacy bonus."""
+        tables = self._tables.get(bonus)
+        if tables is None:
+            tables = []
+            for column, base in enumerate(self.values):
+                if self.mask & (1 << column):
+                    tables.append(bytes(min(max(base + offset + bonus, MIN_VALUE), MAX_VALUE)
+                                        for offset in self._offsets))
+                else:
+                    tables.append(bytes(256))
+            self._tables[bonus] = tables
+        return tables
+
+
+class CharacterRoller:
+    """Rolls every stat of many characters at once.
+
+    Statistic._generate_starting_value makes one randint call per stat. Here a batch of N
+    characters takes one randbytes call for all N * 11 stats, and one translate per attribute.
+    Results are compact records: STRIDE bytes per character in Roster's ATTRIBUTE_NAMES order,
+    ready for CharacterRoster.add_block.
+    """
+
+    def __init__(self, seed: int = None, legacy_points: int = 0, spread: int = 10):
+        self.seed = seed if seed is not None else new_seed()
+        self.rng = make_rng(self.seed, "roller")
+        self.bonus = legacy_bonus(legacy_points)
+        self.spread = spread
+        self._distributions = {}
+
+    def distribution(self, character_class: type) -> ClassDistribution:
+        distribution = self._distributions.get(character_class)
+        if distribution is None:
+            distribution = self._distributions[character_class] = ClassDistribution(character_class, self.spread)
+        return distribution
+
+    def roll(self, character_class: type, count: int) -> bytes:
+        """count characters of one class, as count * STRIDE bytes."""
+        raw = self.rng.randbytes(count * STRIDE)
+        block = bytearray(len(raw))
+        for column, table in enumerate(self.distribution(character_class).tables(self.bonus)):
+            block[column::STRIDE] = raw[column::STRIDE].translate(table)
+        return bytes(block)
+
+    def roll_into(self, roster: CharacterRoster, character_class: type, count: int) -> range:
+        """Roll count characters straight into a roster. Returns their rows."""
+        return roster.add_block(character_class, self.roll(character_class, count))
+
+    def stream(self, count: int, classes=ARCHETYPES, weights=None, batch_size: int = 4096):
+        """Yield (character_class, block) batches until count characters have been rolled.
+
+        Classes are picked at random (optionally weighted) with one rng.choices call per batch,
+        and each batch is grouped by class, so a whole sweep never holds more than one batch.
+        """
+        while count > 0:
+            size = min(batch_size, count)
+            count -= size
+            picks = self.rng.choices(range(len(classes)), weights, k=size)
+            for index, picked in sorted(Counter(picks).items()):
+                yield classes[index], self.roll(classes[index], picked)
+
+    def roster(self, count: int, classes=ARCHETYPES, weights=None, batch_size: int = 4096) -> CharacterRoster:
+        """Pre-generate a whole roster of count characters."""
+        roster = CharacterRoster()
+        for character_class, block in self.stream(count, classes, weights, batch_size):
+            roster.add_block(character_class, block)
+        return roster
@@ -0,0 +1,95 @@
+# CommandRegistry.py
+
+
+class Command:
+    def __init__(self, name: str, handler, help_text: str = "", aliases=(), args=()):
+        """
+        - handler: called as handler(target, *args), e.g. an unbound Game method.
+        - args: names of the arguments the command takes. A name ending in "?" is optional.
+        """
+        self.name = name
+        self.handler = handler
+        self.help_text = help_text
+        self.aliases = tuple(aliases)
+        self.args = tuple(args)
+        self.min_args = sum(1 for arg in self.args if not arg.endswith("?"))
+        self.max_args = len(self.args)
+
+    @property
+    def usage(self) -> str:
+        return " ".join([self.name] + [f"[{arg[:-1]}]" if arg.endswith("?") else f"<{arg}>" for arg in self.args])
+
+
+class _TrieNode:
+    __slots__ = ("children", "command", "below")
+
+    def __init__(self):
+        self.children = {}
+        # The command whose name or alias ends exactly here, if any.
+        self.command = None
+        # Every command reachable from this node, so a prefix lookup never walks the subtree.
+        self.below = set()
+
+
+class CommandTrie:
+    """Maps names and aliases to commands, and finds every command that starts with a prefix."""
+
+    def __init__(self):
+        self.root = _TrieNode()
+
+    def insert(self, word: str, command: Command):
+        node = self.root
+        node.below.add(command)
+        for letter in word:
+            node = node.children.setdefault(letter, _TrieNode())
+            node.below.add(command)
+        node.command = command
+
+    def find(self, prefix: str):
+        """Return (exact match or None, set of commands starting with prefix)."""
+        node = self.root
+        for letter in prefix:
+            node = node.children.get(letter)
+            if node is None:
+                return None, set()
+        return node.command, node.below
+
+
+class CommandRegistry:
+    """A table of commands, matched by full name, alias or any unambiguous prefix."""
+
+    def __init__(self):
+        self.commands = {}
+        self._trie = CommandTrie()
+
+    def register(self, name: str, handler, help_text: str = "", aliases=(), args=()) -> Command:
+        return self.add(Command(name, handler, help_text, aliases, args))
+
+    def add(self, command: Command) -> Command:
+        self.commands[command.name] = command
+        for word in (command.name,) + command.aliases:
+            self._trie.insert(word, command)
+        return command
+
+    def without(self, *names) -> "CommandRegistry":
+        """A registry sharing these commands, less the named ones, e.g. for remote players."""
+        registry = CommandRegistry()
+        for command in self:
+            if command.name not in names:
+                registry.add(command)
+        return registry
+
+    def resolve(self, word: str):
+        """Return (command, candidates). command is None if word is unknown or ambiguous."""
+        exact, candidates = self._trie.find(word)
+        if exact is not None:
+            return exact, {exact}
+        if len(candidates) == 1:
+            return next(iter(candidates)), candidates
+        return None, candidates
+
+    def __iter__(self):
+        return iter(self.commands.values())
+
+    def __len__(self):
+        return len(self.commands)
@@ -0,0 +1,300 @@
+# EventDeck.py
+import random
+from array import array
+from collections import Counter, deque
+from enum import Enum
+
+# A deck whose draw order is shared keeps its own swaps in a dict, and copies the order into an
+# array of its own once the dict holds more than 1/OVERLAY_SHARE of the deck. Copying is then
+# amortized over at least that many draws.
+OVERLAY_SHARE = 16
+
+
+class ReshufflePolicy(Enum):
+    EXHAUST = "exhaust"      # draw() returns None once every card has been drawn
+    RESHUFFLE = "reshuffle"  # put every card back in a new random order
+    CYCLE = "cycle"          # put every card back in the order they were drawn
+
+
+class EventDeck:
+    """A deck of events with O(1) draws.
+
+    Cards are never removed from the underlying list. A cursor marks how far into the draw
+    order we are, and shuffled decks swap one random remaining card into place per draw
+    (an incremental Fisher-Yates shuffle), so neither drawing nor reshuffling a large deck
+    costs time proportional to its size.
+
+    If weights are given, draws are weighted samples with replacement from an alias table,
+    and the deck never runs out.
+
+    Only the last history_size drawn cards are kept. Per-card draw counts are kept for every
+    card, so their memory is bounded by the size of the deck rather than the number of draws.
+
+    fork() makes a copy that shares the card list, draw order and draw counts with this deck.
+    From then on neither deck changes the shared order or counts: each keeps its own swaps and
+    counts in small overlays on top of them. So a fork's draws cost the same for a deck of a
+    hundred cards as for a million. Adding a card copies the cards and order.
+    """
+
+    def __init__(self, cards=None, weights=None, shuffle: bool = False,
+                 policy: ReshufflePolicy = ReshufflePolicy.RESHUFFLE, history_size: int = 100,
+                 rng: random.Random = None):
+        # Any sequence works here, so a lazily loaded event pack does not have to be materialized.
+        self._cards = cards if cards is not None else []
+        self._weights = None
+        self._alias = None
+        self._order = None
+        self._cursor = 0
+        self._shuffling = shuffle
+        self.policy = policy
+        self.rng = rng or random
+        self.history = deque(maxlen=history_size)
+        self.draws = 0
+        self.reshuffles = 0
+        # This deck's draws of each card, on top of _base_counts once the deck has been forked.
+        self._draw_counts = Counter()
+        self._base_counts = None
+        # Once forked, _order and _frozen_changes are read-only and shared, and the swaps this
+        # deck makes go into _order_changes: position -> card index. None before any fork.
+        self._order_changes = None
+        self._frozen_changes = None
+        # Set by fork(): the cards, or the history, may be shared with another deck.
+        self._shared_cards = False
+        self._shared_state = False
+        if weights is not None:
+            self.set_weights(weights)
+
+    def __len__(self):
+        return len(self._cards)
+
+    @property
+    def cards(self):
+        """Every card in the deck, drawn or not, in the order they were added."""
+        return self._cards
+
+    @property
+    def weighted(self) -> bool:
+        return self._weights is not None
+
+    @property
+    def remaining(self) -> int:
+        """Number of cards left before the deck needs to be reshuffled."""
+        if self.weighted:
+            return len(self._cards)
+        return len(self._cards) - self._cursor
+
+    @property
+    def draw_counts(self) -> Counter:
+        """How many times each card, by index, has been drawn."""
+        if self._base_counts is not None:
+            self._draw_counts = self._base_counts + self._draw_counts
+            self._base_counts = None
+        return self._draw_counts
+
+    def fork(self) -> "EventDeck":
+        """A copy of this deck that draws independently of it, from the same position.
+
+        Forking again after this deck has drawn folds its draws into the shared layers, in time
+        that grows with the cards drawn rather than with the size of the deck.
+        """
+        self._freeze()
+        self._shared_cards = self._shared_state = True
+        fork = type(self).__new__(type(self))
+        fork.__dict__.update(self.__dict__)
+        fork._order_changes = {}
+        fork._draw_counts = Counter()
+        return fork
+
+    def _freeze(self):
+        """Make the order and counts read-only, so they can be shared, moving this deck's own
+        changes into them first."""
+        if self._order_changes is None:
+            self._order_changes = {}
+            self._frozen_changes = {}
+        elif self._order_changes:
+            if (len(self._frozen_changes) + len(self._order_changes)) * OVERLAY_SHARE > len(self._cards):
+                self._own_order()
+                self._order_changes = {}
+                self._frozen_changes = {}
+            else:
+                self._frozen_changes = {**self._frozen_changes, **self._order_changes}
+                self._order_changes = {}
+        if self._draw_counts:
+            self._base_counts = self.draw_counts
+            self._draw_counts = Counter()
+        elif self._base_counts is None:
+            self._base_counts = Counter()
+
+    def _position(self, position: int) -> int:
+        """The card index at a position of the draw order, while the order is shared."""
+        index = self._order_changes.get(position)
+        if index is None:
+            index = self._frozen_changes.get(position)
+            if index is None:
+                index = position if self._order is None else self._order[position]
+        return index
+
+    def _own_order(self):
+        """Give this deck an order array of its own, with its overlays applied."""
+        order = array('I', self._order if self._order is not None else range(len(self._cards)))
+        for changes in (self._frozen_changes, self._order_changes):
+            for position, index in changes.items():
+                order[position] = index
+        self._order = order
+        self._order_changes = self._frozen_changes = None
+
+    def _unshare_state(self):
+        """Copy the history before changing it. It holds at most history_size cards."""
+        self.history = deque(self.history, self.history.maxlen)
+        self._shared_state = False
+
+    def add(self, card, weight: float = 1.0):
+        if self._shared_cards:
+            self._cards = list(self._cards)
+            if self._weights is not None:
+                self._weights = list(self._weights)
+            self._shared_cards = False
+        if self._shared_state:
+            self._unshare_state()
+        if self._order_changes is not None:
+            self._own_order()
+        if not isinstance(self._cards, list):
+            self._cards = list(self._cards)
+        self._cards.append(card)
+        if self._order is not None:
+            self._order.append(len(self._cards) - 1)
+        if self._weights is not None:
+            self._weights.append(weight)
+            self._alias = None
+
+    def extend(self, cards):
+        """Add many cards. An empty, unweighted deck adopts a non-list sequence (such as an
+        EventPack) as is, instead of copying it into a list."""
+        if not self._cards and self._weights is None and not isinstance(cards, list) and hasattr(cards, "__getitem__"):
+            self._cards = cards
+            self._order = None
+            self._order_changes = self._frozen_changes = None
+            self._cursor = 0
+            return
+        for card in cards:
+            self.add(card)
+
+    def set_weights(self, weights):
+        weights = list(weights)
+        if len(weights) != len(self._cards):
+            raise ValueError("weights must have one entry per card")
+        self._weights = weights
+        self._alias = None
+
+    def _build_alias_table(self):
+        """Vose's alias method: one random index and one coin flip per weighted draw."""
+        count = len(self._weights)
+        total = sum(self._weights)
+        if count == 0 or total <= 0:
+            raise ValueError("a weighted deck needs at least one card with a positive weight")
+        scaled = [weight * count / total for weight in self._weights]
+        probability = [1.0] * count
+        alias = list(range(count))
+        small = [index for index, weight in enumerate(scaled) if weight < 1.0]
+        large = [index for index, weight in enumerate(scaled) if weight >= 1.0]
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            probability[less] = scaled[less]
+            alias[less] = more
+            scaled[more] += scaled[less] - 1.0
+            (small if scaled[more] < 1.0 else large).append(more)
+        self._alias = (probability, alias)
+
+    def _next_index(self):
+        if self._weights is not None:
+            if self._alias is None:
+                self._build_alias_table()
+            probability, alias = self._alias
+            index = self.rng.randrange(len(probability))
+            return index if self.rng.random() < probability[index] else alias[index]
+
+        if self._cursor >= len(self._cards):
+            if self.policy == ReshufflePolicy.EXHAUST or not self._cards:
+                return None
+            self.reshuffle()
+
+        cursor = self._cursor
+        self._cursor += 1
+        changes = self._order_changes
+        if changes is not None:
+            if not self._shuffling:
+                return self._position(cursor)
+            swap = self.rng.randrange(cursor, len(self._cards))
+            index = self._position(swap)
+            changes[swap] = self._position(cursor)
+            changes[cursor] = index
+            if len(changes) * OVERLAY_SHARE > len(self._cards):
+                self._own_order()
+            return index
+        if not self._shuffling:
+            return cursor if self._order is None else self._order[cursor]
+
+        order = self._order
+        if order is None:
+            order = self._order = array('I', range(len(self._cards)))
+        swap = self.rng.randrange(cursor, len(order))
+        order[cursor], order[swap] = order[swap], order[cursor]
+        return order[cursor]
+
+    def draw(self):
+        """Draw the next event, or None if the deck is exhausted under the EXHAUST policy."""
+        if self._shared_state:
+            self._unshare_state()
+        index = self._next_index()
+        if index is None:
+            return None
+        card = self._cards[index]
+        self.history.append(card)
+        self._draw_counts[index] += 1
+        self.draws += 1
+        return card
+
+    def reshuffle(self):
+        """Put every card back.
+
+        Under the CYCLE policy the cards come back in the order they were last drawn. Otherwise
+        they come back in a new random order, picked one card at a time as they are drawn.
+        """
+        self._cursor = 0
+        self.reshuffles += 1
+        self._shuffling = self.policy != ReshufflePolicy.CYCLE
+
+    def remaining_cards(self) -> list:
+        """The cards not drawn yet. In a shuffled deck they are not in draw order."""
+        if self.weighted:
+            return list(self._cards)
+        if self._order_changes is not None:
+            return [self._cards[self._position(position)] for position in range(self._cursor, len(self._cards))]
+        if self._order is None:
+            return list(self._cards[self._cursor:])
+        return [self._cards[index] for index in self._order[self._cursor:]]
+
+    def iter_remaining(self):
+        """The cards not drawn yet, one at a time, in the same order as remaining_cards()."""
+        cards = self._cards
+        if self.weighted:
+            yield from cards
+            return
+        for position in range(self._cursor, len(cards)):
+            if self._order_changes is not None:
+                yield cards[self._position(position)]
+            elif self._order is None:
+                yield cards[position]
+            else:
+                yield cards[self._order[position]]
+
+    def summary(self) -> dict:
+        return {
+            "cards": len(self._cards),
+            "remaining": self.remaining,
+            "draws": self.draws,
+            "distinct_drawn": len(self.draw_counts),
+            "reshuffles": self.reshuffles,
+            "most_drawn": [(self._cards[index], count) for index, count in self.draw_counts.most_common(3)],
+        }
@@ -0,0 +1,146 @@
+# EventIndex.py
+from array import array
+from collections import Counter
+
+from project_code.src.main import EventStatus
+from project_code.src.SkillCheck import ATTRIBUTE_CODES, attribute_code
+
+# Every attribute type's bit, for building masks by hand.
+ATTRIBUTE_BITS = {name: 1 << (code - 1) for name, code in ATTRIBUTE_CODES.items()}
+
+
+def attribute_bit(attribute) -> int:
+    """One bit per attribute type (an Attribute, its class or its name); 0 for none."""
+    code = attribute_code(attribute)
+    return 1 << (code - 1) if code else 0
+
+
+def skill_mask(skills) -> int:
+    mask = 0
+    for skill in skills:
+        mask |= attribute_bit(skill)
+    return mask
+
+
+def party_mask(party) -> int:
+    """Every attribute type at least one member of the party can use."""
+    mask = 0
+    for member in party:
+        mask |= skill_mask(member.skills)
+    return mask
+
+
+def outcome(primary_bit: int, secondary_bit: int, mask: int) -> EventStatus:
+    """The best outcome an attribute mask can reach, by the rule of Event.check: one skill
+    must match both attributes to pass, and one of them to partially pass."""
+    if primary_bit and primary_bit == secondary_bit and mask & primary_bit:
+        return EventStatus.PASS
+    if mask & (primary_bit | secondary_bit):
+        return EventStatus.PARTIAL_PASS
+    return EventStatus.FAIL
+
+
+def best_choice(event, party):
+    """(member, skill, status) giving the best outcome for an event; (None, None, FAIL) if
+    no one can do better than fail."""
+    primary_bit = attribute_bit(event.primary or "")
+    secondary_bit = attribute_bit(event.secondary or "")
+    best = (None, None, EventStatus.FAIL)
+    for member in party:
+        for skill in member.skills:
+            status = outcome(primary_bit, secondary_bit, attribute_bit(skill))
+            if status == EventStatus.PASS:
+                return member, skill, status
+            if status == EventStatus.PARTIAL_PASS and best[2] == EventStatus.FAIL:
+                best = (member, skill, status)
+    return best
+
+
+class EventIndex:
+    """An inverted index from attribute requirements to events.
+
+    An event only ever needs its (primary, secondary) pair, and with 11 attribute types there
+    are at most 144 such pairs however many events there are. Events are grouped by pair into
+    arrays of event ids, and each pair is encoded as bitmasks, so asking what a party can pass
+    means testing its attribute mask against each pair: the cost depends on the number of
+    pairs and the size of the answer, never on the number of events skipped.
+    """
+
+    def __init__(self, events=None):
+        # Events (or any sequence, such as an EventPack) to hand back by id. Optional.
+        self.events = events
+        self._groups = {}
+        self._count = 0
+        if events is not None:
+            for event in events:
+                self._add(event.primary, event.secondary)
+
+    @classmethod
+    def from_records(cls, records, events=None) -> "EventIndex":
+        """Index raw event data (e.g. EventPack.record or EventPack.iter_event_records) without building Events."""
+        index = cls()
+        index.events = events
+        for record in records:
+            index._add(record.get("primary_attribute"), record.get("secondary_attribute"))
+        return index
+
+    def __len__(self):
+        return self._count
+
+    def add(self, event) -> int:
+        """Index one more event, appending it to events if that is a list. Returns its id."""
+        if isinstance(self.events, list):
+            self.events.append(event)
+        return self._add(event.primary, event.secondary)
+
+    def _add(self, primary, secondary) -> int:
+        key = (attribute_bit(primary or ""), attribute_bit(secondary or ""))
+        ids = self._groups.get(key)
+        if ids is None:
+            ids = self._groups[key] = array("I")
+        event_id = self._count
+        ids.append(event_id)
+        self._count += 1
+        return event_id
+
+    def _mask(self, party_or_mask) -> int:
+        return party_or_mask if isinstance(party_or_mask, int) else party_mask(party_or_mask)
+
+    def event_ids(self, party_or_mask, status: EventStatus = EventStatus.PASS) -> array:
+        """Ids of the events whose best outcome for the party is status. They come grouped by
+        requirement, in id order within each group; sort them if global order matters."""
+        mask = self._mask(party_or_mask)
+        ids = array("I")
+        for (primary_bit, secondary_bit), group in self._groups.items():
+            if outcome(primary_bit, secondary_bit, mask) == status:
+                ids.extend(group)
+        return ids
+
+    def passable(self, party_or_mask, partial: bool = True) -> array:
+        """Ids of the events the party fully passes, or (partial=True) at least partially passes."""
+        mask = self._mask(party_or_mask)
+        ids = self.event_ids(mask, EventStatus.PASS)
+        if partial:
+            ids.extend(self.event_ids(mask, EventStatus.PARTIAL_PASS))
+        return ids
+
+    def counts(self, party_or_mask) -> Counter:
+        """How many events the party passes, partially passes and fails, without listing them."""
+        mask = self._mask(party_or_mask)
+        counts = Counter({EventStatus.PASS: 0, EventStatus.PARTIAL_PASS: 0, EventStatus.FAIL: 0})
+        for (primary_bit, secondary_bit), group in self._groups.items():
+            counts[outcome(primary_bit, secondary_bit, mask)] += len(group)
+        return counts
+
+    def requiring(self, attribute) -> array:
+        """Ids of the events that name an attribute (instance, class or name) as primary or
+        secondary, grouped by requirement like event_ids."""
+        bit = attribute_bit(attribute)
+        ids = array("I")
+        for (primary_bit, secondary_bit), group in self._groups.items():
+            if bit & (primary_bit | secondary_bit):
+                ids.extend(group)
+        return ids
+
+    def event(self, event_id: int):
+        return self.events[event_id]
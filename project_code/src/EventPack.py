@@ -0,0 +1,192 @@
+# EventPack.py
+import json
+import mmap
+import os
+import re
+import struct
+import tempfile
+from array import array
+
+from project_code.src.main import Event
+
+# The keys Event reads from its data dict, in the order they are stored in a compiled record.
+FIELDS = ("primary_attribute", "secondary_attribute", "prompt_text", "pass", "fail", "partial_pass")
+
+CACHE_SUFFIX = ".evpk"
+MAGIC = b"EVPACK01"
+# magic, source size, source mtime in ns, number of events
+HEADER = struct.Struct("<8sQqQ")
+_SEPARATORS = re.compile(r"[\s,]*")
+
+
+def iter_event_records(path: str, chunk_size: int = 1 << 16):
+    """Yield one event dict at a time from a .jsonl file or a .json file holding a list of events.
+
+    Neither format is read into memory in full. JSON lists are decoded object by object from a
+    sliding buffer, so a pack of any size only needs memory for one chunk and one event.
+    """
+    if path.endswith(".jsonl"):
+        with open(path, encoding="utf-8") as jsonl_file:
+            for line in jsonl_file:
+                line = line.strip()
+                if line:
+                    yield _event_record(path, json.loads(line))
+        return
+
+    decoder = json.JSONDecoder()
+    with open(path, encoding="utf-8") as json_file:
+        buffer = ""
+        # Leading whitespace can fill more than one chunk.
+        while not buffer:
+            chunk = json_file.read(chunk_size)
+            if not chunk:
+                break
+            buffer = chunk.lstrip()
+        if not buffer.startswith("["):
+            raise ValueError(f"{path} must contain a JSON list of events")
+        position = 1
+        at_end = False
+        while True:
+            position = _SEPARATORS.match(buffer, position).end()
+            if buffer.startswith("]", position):
+                return
+            try:
+                record, position = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if at_end:
+                    raise
+                chunk = json_file.read(chunk_size)
+                at_end = not chunk
+                buffer = buffer[position:] + chunk
+                position = 0
+                continue
+            yield _event_record(path, record)
+
+
+def _event_record(path: str, record):
+    if not isinstance(record, dict):
+        raise ValueError(f"{path} has an event that is not a JSON object: {record!r}")
+    return record
+
+
+def _source_stamp(path: str):
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def compile_event_pack(path: str, cache_path: str = None) -> str:
+    """Stream a JSON/JSONL pack into the binary cache format and return the cache path.
+
+    Layout: a header, then count + 1 native-order uint64 offsets, then one compact JSON list
+    of FIELDS per event. Records are spooled to a temporary file while the offsets are
+    collected, so compiling never holds the whole pack in memory.
+    """
+    cache_path = cache_path or path + CACHE_SUFFIX
+    size, mtime_ns = _source_stamp(path)
+    offsets = array("Q", [0])
+    if offsets.itemsize != 8:
+        raise RuntimeError("event pack caches need 64-bit offsets")
+    directory = os.path.dirname(os.path.abspath(cache_path))
+    with tempfile.TemporaryFile(dir=directory) as spool:
+        position = 0
+        for record in iter_event_records(path):
+            encoded = json.dumps([record.get(field) for field in FIELDS], separators=(",", ":")).encode("utf-8")
+            spool.write(encoded)
+            position += len(encoded)
+            offsets.append(position)
+        spool.seek(0)
+
+        handle, temporary_path = tempfile.mkstemp(dir=directory, suffix=CACHE_SUFFIX)
+        try:
+            with os.fdopen(handle, "wb") as cache_file:
+                cache_file.write(HEADER.pack(MAGIC, size, mtime_ns, len(offsets) - 1))
+                offsets.tofile(cache_file)
+                while True:
+                    block = spool.read(1 << 20)
+                    if not block:
+                        break
+                    cache_file.write(block)
+            os.replace(temporary_path, cache_path)
+        except BaseException:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            raise
+    return cache_path
+
+
+class EventPack:
+    """A read-only sequence of Events backed by a memory-mapped compiled pack.
+
+    Opening a pack only maps the file and reads its header, so it takes the same time for a
+    hundred events as for half a million. Events are built one at a time when indexed, which
+    lets an EventDeck draw from a pack without materializing it.
+    """
+
+    def __init__(self, cache_path: str, parser):
+        self.cache_path = cache_path
+        self.parser = parser
+        # Events from the pack have ids like "frontier.json/12", from the source file's name.
+        name = os.path.basename(cache_path)
+        self.name = name[:-len(CACHE_SUFFIX)] if name.endswith(CACHE_SUFFIX) else name
+        self._file = open(cache_path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.source_size, self.source_mtime_ns, self._count = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self._map.close()
+            self._file.close()
+            raise ValueError(f"{cache_path} is not a compiled event pack")
+        offsets_end = HEADER.size + (self._count + 1) * 8
+        self._view = memoryview(self._map)
+        self._offsets = self._view[HEADER.size:offsets_end].cast("Q")
+        self._data_start = offsets_end
+
+    def __len__(self):
+        return self._count
+
+    def record(self, index: int) -> dict:
+        """The raw data dict of one event, as it would be passed to Event."""
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("event pack index out of range")
+        start = self._data_start + self._offsets[index]
+        end = self._data_start + self._offsets[index + 1]
+        return dict(zip(FIELDS, json.loads(self._map[start:end])))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        return Event(self.parser, self.record(index), f"{self.name}/{index}")
+
+    def __iter__(self):
+        for index in range(self._count):
+            yield self[index]
+
+    def close(self):
+        if self._map is not None:
+            self._offsets.release()
+            self._view.release()
+            self._map.close()
+            self._map = None
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def load_event_pack(path: str, parser, cache_path: str = None) -> EventPack:
+    """Open an event pack, compiling it first if there is no cache or the source has changed."""
+    cache_path = cache_path or path + CACHE_SUFFIX
+    if os.path.exists(cache_path):
+        with open(cache_path, "rb") as cache_file:
+            header = cache_file.read(HEADER.size)
+        if len(header) == HEADER.size:
+            magic, size, mtime_ns, _ = HEADER.unpack(header)
+            if magic == MAGIC and (size, mtime_ns) == _source_stamp(path):
+                return EventPack(cache_path, parser)
+    return EventPack(compile_event_pack(path, cache_path), parser)
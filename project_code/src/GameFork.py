@@ -0,0 +1,215 @@
+# GameFork.py
+from collections.abc import Sequence
+import random
+
+from project_code.src.main import Attribute, Character, CommandParser, Event, Game, Location
+from project_code.src.OutputSink import NullSink
+
+
+def copy_rng(rng: random.Random) -> random.Random:
+    """An independent stream that continues from where rng is now."""
+    clone = random.Random.__new__(random.Random)
+    clone.setstate(rng.getstate())
+    return clone
+
+
+def fork_parser(parser):
+    """A parser for a fork: one with a copy of its random stream, so the fork makes the same
+    choices the original would without using up the original's draws. Parsers with a fork()
+    method fork themselves; any other parser is shared."""
+    if hasattr(parser, "fork"):
+        return parser.fork()
+    if isinstance(parser, CommandParser):
+        return CommandParser(copy_rng(parser.rng) if parser.rng is not None else None)
+    return parser
+
+
+def _shallow_copy(obj):
+    clone = object.__new__(type(obj))
+    clone.__dict__.update(obj.__dict__)
+    return clone
+
+
+class ForkedList(Sequence):
+    """A fork's view of one of its base game's lists: the base's items, each one replaced by
+    the fork's copy if it has made one, then anything the fork added. Nothing is copied, so
+    making the view and owning an item cost the same however long the base list is."""
+
+    __slots__ = ("base", "copies", "added")
+
+    def __init__(self, base, copies: dict):
+        self.base = base
+        # ForkedGame._owned: id of an original -> (original, copy).
+        self.copies = copies
+        self.added = []
+
+    def _resolve(self, item):
+        entry = self.copies.get(id(item))
+        return item if entry is None else entry[1]
+
+    def __len__(self):
+        return len(self.base) + len(self.added)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+            if index < 0:
+                raise IndexError("list index out of range")
+        if index < len(self.base):
+            return self._resolve(self.base[index])
+        return self.added[index - len(self.base)]
+
+    def __iter__(self):
+        for item in self.base:
+            yield self._resolve(item)
+        yield from self.added
+
+    def append(self, item):
+        self.added.append(item)
+
+
+class ForkedGame(Game):
+    """A Game that shares every object with the game it was forked from until it changes one.
+
+    Forking copies the game's own fields, its random stream and the party list, and nothing
+    else: locations, their decks and events, and characters are shared. Before the fork changes
+    one of them it calls own(), which makes its private copy (a location's deck is forked
+    copy-on-write in turn) and records it in an overlay of original -> copy. The fork's lists
+    are ForkedList views that look items up through that overlay, so a fork costs time in
+    proportion to what it changes, not to the size of the world, and neither game sees the
+    other's moves.
+
+    Code that changes a fork's state from outside, such as a StatMutator run on its party,
+    must do so through own(): fork.own(character).strength.value = 50.
+
+    Forks are not saved, recorded or indexed: they start without a journal, command log,
+    roster index or stat mutator, and write to a NullSink unless given a sink.
+    """
+
+    def __init__(self, base: Game, parser=None, sink=None, rng: random.Random = None):
+        # Not Game.__init__: the world has already been built, and is shared.
+        self.__dict__.update(base.__dict__)
+        self.base = base
+        # Another stream makes the fork draw differently from the base, e.g. one per rollout.
+        self.rng = rng if rng is not None else copy_rng(base.rng)
+        self.parser = parser if parser is not None else fork_parser(base.parser)
+        self.sink = sink if sink is not None else NullSink()
+        self.party = list(base.party)
+        self.journal = None
+        self.command_log = None
+        self.profiler = None
+        self.roster_index = None
+        self.stat_mutator = None
+        # id of an original or of a copy -> (that object, this fork's copy).
+        self._owned = {}
+        self.locations = ForkedList(base.locations, self._owned)
+        self.events = ForkedList(base.events, self._owned)
+        self._starting_party = ForkedList(base._starting_party, self._owned)
+        if base._characters is not None:
+            self._characters = ForkedList(base._characters, self._owned)
+
+    def own(self, obj):
+        """This fork's private copy of a Location, Character or Event, made on the first call."""
+        entry = self._owned.get(id(obj))
+        if entry is not None:
+            return entry[1]
+        if isinstance(obj, Location):
+            clone = self._own_location(obj)
+        elif isinstance(obj, Character):
+            clone = self._own_character(obj)
+        elif isinstance(obj, Event):
+            clone = _shallow_copy(obj)
+            clone.parser = self.parser
+            if self.current_event is obj:
+                self.current_event = clone
+        else:
+            raise TypeError(f"cannot fork a {type(obj).__name__}")
+        self._owned[id(obj)] = (obj, clone)
+        self._owned[id(clone)] = (clone, clone)
+        return clone
+
+    def _own_location(self, location: Location) -> Location:
+        clone = _shallow_copy(location)
+        # Building the original's deck is invisible to the base game, and lets both share it.
+        clone._deck = location.deck.fork()
+        clone.load_events = None
+        clone.set_rng(self.rng)
+        if self.current_location is location:
+            self.current_location = clone
+        return clone
+
+    def _own_character(self, character: Character) -> Character:
+        clone = _shallow_copy(character)
+        for name, value in character.__dict__.items():
+            if isinstance(value, Attribute):
+                setattr(clone, name, _shallow_copy(value))
+        self.party = [clone if member is character else member for member in self.party]
+        return clone
+
+    def apply_to_party(self, attribute_name: str, delta) -> int:
+        for character in list(self.party):
+            self.own(character)
+        return super().apply_to_party(attribute_name, delta)
+
+    def _check_current_state(self):
+        if not self.current_location:
+            # Picked here rather than by Game, so that it is owned before anything is drawn.
+            self.current_location = self.own(self.rng.choice(self.locations))
+            self._place_party()
+        elif not self.current_event:
+            self.current_location = self.own(self.current_location)
+        super()._check_current_state()
+
+    def _move_to(self, location: Location):
+        super()._move_to(self.own(location))
+
+    def _execute_event(self):
+        self.own(self.current_event)
+        super()._execute_event()
+
+    def discard(self):
+        """Drop this fork's copies and references so their memory can be reclaimed at once."""
+        self._owned.clear()
+        self.locations = []
+        self.events = []
+        self.party = []
+        self._characters = None
+        self.current_location = None
+        self.current_event = None
+        self.continue_playing = False
+
+
+class ForkGroup:
+    """Forks of one game that are thrown away together, such as the branches of one lookahead.
+
+        with ForkGroup(game) as group:
+            scores = [score(group.fork()) for _ in range(100)]
+    """
+
+    def __init__(self, game: Game):
+        self.game = game
+        self.forks = []
+
+    def __len__(self):
+        return len(self.forks)
+
+    def __iter__(self):
+        return iter(self.forks)
+
+    def fork(self, parser=None, sink=None, rng: random.Random = None) -> ForkedGame:
+        fork = ForkedGame(self.game, parser, sink, rng)
+        self.forks.append(fork)
+        return fork
+
+    def discard(self):
+        for fork in self.forks:
+            fork.discard()
+        self.forks.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.discard()
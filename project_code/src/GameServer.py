@@ -0,0 +1,139 @@
+# GameServer.py
+import argparse
+import asyncio
+
+from project_code.src.main import Game, CommandParser
+from project_code.src.Metrics import METRICS, MetricsDumper
+from project_code.src.OutputSink import BufferedSink
+
+PROMPT = "\nWhat would you like to do? "
+# Metrics are shared by every session in the process, so only the server's own console may
+# turn them on, off or reset them.
+SESSION_COMMANDS = Game.commands.without("metrics")
+
+
+class AsyncUserInputParser:
+    """The asyncio counterpart of UserInputParser: prompts and reads over a network stream."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.style = "network"
+        self.reader = reader
+        self.writer = writer
+
+    async def parse(self, prompt) -> str:
+        """Send the prompt and wait for one line. Raises EOFError if the player disconnects."""
+        self.writer.write(prompt.encode("utf-8"))
+        await self.writer.drain()
+        line = await self.reader.readline()
+        if not line:
+            raise EOFError
+        return line.decode("utf-8", errors="replace").rstrip("\r\n")
+
+
+class SessionOutput(BufferedSink):
+    """Per-session output channel. Everything a game says during one step is sent to the
+    player in a single write when the step is flushed."""
+
+    def __init__(self, writer: asyncio.StreamWriter):
+        super().__init__()
+        self.writer = writer
+
+    def flush(self):
+        if self.lines:
+            self.lines.append("")
+            self.writer.write("\n".join(self.lines).encode("utf-8"))
+            self.lines.clear()
+
+    async def drain(self):
+        self.flush()
+        await self.writer.drain()
+
+
+class GameSession:
+    """One player's Game, driven one command at a time from the event loop."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, parser=None):
+        self.input = AsyncUserInputParser(reader, writer)
+        self.output = SessionOutput(writer)
+        self.game = Game(parser or CommandParser(), self.output)
+        self.game.commands = SESSION_COMMANDS
+
+    async def run(self):
+        self.game._show_welcome()
+        while self.game.continue_playing:
+            self.game._check_current_state()
+            await self.output.drain()
+            if not self.game.continue_playing:
+                break
+            try:
+                command = await self.input.parse(PROMPT)
+            except EOFError:
+                break
+            try:
+                self.game.handle_command(command)
+            except SystemExit:
+                self.game.continue_playing = False
+            await self.output.drain()
+
+
+class GameServer:
+    """Hosts many concurrent game sessions on one asyncio event loop."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8150, parser_factory=CommandParser,
+                 backlog: int = 4096):
+        self.host = host
+        self.port = port
+        # A large listen backlog keeps bursts of new players from being dropped and retried.
+        self.backlog = backlog
+        self.parser_factory = parser_factory
+        self.sessions = set()
+        self.server = None
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        session = GameSession(reader, writer, self.parser_factory())
+        self.sessions.add(session)
+        try:
+            await session.run()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.sessions.discard(session)
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def start(self):
+        self.server = await asyncio.start_server(self._handle_connection, self.host, self.port,
+                                                 backlog=self.backlog)
+        # Port 0 asks the OS for a free port; report the one we got.
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self.server
+
+    async def serve_forever(self):
+        if self.server is None:
+            await self.start()
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Serve the Wild West game to many players over TCP.")
+    arg_parser.add_argument("--host", default="127.0.0.1")
+    arg_parser.add_argument("--port", type=int, default=8150)
+    arg_parser.add_argument("--metrics", metavar="PATH",
+                            help="measure the hot paths and dump them here (.json for JSON, else Prometheus text)")
+    arg_parser.add_argument("--metrics-interval", type=float, default=10.0, help="seconds between dumps")
+    args = arg_parser.parse_args()
+    if args.metrics:
+        METRICS.instrument()
+        MetricsDumper(METRICS, args.metrics, args.metrics_interval)
+    game_server = GameServer(args.host, args.port)
+    print(f"Serving on {args.host}:{args.port}")
+    asyncio.run(game_server.serve_forever())
@@ -1,4 +1,6 @@
 # InstanceCreator.py
+from project_code.src.AccountStore import AccountStore
+from project_code.src.OutputSink import CONSOLE, OutputSink
 from project_code.src.User import User
 from project_code.src.UserFactory import UserFactory
 from project_code.src.UserInputParser import UserInputParser
@@ -6,16 +8,21 @@ from project_code.src.UserInputParser import UserInputParser
 
 class InstanceCreator:
 
-    def __init__(self, user_factory: UserFactory, parser: UserInputParser):
+    def __init__(self, user_factory: UserFactory, parser: UserInputParser, account_store: AccountStore = None,
+                 sink: OutputSink = CONSOLE):
         self.user_factory = user_factory
         self.parser = parser
+        self.account_store = account_store
+        self.sink = sink
 
     def _new_user_or_login(self) -> User:
         response = self.parser.parse("Create a new username or login to an existing account?")
         if "login" in response:
             return self._load_user()
-        else:
+        elif self.account_store is None:
             return self.user_factory.create_user(self.parser)
+        else:
+            return self.user_factory.create_user(self.parser, self.account_store)
 
     def get_user_info(self, response: str) -> User | None:
         if "yes" in response:
@@ -23,5 +30,13 @@ class InstanceCreator:
         else:
             return None
 
-    def _load_user(self) -> User:
-        pass
+    def _load_user(self) -> User | None:
+        if self.account_store is None:
+            return None
+        username = self.parser.parse("Enter your username: ")
+        password = self.parser.parse("Enter your password: ")
+        legacy_points = self.account_store.verify(username, password)
+        if legacy_points is None:
+            self.sink.write("Wrong username or password.")
+            return None
+        return User(username, password, legacy_points)
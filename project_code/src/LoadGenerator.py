@@ -0,0 +1,265 @@
+# LoadGenerator.py
+import argparse
+import functools
+import gc
+import os
+import tempfile
+import threading
+import time
+import tracemalloc
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from project_code.src.AccountStore import AccountStore
+from project_code.src.InstanceCreator import InstanceCreator
+from project_code.src.OutputSink import NullSink
+from project_code.src.Seeds import derive_seed, make_rng, new_seed
+from project_code.src.User import User
+from project_code.src.UserFactory import UserFactory
+from project_code.src.UserInputParser import UserInputParser
+
+# The pipeline from "do you want to play?" to a game, outermost first. Each is timed as a stage.
+STAGES = (
+    (InstanceCreator, "get_user_info"),
+    (InstanceCreator, "_new_user_or_login"),
+    (InstanceCreator, "_load_user"),
+    (UserFactory, "create_user"),
+    (User, "__init__"),
+    (User, "_get_retrieve_saved_game_state_or_create_new_game"),
+)
+SESSION = "session"
+
+
+class ScriptedInputParser(UserInputParser):
+    """A UserInputParser that answers each prompt with the next scripted response instead of
+    reading the keyboard. Raises EOFError when the script runs out."""
+
+    def __init__(self, responses):
+        super().__init__()
+        self.style = "scripted"
+        self._responses = iter(responses)
+
+    def parse(self, prompt) -> str:
+        try:
+            return next(self._responses)
+        except StopIteration:
+            raise EOFError(f"no scripted response for {prompt!r}") from None
+
+
+def make_scripts(users: int, accounts: int, login_share: float = 0.5, seed: int = None) -> list:
+    """One response script per synthetic user: a login to one of the accounts made by
+    make_accounts, or a sign-up with a fresh username."""
+    rng = make_rng(seed if seed is not None else new_seed(), "scripts")
+    scripts = []
+    for index in range(users):
+        if accounts and rng.random() < login_share:
+            account = rng.randrange(accounts)
+            scripts.append(["login", f"rider{account}", f"password{account}"])
+        else:
+            scripts.append(["new", f"newcomer{index}", f"password{index}"])
+    return scripts
+
+
+def make_accounts(store: AccountStore, accounts: int, iterations: int = None) -> int:
+    return store.import_accounts(((f"rider{index}", f"password{index}", index % 50) for index in range(accounts)),
+                                 iterations=iterations)
+
+
+def percentile(ordered: list, q: float) -> float:
+    """The q-th quantile (0 to 1) of sorted samples, by the nearest-rank method."""
+    if not ordered:
+        return 0.0
+    return ordered[max(0, min(len(ordered) - 1, int(q * len(ordered) + 0.5) - 1))]
+
+
+class StageTimer:
+    """Times every call of each stage in STAGES while installed, from any thread.
+
+    Like Metrics.instrument it swaps the methods for timing wrappers and puts the originals
+    back afterwards, but it keeps every sample rather than a histogram, so percentiles are exact.
+    """
+
+    def __init__(self):
+        self.samples = defaultdict(list)
+        self._originals = {}
+
+    def _timed(self, name: str, method):
+        samples = self.samples[name]
+        perf_counter = time.perf_counter
+
+        @functools.wraps(method)
+        def timed(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                samples.append(perf_counter() - start)
+        return timed
+
+    def install(self):
+        for owner, attribute in STAGES:
+            method = owner.__dict__[attribute]
+            self._originals[(owner, attribute)] = method
+            if isinstance(method, staticmethod):
+                # Timed as a static method too, so it is still called without the instance.
+                timed = staticmethod(self._timed(f"{owner.__name__}.{attribute}", method.__func__))
+            else:
+                timed = self._timed(f"{owner.__name__}.{attribute}", method)
+            setattr(owner, attribute, timed)
+
+    def uninstall(self):
+        for (owner, attribute), method in self._originals.items():
+            setattr(owner, attribute, method)
+        self._originals.clear()
+
+    def __enter__(self):
+        self.install()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.uninstall()
+
+
+class LoadReport:
+    """Throughput and per-stage latency percentiles of one load run."""
+
+    def __init__(self, users: int, threads: int):
+        self.users = users
+        self.threads = threads
+        self.elapsed = 0.0
+        # Users the pipeline turned away, and sessions that raised, by exception type.
+        self.rejected = 0
+        self.errors = Counter()
+        self.samples = {}
+
+    def throughput(self) -> float:
+        return self.users / self.elapsed if self.elapsed else 0.0
+
+    def latencies(self, name: str) -> tuple:
+        """(calls, p50, p95, p99) of a stage, in seconds."""
+        ordered = sorted(self.samples.get(name, ()))
+        return len(ordered), percentile(ordered, 0.5), percentile(ordered, 0.95), percentile(ordered, 0.99)
+
+    def __str__(self):
+        lines = [f"{self.users} users on {self.threads} thread(s) in {self.elapsed:.2f}s "
+                 f"({self.throughput():.1f} users/s, {self.rejected} turned away, {sum(self.errors.values())} errors)"]
+        for error, count in self.errors.most_common():
+            lines.append(f"    {count} x {error}")
+        lines.append(f"    {'stage':<58}{'calls':>7}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+        for name in [f"{owner.__name__}.{attribute}" for owner, attribute in STAGES] + [SESSION]:
+            calls, p50, p95, p99 = self.latencies(name)
+            if calls:
+                lines.append(f"    {name:<58}{calls:>7}{p50 * 1e3:>10.3f}{p95 * 1e3:>10.3f}{p99 * 1e3:>10.3f}")
+        return "\n".join(lines)
+
+
+def run_session(store: AccountStore, factory: UserFactory, script, samples: list = None):
+    """Take one synthetic user through the real pipeline: asked to play, sign up or log in,
+    and get a game. Returns the User, or None if the pipeline turned them away."""
+    start = time.perf_counter()
+    user = InstanceCreator(factory, ScriptedInputParser(script), store, NullSink()).get_user_info("yes")
+    if user is not None:
+        user.current_game
+    if samples is not None:
+        samples.append(time.perf_counter() - start)
+    return user
+
+
+def run_load(users: int, threads: int = 1, accounts: int = None, login_share: float = 0.5,
+             hash_iterations: int = None, seed: int = None, database: str = None) -> LoadReport:
+    """Run users synthetic sessions, threads at a time, against an AccountStore holding
+    accounts existing accounts (by default as many as users).
+
+    The store is a fresh database file in a temporary directory unless database names one
+    (":memory:" for the in-memory store); usernames already taken there show up as errors.
+    hash_iterations sets the store's password hashing cost. The default is the store's own,
+    which is what real players pay for and usually what limits throughput.
+    """
+    seed = seed if seed is not None else new_seed()
+    accounts = users if accounts is None else accounts
+    with tempfile.TemporaryDirectory(prefix="load-") as directory:
+        path = database if database is not None else os.path.join(directory, "accounts.db")
+        store = AccountStore(path, pool_size=max(4, threads), **({"iterations": hash_iterations} if hash_iterations else {}))
+        try:
+            make_accounts(store, accounts, hash_iterations)
+            return _run_sessions(store, make_scripts(users, accounts, login_share, derive_seed(seed, "load")), threads)
+        finally:
+            store.close()
+
+
+def _run_sessions(store: AccountStore, scripts: list, threads: int) -> LoadReport:
+    factory = UserFactory()
+    report = LoadReport(len(scripts), threads)
+    sessions = []
+    lock = threading.Lock()
+
+    def session(script):
+        try:
+            user = run_session(store, factory, script, sessions)
+        except Exception as error:
+            with lock:
+                report.errors[f"{type(error).__name__}: {error}"] += 1
+            return
+        if user is None:
+            with lock:
+                report.rejected += 1
+
+    with StageTimer() as timer:
+        start = time.perf_counter()
+        if threads == 1:
+            for script in scripts:
+                session(script)
+        else:
+            with ThreadPoolExecutor(threads) as pool:
+                list(pool.map(session, scripts))
+        report.elapsed = time.perf_counter() - start
+    report.samples = dict(timer.samples)
+    report.samples[SESSION] = sessions
+    return report
+
+
+def measure_memory(users: int, hash_iterations: int = 1, seed: int = None) -> float:
+    """Bytes held per live user: the users and their games are kept alive together, and
+    tracemalloc counts what they add. The accounts and the store are set up before tracing.
+
+    tracemalloc slows allocation down, so this is a separate pass from the timed runs.
+    """
+    store = AccountStore(iterations=hash_iterations)
+    try:
+        make_accounts(store, users, hash_iterations)
+        factory = UserFactory()
+        scripts = make_scripts(users, users, 0.5, seed)
+        gc.collect()
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            live = [run_session(store, factory, script) for script in scripts]
+            gc.collect()
+            held = tracemalloc.get_traced_memory()[0] - before
+        finally:
+            tracemalloc.stop()
+        return held / max(1, len(live))
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(
+        description="Drive synthetic users through the login-to-game pipeline and report where it slows down.")
+    arg_parser.add_argument("users", type=int, help="number of synthetic users per run")
+    arg_parser.add_argument("--threads", type=int, nargs="+", default=[1],
+                            help="concurrent users; give several (e.g. 1 2 4 8) to see where throughput stops scaling")
+    arg_parser.add_argument("--accounts", type=int, default=None, help="existing accounts (default: one per user)")
+    arg_parser.add_argument("--login-share", type=float, default=0.5, help="share of users who log in (default 0.5)")
+    arg_parser.add_argument("--hash-iterations", type=int, default=None,
+                            help="password hashing iterations (default: the account store's)")
+    arg_parser.add_argument("--database", default=None,
+                            help="account database to use (default: a fresh temporary file; ':memory:' for in-memory)")
+    arg_parser.add_argument("--seed", type=int, default=None)
+    arg_parser.add_argument("--no-memory", action="store_true", help="skip the memory pass")
+    args = arg_parser.parse_args()
+    for thread_count in args.threads:
+        print(run_load(args.users, thread_count, args.accounts, args.login_share, args.hash_iterations, args.seed,
+                       args.database))
+    if not args.no_memory:
+        print(f"memory per live user: {measure_memory(args.users, seed=args.seed) / 1024:.1f} KiB")
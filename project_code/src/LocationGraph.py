@@ -0,0 +1,233 @@
+# LocationGraph.py
+import heapq
+from array import array
+from collections import OrderedDict
+from functools import partial
+
+from project_code.src.main import Event, WildWestLocation
+from project_code.src.Seeds import make_rng, new_seed
+
+# The map is a grid of locations, generated and cached one square chunk at a time.
+CHUNK_SIZE = 32
+# Every ROAD_SPACING-th row and column is a road: cheap to travel, and never blocked, so the
+# whole map is connected.
+ROAD_SPACING = 8
+ROAD_COST = 1
+# Cost of travelling into a location off the road; 0 means impassable (a mesa or a canyon).
+TERRAIN_COSTS = (1, 2, 3, 5, 0)
+TERRAIN_WEIGHTS = (40, 25, 18, 10, 7)
+
+FIRST_NAMES = ("Dry", "Dead Man's", "Copper", "Red Rock", "Lonesome", "Rattlesnake", "Silver", "Buzzard",
+               "Tumbleweed", "Broken Wheel", "Coyote", "Gold Dust")
+LAST_NAMES = ("Gulch", "Creek", "Junction", "Flats", "Mesa", "Springs", "Canyon", "Ridge", "Crossing",
+              "Hollow", "Bluff", "Wells")
+DESCRIPTIONS = ("A handful of shacks around a dry well.", "A dusty trading post at a crossroads.",
+                "A mining camp loud with pickaxes.", "An empty stretch of scrub and red rock.",
+                "A ranch with a creaking windmill.", "A ghost town, doors banging in the wind.")
+EVENT_TEMPLATES = (
+    {"primary_attribute": "Strength", "secondary_attribute": "Endurance",
+     "prompt_text": "A wagon wheel has broken on the trail. What do you do?",
+     "pass": "You lift the wagon and fix the wheel.", "fail": "The wagon tips into the ditch.",
+     "partial_pass": "You patch the wheel, but it will not last long."},
+    {"primary_attribute": "Dexterity", "secondary_attribute": "Wisdom",
+     "prompt_text": "A rattlesnake blocks the path. What do you do?",
+     "pass": "You step around it without a sound.", "fail": "The snake strikes.",
+     "partial_pass": "You get past, but your horse bolts."},
+    {"primary_attribute": "Charisma", "secondary_attribute": "Intelligence",
+     "prompt_text": "The locals do not trust strangers. What do you do?",
+     "pass": "They offer you a meal and a bed.", "fail": "They run you out of town.",
+     "partial_pass": "They let you stay one night, no more."},
+    {"primary_attribute": "Knowledge", "secondary_attribute": "Willpower",
+     "prompt_text": "A prospector swears there is gold nearby. What do you do?",
+     "pass": "You find the seam he missed.", "fail": "You dig all day and find nothing.",
+     "partial_pass": "You find a few flakes of gold."},
+)
+
+
+class Chunk:
+    """One CHUNK_SIZE x CHUNK_SIZE square of the map: travel costs, plus the Location objects
+    that have been asked for so far."""
+    __slots__ = ("terrain", "locations")
+
+    def __init__(self, terrain: array):
+        self.terrain = terrain
+        self.locations = {}
+
+
+class LocationGraph:
+    """A procedurally generated map of WildWestLocations with travel between neighbours.
+
+    Node n is the location at (n % width, n // width). Travelling to a neighbour (up, down,
+    left, right) costs the terrain cost of the location entered. Each chunk is generated from
+    its own seed stream, so any chunk can be dropped and regenerated identically later; only
+    max_chunks chunks are kept, least recently used first out, so memory stays bounded however
+    large the map is. Locations whose events have been built (those the party has visited)
+    are kept when their chunk is dropped, so their progress is never lost.
+    """
+
+    def __init__(self, width: int = 400, height: int = 400, seed: int = None, max_chunks: int = 256, parser=None):
+        self.width = width
+        self.height = height
+        self.seed = seed if seed is not None else new_seed()
+        self.max_chunks = max_chunks
+        # Events in generated locations are resolved by this parser. Game.attach_map sets it.
+        self.parser = parser
+        self.chunks_across = -(-width // CHUNK_SIZE)
+        self._chunks = OrderedDict()
+        # Visited locations of chunks that were dropped, by node.
+        self._visited = {}
+        self.chunks_loaded = 0
+        self.chunks_unloaded = 0
+
+    def __len__(self):
+        return self.width * self.height
+
+    def node(self, x: int, y: int) -> int:
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise IndexError(f"({x}, {y}) is off the map")
+        return y * self.width + x
+
+    def coordinates(self, node: int) -> tuple:
+        return node % self.width, node // self.width
+
+    def _chunk(self, key: int) -> Chunk:
+        chunk = self._chunks.get(key)
+        if chunk is not None:
+            self._chunks.move_to_end(key)
+            return chunk
+        chunk = self._chunks[key] = Chunk(self._generate_terrain(key))
+        self.chunks_loaded += 1
+        while len(self._chunks) > self.max_chunks:
+            _, dropped = self._chunks.popitem(last=False)
+            for node, location in dropped.locations.items():
+                if location.loaded:
+                    self._visited[node] = location
+            self.chunks_unloaded += 1
+        return chunk
+
+    def _generate_terrain(self, key: int) -> array:
+        chunk_y, chunk_x = divmod(key, self.chunks_across)
+        rng = make_rng(self.seed, "chunk", chunk_x, chunk_y)
+        terrain = array("B", rng.choices(TERRAIN_COSTS, TERRAIN_WEIGHTS, k=CHUNK_SIZE * CHUNK_SIZE))
+        for offset in range(0, CHUNK_SIZE, ROAD_SPACING):
+            terrain[offset * CHUNK_SIZE:(offset + 1) * CHUNK_SIZE] = array("B", [ROAD_COST]) * CHUNK_SIZE
+            terrain[offset::CHUNK_SIZE] = array("B", [ROAD_COST]) * CHUNK_SIZE
+        return terrain
+
+    def _chunk_key(self, x: int, y: int) -> int:
+        return (y // CHUNK_SIZE) * self.chunks_across + x // CHUNK_SIZE
+
+    def cost(self, node: int) -> int:
+        """The cost of travelling into node, or 0 if it cannot be entered."""
+        x, y = self.coordinates(node)
+        return self._chunk(self._chunk_key(x, y)).terrain[(y % CHUNK_SIZE) * CHUNK_SIZE + x % CHUNK_SIZE]
+
+    def neighbours(self, node: int) -> list:
+        """(neighbour, cost) for every location reachable in one step."""
+        x, y = self.coordinates(node)
+        result = []
+        for next_x, next_y in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if 0 <= next_x < self.width and 0 <= next_y < self.height:
+                neighbour = next_y * self.width + next_x
+                step = self.cost(neighbour)
+                if step:
+                    result.append((neighbour, step))
+        return result
+
+    def name(self, node: int) -> str:
+        rng = make_rng(self.seed, "name", node)
+        return f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+
+    def location(self, node: int) -> WildWestLocation:
+        """The Location at node, built on first request and kept while its chunk is loaded, or
+        for good once it has been visited."""
+        location = self._visited.get(node)
+        if location is not None:
+            return location
+        x, y = self.coordinates(node)
+        chunk = self._chunk(self._chunk_key(x, y))
+        location = chunk.locations.get(node)
+        if location is None:
+            rng = make_rng(self.seed, "location", node)
+            location = WildWestLocation(self.name(node), rng.choice(DESCRIPTIONS), load_events=partial(self._events, node))
+            location.node = node
+            chunk.locations[node] = location
+        return location
+
+    def _events(self, node: int) -> list:
+        rng = make_rng(self.seed, "events", node)
+        return [Event(self.parser, data, f"{node}/{index}")
+                for index, data in enumerate(rng.sample(EVENT_TEMPLATES, rng.randint(1, 3)))]
+
+    def _pocket(self, node: int):
+        """The locations walled in with node, if impassable terrain cuts it off from the roads,
+        or None if it can reach a road. Roads connect the whole map, so only a pocket cannot be
+        reached, and a pocket fits between roads: at most 49 locations are checked."""
+        seen = {node}
+        pending = [node]
+        while pending:
+            x, y = self.coordinates(pending.pop())
+            if x % ROAD_SPACING == 0 or y % ROAD_SPACING == 0:
+                return None
+            for neighbour, _ in self.neighbours(y * self.width + x):
+                if neighbour not in seen:
+                    seen.add(neighbour)
+                    pending.append(neighbour)
+        return seen
+
+    def find_path(self, start: int, goal: int, weight: float = 1.2):
+        """A* search for a cheap route. Returns (nodes from start to goal, total cost), or
+        (None, None) if goal cannot be reached, which is found out without a search: either
+        end walled into a pocket the other is not in.
+
+        The heuristic is the Manhattan distance times the cheapest step cost, scaled by weight.
+        With weight 1 it never overestimates and the route is optimal, but a cross-map search
+        can take hundreds of milliseconds. The default 1.2 guarantees a route within 20% of the
+        cheapest (in practice within a fraction of a percent) in a few milliseconds.
+        """
+        width, height = self.width, self.height
+        if not self.cost(goal):
+            return None, None
+        for node, other in ((goal, start), (start, goal)):
+            pocket = self._pocket(node)
+            if pocket is not None and other not in pocket:
+                return None, None
+        goal_x, goal_y = goal % width, goal // width
+        # Terrain arrays of the chunks touched by this search, so the hot loop skips the LRU.
+        terrains = {}
+        chunks_across = self.chunks_across
+        scale = weight * min(ROAD_COST, min(cost for cost in TERRAIN_COSTS if cost))
+        best = {start: 0}
+        came_from = {start: None}
+        start_x, start_y = start % width, start // width
+        frontier = [((abs(start_x - goal_x) + abs(start_y - goal_y)) * scale, 0, start)]
+        while frontier:
+            _, spent, node = heapq.heappop(frontier)
+            if node == goal:
+                path = []
+                while node is not None:
+                    path.append(node)
+                    node = came_from[node]
+                path.reverse()
+                return path, spent
+            if spent > best[node]:
+                continue
+            y, x = divmod(node, width)
+            for next_x, next_y in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+                if not (0 <= next_x < width and 0 <= next_y < height):
+                    continue
+                key = (next_y // CHUNK_SIZE) * chunks_across + next_x // CHUNK_SIZE
+                terrain = terrains.get(key)
+                if terrain is None:
+                    terrain = terrains[key] = self._chunk(key).terrain
+                step = terrain[(next_y % CHUNK_SIZE) * CHUNK_SIZE + next_x % CHUNK_SIZE]
+                if not step:
+                    continue
+                neighbour = next_y * width + next_x
+                total = spent + step
+                if total < best.get(neighbour, total + 1):
+                    best[neighbour] = total
+                    came_from[neighbour] = node
+                    estimate = total + (abs(next_x - goal_x) + abs(next_y - goal_y)) * scale
+                    heapq.heappush(frontier, (estimate, total, neighbour))
+        return None, None
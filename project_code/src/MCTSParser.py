@@ -0,0 +1,271 @@
+# MCTSParser.py
+import math
+import pickle
+import time
+from collections import OrderedDict
+from multiprocessing import Pool
+
+from project_code.src.main import CommandParser, EventStatus, Game
+from project_code.src.GameFork import copy_rng
+from project_code.src.OutcomeOracle import party_key
+from project_code.src.OutputSink import NullSink
+from project_code.src.Seeds import derive_seed, make_rng, new_seed
+
+# An event's worth to the player, as in OutcomeOracle.expected_score.
+REWARDS = {EventStatus.PASS: 1.0, EventStatus.PARTIAL_PASS: 0.5, EventStatus.FAIL: 0.0}
+
+
+class Node:
+    """Search statistics for one game state: visits and total return of each action."""
+    __slots__ = ("visits", "counts", "totals")
+
+    def __init__(self, actions: int):
+        self.visits = 0
+        self.counts = [0] * actions
+        self.totals = [0.0] * actions
+
+    def select(self, exploration: float) -> int:
+        """UCB1: an untried action first, then the best mean return plus an exploration bonus."""
+        counts = self.counts
+        if 0 in counts:
+            return counts.index(0)
+        log_visits = math.log(self.visits)
+        totals = self.totals
+        best, best_index = -1.0, 0
+        for index, count in enumerate(counts):
+            score = totals[index] / count + exploration * math.sqrt(log_visits / count)
+            if score > best:
+                best, best_index = score, index
+        return best_index
+
+    def update(self, index: int, value: float):
+        self.visits += 1
+        self.counts[index] += 1
+        self.totals[index] += value
+
+
+class TranspositionTable:
+    """Nodes by game state, so every path to a state shares its statistics. Least recently used
+    nodes are evicted beyond maxsize, so a long game's searches stay within a fixed memory."""
+
+    def __init__(self, maxsize: int = 100_000):
+        self.maxsize = maxsize
+        self._nodes = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def get(self, key, actions: int) -> Node:
+        node = self._nodes.get(key)
+        if node is not None:
+            self._nodes.move_to_end(key)
+            self.hits += 1
+            return node
+        self.misses += 1
+        node = self._nodes[key] = Node(actions)
+        if len(self._nodes) > self.maxsize:
+            self._nodes.popitem(last=False)
+            self.evictions += 1
+        return node
+
+    def clear(self):
+        self._nodes.clear()
+
+
+def actions(party) -> list:
+    """(skill name, member, skill) for each distinct skill name in the party, sorted by name.
+
+    An event's outcome depends only on the name of the skill used, so members with the same
+    skill are the same move, and searching one of them is enough.
+    """
+    moves = {}
+    for member in party:
+        for skill in member.skills:
+            moves.setdefault(skill.__class__.__name__, (member, skill))
+    return [(name, member, skill) for name, (member, skill) in sorted(moves.items())]
+
+
+def state_key(game, depth: int, key: tuple = None) -> tuple:
+    """What a node stands for: where the party is, the event it faces, its make-up (key, the
+    party_key if already known), and how many moves into the search it is. Drawn events are
+    random, so states with the same key are treated as one (an open-loop search)."""
+    event = game.current_event
+    if key is None:
+        key = party_key(game.party)
+    return game.current_location.name, event.primary, event.secondary, key, depth
+
+
+class MCTSParser(CommandParser):
+    """A parser that plays each event with the move a Monte Carlo tree search rates best.
+
+    To choose a move it forks the game, plays the move, draws the next events and plays them
+    too, up to horizon events ahead: by UCB1 through states it has statistics for, and at
+    random past them. Returns are discounted by discount per event. It repeats this for the
+    budget (iterations, time_limit seconds, or both: whichever runs out first) and picks the
+    move tried most. Statistics are kept in a TranspositionTable across moves.
+
+    With workers > 1 the iterations are split across a process pool and the workers' move
+    counts are added up. Each worker builds its own game from the world once, when the pool
+    starts; a move only sends the location, event and party the search starts from.
+
+    It needs the game it plays, given here or set as parser.game once the game is built.
+    """
+
+    def __init__(self, game=None, iterations: int = None, time_limit: float = None, horizon: int = 5,
+                 discount: float = 0.9, exploration: float = 1.4, table_size: int = 100_000,
+                 workers: int = 1, rng=None):
+        super().__init__(rng)
+        self.game = game
+        self.iterations = iterations if iterations is not None or time_limit is not None else 200
+        self.time_limit = time_limit
+        self.horizon = horizon
+        self.discount = discount
+        self.exploration = exploration
+        self.table = TranspositionTable(table_size)
+        self.workers = workers
+        self.searches = 0
+        self._pool = None
+        self._member = None
+        self._skill = None
+
+    def __getstate__(self):
+        # Events sent to worker processes carry their parser; it goes without its game, pool or table.
+        state = self.__dict__.copy()
+        state["game"] = None
+        state["_pool"] = None
+        state["table"] = TranspositionTable(self.table.maxsize)
+        return state
+
+    def fork(self) -> CommandParser:
+        """The parser for a fork of the game: a random player, as used for rollouts."""
+        return CommandParser(copy_rng(self.rng) if self.rng is not None else None)
+
+    def select_party_member(self, party):
+        if self.game is None or self.game.current_event is None:
+            return super().select_party_member(party)
+        self._member, self._skill = self.best_move()
+        return self._member
+
+    def select_skill(self, character):
+        if character is self._member:
+            skill, self._skill, self._member = self._skill, None, None
+            return skill
+        return super().select_skill(character)
+
+    def best_move(self) -> tuple:
+        """(member, skill) for the game's current event."""
+        moves = actions(self.game.party)
+        if len(moves) == 1:
+            return moves[0][1:]
+        if self.workers > 1:
+            counts = self._parallel_counts()
+        else:
+            counts = self.search(self.game)
+        self.searches += 1
+        best = max(range(len(moves)), key=counts.__getitem__)
+        return moves[best][1:]
+
+    def search(self, game, iterations: int = None) -> list:
+        """Search from the game's current state and return the root's visit count per move."""
+        iterations = iterations if iterations is not None else self.iterations
+        deadline = time.perf_counter() + self.time_limit if self.time_limit is not None else None
+        # Every simulation draws events and random moves from the one search stream, so each
+        # plays out differently.
+        if self.rng is None:
+            self.rng = make_rng(new_seed(), "search")
+        rollout = CommandParser(self.rng)
+        sink = NullSink()
+        # Nothing in a simulation changes the party, so its moves are worked out once.
+        party = game.party
+        moves = actions(party)
+        key = party_key(party)
+        done = 0
+        while iterations is None or done < iterations:
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            self._simulate(game.fork(rollout, sink, self.rng), rollout, party, moves, key)
+            done += 1
+        return list(self.table.get(state_key(game, 0, key), len(moves)).counts)
+
+    def _simulate(self, fork, rollout: CommandParser, party, moves, key):
+        path = []
+        rewards = []
+        expanding = True
+        for depth in range(self.horizon):
+            event = fork.current_event
+            if event is None or not fork.party:
+                break
+            if fork.party != party:
+                party = fork.party
+                moves = actions(party)
+                key = party_key(party)
+            if expanding:
+                node = self.table.get(state_key(fork, depth, key), len(moves))
+                # Past the first state with no statistics, moves are played at random.
+                expanding = node.visits > 0
+                index = node.select(self.exploration)
+                path.append((node, index, depth))
+                _, _, skill = moves[index]
+            else:
+                skill = rollout.select_skill(rollout.select_party_member(fork.party))
+            rewards.append(REWARDS[event.check(skill)])
+            fork.current_event = None
+            fork._check_current_state()
+        # The return from each step on, discounted; backed up into the node that chose it.
+        returns = [0.0] * (len(rewards) + 1)
+        for step in range(len(rewards) - 1, -1, -1):
+            returns[step] = rewards[step] + self.discount * returns[step + 1]
+        for node, index, depth in path:
+            node.update(index, returns[depth])
+
+    def _parallel_counts(self) -> list:
+        game = self.game
+        if self._pool is None:
+            self._pool = Pool(self.workers, _start_worker, (game.world, game.seed))
+        seed = self.rng.getrandbits(63) if self.rng is not None else new_seed()
+        settings = (self.horizon, self.discount, self.exploration, self.table.maxsize)
+        shares = [self.iterations // self.workers + (1 if index < self.iterations % self.workers else 0)
+                  for index in range(self.workers)] if self.iterations is not None else [None] * self.workers
+        # Pickled once for every worker. A simulation never leaves the current location, so
+        # nothing else of the game, and none of its journal or output, is sent.
+        position = pickle.dumps((game.current_location, game.current_event, game.party), pickle.HIGHEST_PROTOCOL)
+        shards = [(position, derive_seed(seed, "worker", index), share, self.time_limit, settings)
+                  for index, share in enumerate(shares)]
+        totals = None
+        for counts in self._pool.imap_unordered(_search_shard, shards):
+            totals = counts if totals is None else [total + count for total, count in zip(totals, counts)]
+        return totals
+
+    def close(self):
+        """Shut down the worker pool, if one was started."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+# The game a worker process searches, built by _start_worker when its pool starts.
+_worker_game = None
+
+
+def _start_worker(world, seed: int):
+    global _worker_game
+    _worker_game = Game(CommandParser(), NullSink(), seed, world)
+
+
+def _search_shard(shard) -> list:
+    position, seed, iterations, time_limit, (horizon, discount, exploration, table_size) = shard
+    game = _worker_game
+    game.current_location, game.current_event, game.party = pickle.loads(position)
+    searcher = MCTSParser(game, iterations, time_limit, horizon, discount, exploration, table_size,
+                          rng=make_rng(seed, "search"))
+    return searcher.search(game)
@@ -0,0 +1,292 @@
+# Metrics.py
+import functools
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+from contextlib import contextmanager
+
+# Upper bounds of the latency buckets, in seconds. The last bucket (+Inf) catches the rest.
+BUCKETS = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 2.5e-3, 5e-3,
+           0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """Counts of observed latencies per bucket, plus their total, like a Prometheus histogram."""
+    __slots__ = ("counts", "total", "count")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, seconds: float):
+        self.counts[bisect_left(BUCKETS, seconds)] += 1
+        self.total += seconds
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th quantile (inf if it is past the last bound)."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, bucket_count in zip(BUCKETS + (float("inf"),), self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+class Metrics:
+    """Counters and latency histograms for the game's hot paths.
+
+    Nothing is measured until instrument() is called: it wraps the hot-path methods in timing
+    wrappers, and uninstrument() puts the original methods back. So with metrics off, the
+    game runs exactly the code it would without this module. Only one Metrics object can
+    instrument the hot paths at a time, so wrappers never wrap each other.
+    """
+    # The Metrics object whose wrappers are installed, if any.
+    _installed = None
+    _install_lock = threading.Lock()
+
+    def __init__(self):
+        self.counters = Counter()
+        self.histograms = {}
+        self._originals = {}
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._originals)
+
+    def inc(self, name: str, amount: int = 1):
+        self.counters[name] += amount
+
+    def observe(self, name: str, seconds: float):
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram()
+        histogram.observe(seconds)
+
+    def reset(self):
+        self.counters.clear()
+        self.histograms.clear()
+
+    def _timed(self, name: str, method, after=None):
+        observe = self.observe
+        perf_counter = time.perf_counter
+
+        @functools.wraps(method)
+        def timed(instance, *args, **kwargs):
+            start = perf_counter()
+            try:
+                return method(instance, *args, **kwargs)
+            finally:
+                observe(name, perf_counter() - start)
+                if after is not None:
+                    after(instance)
+        return timed
+
+    def instrument(self):
+        """Start measuring the methods listed by hot_paths(). Raises RuntimeError if another
+        Metrics object is measuring them."""
+        with Metrics._install_lock:
+            if Metrics._installed is self:
+                return
+            if Metrics._installed is not None:
+                raise RuntimeError("another Metrics object already instruments the hot paths")
+            Metrics._installed = self
+            for owner, attribute, after in hot_paths(self):
+                method = owner.__dict__[attribute]
+                self._originals[(owner, attribute)] = method
+                timed = self._timed(f"{owner.__name__}.{attribute}", method, after)
+                setattr(owner, attribute, timed)
+                # Registered commands hold the method itself, so they are switched over too.
+                for command in getattr(owner, "commands", ()):
+                    if command.handler is method:
+                        command.handler = timed
+
+    def uninstrument(self):
+        """Put the original methods back. Collected data is kept."""
+        with Metrics._install_lock:
+            if Metrics._installed is not self:
+                return
+            Metrics._installed = None
+            for (owner, attribute), method in self._originals.items():
+                timed = owner.__dict__[attribute]
+                setattr(owner, attribute, method)
+                for command in getattr(owner, "commands", ()):
+                    if command.handler is timed:
+                        command.handler = method
+            self._originals.clear()
+
+    def summary(self) -> list:
+        """Human-readable lines for the in-game metrics command."""
+        lines = []
+        for name, histogram in sorted(self.histograms.items()):
+            lines.append(f"{name}: {histogram.count} calls, mean {histogram.mean * 1e6:.1f} us, "
+                         f"p50 <= {histogram.quantile(0.5) * 1e6:g} us, p99 <= {histogram.quantile(0.99) * 1e6:g} us")
+        for name, count in sorted(self.counters.items()):
+            lines.append(f"{name}: {count}")
+        return lines
+
+    def to_json(self) -> str:
+        return json.dumps({
+            "counters": dict(self.counters),
+            "histograms": {name: {"buckets": list(BUCKETS), "counts": histogram.counts,
+                                  "sum": histogram.total, "count": histogram.count}
+                           for name, histogram in self.histograms.items()},
+        }, indent=2, sort_keys=True)
+
+    def to_prometheus(self) -> str:
+        lines = ["# TYPE game_call_seconds histogram"]
+        for name, histogram in sorted(self.histograms.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(BUCKETS + (float("inf"),), histogram.counts):
+                cumulative += bucket_count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'game_call_seconds_bucket{{function="{name}",le="{le}"}} {cumulative}')
+            lines.append(f'game_call_seconds_sum{{function="{name}"}} {histogram.total!r}')
+            lines.append(f'game_call_seconds_count{{function="{name}"}} {histogram.count}')
+        lines.append("# TYPE game_events_total counter")
+        for name, count in sorted(self.counters.items()):
+            lines.append(f'game_events_total{{name="{name}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+
+def hot_paths(metrics: Metrics):
+    """(class, method name, called-after hook or None) for every instrumented method."""
+    # Imported here because main imports this module for the metrics command.
+    from project_code.src.main import Event, Game, Location
+
+    def count_outcome(event):
+        metrics.inc(f"outcome.{event.status.value}")
+
+    def count_draw(location):
+        metrics.inc(f"draws.{location.name}")
+
+    return [
+        (Game, "_get_user_input", None),
+        # Dispatch on its own, since server sessions call it without _get_user_input.
+        (Game, "handle_command", None),
+        (Game, "_execute_event", None),
+        (Event, "resolve_choice", count_outcome),
+        (Location, "get_event", count_draw),
+    ]
+
+
+class MetricsDumper:
+    """Writes a Metrics object to a file every interval seconds, from a daemon thread.
+
+    The file is replaced atomically, so a scraper never reads half a dump.
+    """
+
+    def __init__(self, metrics: Metrics, path: str, interval: float = 10.0, format: str = None):
+        self.metrics = metrics
+        self.path = path
+        self.interval = interval
+        self.format = format or ("json" if path.endswith(".json") else "prometheus")
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="metrics-dumper", daemon=True)
+        self._thread.start()
+
+    def dump(self):
+        text = self.metrics.to_json() if self.format == "json" else self.metrics.to_prometheus()
+        directory = os.path.dirname(os.path.abspath(self.path))
+        descriptor, temp_path = tempfile.mkstemp(dir=directory, prefix=".metrics-")
+        with os.fdopen(descriptor, "w") as temp_file:
+            temp_file.write(text)
+        os.replace(temp_path, self.path)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.dump()
+
+    def close(self):
+        self._stop.set()
+        self._thread.join()
+        self.dump()
+
+
+class SamplingProfiler:
+    """Samples one thread's stack every interval seconds, from a daemon thread.
+
+    Only each frame's code object is read, never its variables, which belong to the sampled
+    thread. A scoped profiler keeps only the samples taken inside scope() blocks, which the
+    profiled code enters itself (Game.handle_command does), so one session can be profiled
+    in a server that runs many sessions on the same thread.
+    """
+
+    def __init__(self, thread_id: int = None, interval: float = 0.005, scoped: bool = False):
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.interval = interval
+        self.scoped = scoped
+        self._depth = 0
+        # Collapsed stacks ("outer;inner;leaf") and how often each was seen.
+        self.stacks = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def start(self):
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    @contextmanager
+    def scope(self):
+        """Mark the profiled code that is running now; see the class docstring."""
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            if self.scoped and not self._depth:
+                continue
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                frame = frame.f_back
+            self.stacks[";".join(reversed(stack))] += 1
+            self.samples += 1
+
+    def top(self, limit: int = 10) -> list:
+        """(function, share of samples) for the functions most often at the top of the stack."""
+        leaves = Counter()
+        for stack, count in self.stacks.items():
+            leaves[stack.rsplit(";", 1)[-1]] += count
+        return [(function, count / self.samples) for function, count in leaves.most_common(limit)]
+
+    def collapsed(self) -> str:
+        """Stacks in the collapsed format read by flame graph tools."""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+# Process-wide metrics, shared by every game.
+METRICS = Metrics()
@@ -0,0 +1,92 @@
+# OutcomeOracle.py
+from fractions import Fraction
+from functools import lru_cache
+
+from project_code.src.main import EventStatus
+
+STATUSES = (EventStatus.PASS, EventStatus.PARTIAL_PASS, EventStatus.FAIL)
+
+
+_keys_by_types = {}
+
+
+def member_key(member) -> tuple:
+    """Sorted skill names of a party member, shared by every member whose skills have the same types."""
+    types = tuple(map(type, member.skills))
+    key = _keys_by_types.get(types)
+    if key is None:
+        key = _keys_by_types[types] = tuple(sorted(skill_type.__name__ for skill_type in types))
+    return key
+
+
+def party_key(party) -> tuple:
+    """What the outcome of an event depends on: the skill names of each party member.
+
+    Order does not matter to a uniform random choice, so members are sorted and parties
+    with the same make-up share a cache entry.
+    """
+    return tuple(sorted(member_key(member) for member in party))
+
+
+def _member_distribution(primary, secondary, skill_names) -> tuple:
+    """(pass, partial, fail) probabilities when a member picks one of its skills uniformly."""
+    if not skill_names:
+        return Fraction(0), Fraction(0), Fraction(1)
+    passes = partials = 0
+    for name in skill_names:
+        if primary == name and secondary == name:
+            passes += 1
+        elif primary == name or secondary == name:
+            partials += 1
+    count = len(skill_names)
+    return Fraction(passes, count), Fraction(partials, count), Fraction(count - passes - partials, count)
+
+
+class OutcomeOracle:
+    """Exact PASS/PARTIAL_PASS/FAIL odds of an event for a party, as CommandParser plays it.
+
+    CommandParser picks a party member uniformly and then one of that member's skills
+    uniformly, and Event.check decides the outcome from the skill's name. So the odds are an
+    average over members of the share of each member's skills that match. Answers are cached
+    in a bounded LRU keyed on the event's attributes and the party's make-up.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        self._distribution = lru_cache(maxsize=maxsize)(self._compute)
+
+    @staticmethod
+    def _compute(primary, secondary, key) -> tuple:
+        if not key:
+            return Fraction(0), Fraction(0), Fraction(1)
+        totals = [Fraction(0)] * 3
+        for skill_names in key:
+            for index, probability in enumerate(_member_distribution(primary, secondary, skill_names)):
+                totals[index] += probability
+        return tuple(total / len(key) for total in totals)
+
+    def distribution(self, event, party) -> dict:
+        """Map each EventStatus to its exact probability."""
+        return dict(zip(STATUSES, self._distribution(event.primary, event.secondary, party_key(party))))
+
+    def member_distributions(self, event, party) -> list:
+        """(member, {status: probability}) for each member, given that member is the one chosen."""
+        result = []
+        for member in party:
+            odds = _member_distribution(event.primary, event.secondary, member_key(member))
+            result.append((member, dict(zip(STATUSES, odds))))
+        return result
+
+    def expected_score(self, event, party) -> Fraction:
+        """PASS counts 1 and PARTIAL_PASS counts 1/2."""
+        odds = self.distribution(event, party)
+        return odds[EventStatus.PASS] + odds[EventStatus.PARTIAL_PASS] / 2
+
+    def cache_info(self):
+        return self._distribution.cache_info()
+
+    def cache_clear(self):
+        self._distribution.cache_clear()
+
+
+# Shared oracle for in-game hints.
+ORACLE = OutcomeOracle()
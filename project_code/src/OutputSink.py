@@ -0,0 +1,75 @@
+# OutputSink.py
+import sys
+
+
+class OutputSink:
+    """Where a game's text goes. write() takes one line, converting it with str() like print does.
+
+    Code that builds expensive text can check enabled first and skip the formatting entirely
+    when nobody will read it.
+    """
+    enabled = True
+
+    def write(self, text=""):
+        raise NotImplementedError
+
+    def flush(self):
+        pass
+
+
+class ConsoleSink(OutputSink):
+    """Writes every line straight away, like print()."""
+
+    def __init__(self, stream=None):
+        # None means whatever sys.stdout is at the time, so redirect_stdout keeps working.
+        self.stream = stream
+
+    def write(self, text=""):
+        (self.stream or sys.stdout).write(f"{text}\n")
+
+
+class BufferedSink(OutputSink):
+    """Collects lines and writes them all with a single write() call on flush()."""
+
+    def __init__(self, stream=None):
+        self.stream = stream
+        self.lines = []
+
+    def write(self, text=""):
+        self.lines.append(str(text))
+
+    def flush(self):
+        if self.lines:
+            self.lines.append("")
+            stream = self.stream or sys.stdout
+            stream.write("\n".join(self.lines))
+            stream.flush()
+            self.lines.clear()
+
+    def getvalue(self) -> str:
+        """The text waiting to be flushed."""
+        return "".join(f"{line}\n" for line in self.lines)
+
+
+class BatchedSink(BufferedSink):
+    """A BufferedSink that also flushes on its own every batch_size lines, for long-running batch jobs."""
+
+    def __init__(self, stream=None, batch_size: int = 1000):
+        super().__init__(stream)
+        self.batch_size = batch_size
+
+    def write(self, text=""):
+        self.lines.append(str(text))
+        if len(self.lines) >= self.batch_size:
+            self.flush()
+
+
+class NullSink(OutputSink):
+    """Throws everything away. Simulations use it to skip text formatting altogether."""
+    enabled = False
+
+    def write(self, text=""):
+        pass
+
+
+CONSOLE = ConsoleSink()
@@ -0,0 +1,115 @@
+# PartyOptimizer.py
+import heapq
+from functools import lru_cache
+
+from project_code.src.OutcomeOracle import member_key
+from project_code.src.SkillCheck import attribute_code
+
+# A character costs one point per POINTS_PER_COST of its total stats, and at least one point.
+POINTS_PER_COST = 100
+
+
+def point_cost(character) -> int:
+    return max(1, round(sum(skill.value for skill in character.skills) / POINTS_PER_COST))
+
+
+class PartyChoice:
+    """One suggested party: its score over the event set, its total cost and its members."""
+    __slots__ = ("score", "cost", "members")
+
+    def __init__(self, score: int, cost: int, members: tuple):
+        self.score = score
+        self.cost = cost
+        self.members = members
+
+    def __repr__(self):
+        return f"PartyChoice(score={self.score}, cost={self.cost}, members={len(self.members)})"
+
+
+class PartyOptimizer:
+    """Picks the best starting parties from a list of candidates under a point budget.
+
+    A party's score is the sum over the events of the best outcome any member can reach,
+    scored like Event.check: 2 for a skill matching both event attributes, 1 for one.
+    Because the check only looks at skill names, candidates with the same skills are
+    interchangeable apart from cost, so they are grouped and only the cheapest few of each
+    group are searched. A branch-and-bound over the groups then finds the top-k parties,
+    cutting every branch whose best possible score cannot beat the k-th party found so far.
+    Results are cached per (budget, k).
+    """
+
+    def __init__(self, candidates, events, cost=point_cost, max_size: int = None, cache_size: int = 128):
+        self.candidates = list(candidates)
+        self.max_size = max_size
+        self._events = [(attribute_code(event.primary or ""), attribute_code(event.secondary or ""))
+                        for event in events]
+        groups = {}
+        for index, candidate in enumerate(self.candidates):
+            groups.setdefault(member_key(candidate), []).append((cost(candidate), index))
+        self._groups = []
+        for key, options in groups.items():
+            vector = self._score_vector(key)
+            if any(vector):
+                options.sort()
+                self._groups.append((vector, options))
+        # Strongest groups first, so good parties are found early and prune the rest.
+        self._groups.sort(key=lambda group: (-sum(group[0]), group[1][0][0]))
+        # _suffix_max[i][e]: the best score for event e that groups i.. can still add.
+        self._suffix_max = [(0,) * len(self._events)]
+        for vector, _ in reversed(self._groups):
+            self._suffix_max.append(tuple(map(max, vector, self._suffix_max[-1])))
+        self._suffix_max.reverse()
+        self._best = lru_cache(maxsize=cache_size)(self._search)
+
+    def _score_vector(self, skill_names) -> tuple:
+        codes = {attribute_code(name) for name in skill_names}
+        return tuple(max(((primary == code) + (secondary == code) for code in codes if code), default=0)
+                     for primary, secondary in self._events)
+
+    def best(self, budget: int, k: int = 5) -> list:
+        """The top k parties costing at most budget, best score first, then cheapest."""
+        return list(self._best(budget, k))
+
+    def cache_info(self):
+        return self._best.cache_info()
+
+    def _search(self, budget: int, k: int) -> tuple:
+        groups = self._groups
+        suffix_max = self._suffix_max
+        max_size = self.max_size if self.max_size is not None else len(groups)
+        # Min-heap of the best k parties so far, as (score, -cost, order, members).
+        found = []
+        order = 0
+
+        def offer(score, spent, chosen):
+            nonlocal order
+            entry = (score, -spent, order, tuple(chosen))
+            order += 1
+            if len(found) < k:
+                heapq.heappush(found, entry)
+            elif entry[:2] > found[0][:2]:
+                heapq.heapreplace(found, entry)
+
+        def visit(group_index, covered, score, spent, chosen):
+            if group_index == len(groups) or len(chosen) == max_size:
+                return
+            bound = sum(map(max, covered, suffix_max[group_index]))
+            # Adding members never lowers the cost, so nothing below can beat the k-th party.
+            if len(found) == k and (bound, -spent) <= found[0][:2]:
+                return
+            vector, options = groups[group_index]
+            merged = tuple(map(max, covered, vector))
+            gained = sum(merged)
+            for option_cost, index in options[:k]:
+                if spent + option_cost > budget:
+                    break
+                chosen.append(index)
+                offer(gained, spent + option_cost, chosen)
+                visit(group_index + 1, merged, gained, spent + option_cost, chosen)
+                chosen.pop()
+            visit(group_index + 1, covered, score, spent, chosen)
+
+        visit(0, (0,) * len(self._events), 0, 0, [])
+        found.sort(reverse=True)
+        return tuple(PartyChoice(score, -negative_cost, tuple(self.candidates[index] for index in members))
+                     for score, negative_cost, _, members in found)
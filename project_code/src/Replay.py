@@ -0,0 +1,124 @@
+# Replay.py
+import struct
+import sys
+from array import array
+
+from project_code.src.main import Game, CommandParser
+from project_code.src.OutputSink import NullSink
+from project_code.src.Seeds import new_seed
+from project_code.src.Simulation import HeadlessGame, SimulationReport
+
+MAGIC = b"RPL1"
+# magic, game seed, number of choices, max turns (-1 for none), number of command bytes
+HEADER = struct.Struct("<4sQIiI")
+
+
+class ReplayLog:
+    """Everything needed to re-run a game exactly: its seed and the choices made in it.
+
+    The game's own random draws (locations, deck shuffles) come back from the seed. Party
+    member and skill choices are stored as indices, two bytes each, so a replay does not
+    depend on how they were made: randomly, by a player, or by an autoplayer.
+    """
+
+    def __init__(self, seed: int = None, choices=None, commands=None, max_turns: int = None):
+        self.seed = seed if seed is not None else new_seed()
+        self.choices = choices if choices is not None else array("H")
+        self.commands = commands if commands is not None else []
+        self.max_turns = max_turns
+
+    def to_bytes(self) -> bytes:
+        choices = array("H", self.choices)
+        if sys.byteorder != "little":
+            choices.byteswap()
+        commands = "\n".join(self.commands).encode("utf-8")
+        max_turns = -1 if self.max_turns is None else self.max_turns
+        return HEADER.pack(MAGIC, self.seed, len(choices), max_turns, len(commands)) + choices.tobytes() + commands
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "ReplayLog":
+        magic, seed, choice_count, max_turns, command_length = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("not a replay log")
+        choices = array("H")
+        choices.frombytes(data[HEADER.size:HEADER.size + choice_count * 2])
+        if sys.byteorder != "little":
+            choices.byteswap()
+        commands_start = HEADER.size + choice_count * 2
+        commands = data[commands_start:commands_start + command_length].decode("utf-8")
+        return cls(seed, choices, commands.split("\n") if commands else [], None if max_turns < 0 else max_turns)
+
+    def save(self, path: str):
+        with open(path, "wb") as replay_file:
+            replay_file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str) -> "ReplayLog":
+        with open(path, "rb") as replay_file:
+            return cls.from_bytes(replay_file.read())
+
+
+class RecordingParser(CommandParser):
+    """Makes the same random choices as CommandParser and writes them to a ReplayLog."""
+
+    def __init__(self, log: ReplayLog, parser=None):
+        super().__init__()
+        self.log = log
+        # Another parser to make the decisions, e.g. a human or an autoplayer. Default: random.
+        self.parser = parser
+
+    def select_party_member(self, party):
+        chosen_one = self.parser.select_party_member(party) if self.parser else super().select_party_member(party)
+        self.log.choices.append(party.index(chosen_one))
+        return chosen_one
+
+    def select_skill(self, character):
+        chosen_skill = self.parser.select_skill(character) if self.parser else super().select_skill(character)
+        self.log.choices.append(character.skills.index(chosen_skill))
+        return chosen_skill
+
+
+class ReplayParser(CommandParser):
+    """Plays back the choices of a ReplayLog."""
+
+    def __init__(self, log: ReplayLog):
+        super().__init__()
+        self._choices = iter(log.choices)
+
+    def select_party_member(self, party):
+        return party[next(self._choices)]
+
+    def select_skill(self, character):
+        return character.skills[next(self._choices)]
+
+
+def record_game(seed: int = None, sink=None, parser=None):
+    """Create a Game that records its commands and choices. Returns (game, log)."""
+    log = ReplayLog(seed)
+    game = Game(RecordingParser(log, parser), sink, log.seed)
+    game.command_log = log.commands
+    return game, log
+
+
+def record_headless_game(seed: int = None, max_turns: int = None):
+    """Play one headless game and return (report, log)."""
+    log = ReplayLog(seed, max_turns=max_turns)
+    report = SimulationReport()
+    HeadlessGame(RecordingParser(log), NullSink(), log.seed).play(report, max_turns)
+    return report, log
+
+
+def replay(log: ReplayLog, sink=None):
+    """Re-run a recorded game with no I/O (unless a sink is given).
+
+    Games recorded from commands are fed back through the dispatcher and the Game is
+    returned. Headless games are played again and their SimulationReport is returned.
+    """
+    parser = ReplayParser(log)
+    if log.commands:
+        game = Game(parser, sink or NullSink(), log.seed)
+        game.run_script(log.commands)
+        return game
+    report = SimulationReport()
+    HeadlessGame(parser, sink or NullSink(), log.seed).play(report, log.max_turns)
+    return report
@@ -0,0 +1,232 @@
+# Roster.py
+from array import array
+
+from project_code.src.main import Character, Attribute
+from project_code.src.SkillCheck import ATTRIBUTE_TYPES
+
+# Every row of a roster has one byte per attribute type, in this fixed order.
+ATTRIBUTE_NAMES = tuple(attribute_type.__name__.lower() for attribute_type in ATTRIBUTE_TYPES)
+STRIDE = len(ATTRIBUTE_TYPES)
+COLUMNS = {name: column for column, name in enumerate(ATTRIBUTE_NAMES)}
+
+
+def _view_init(self, roster, cell):
+    self._roster = roster
+    self._cell = cell
+
+
+def _view_get_value(self):
+    return self._roster.stats[self._cell]
+
+
+def _view_set_value(self, value):
+    self._roster.stats[self._cell] = value
+
+
+# One view type per attribute type. Each is an Attribute subclass with the same class name that
+# reads and writes a roster cell, so code checking chosen_skill.__class__.__name__ or isinstance
+# treats a view exactly like the attribute it stands for.
+_VIEW_TYPES = tuple(type(attribute_type.__name__, (attribute_type,), {
+    "__init__": _view_init,
+    "value": property(_view_get_value, _view_set_value),
+}) for attribute_type in ATTRIBUTE_TYPES)
+
+
+class CompactCharacter:
+    """A lightweight handle on one row of a CharacterRoster.
+
+    Handles are created on demand and hold no stats of their own, so character.strength.value
+    reads straight from the roster's shared array.
+    """
+    __slots__ = ("roster", "row")
+
+    def __init__(self, roster: "CharacterRoster", row: int):
+        self.roster = roster
+        self.row = row
+
+    @property
+    def name(self) -> str:
+        return self.roster.name(self.row)
+
+    @property
+    def character_class(self) -> type:
+        return self.roster.kinds[self.roster.kind_codes[self.row]]
+
+    @property
+    def skills(self):
+        """Views of every attribute this character has, in ATTRIBUTE_NAMES order."""
+        roster = self.roster
+        mask = roster.present[self.row]
+        base = self.row * STRIDE
+        return tuple(view_type(roster, base + column) for column, view_type in enumerate(_VIEW_TYPES)
+                     if mask & (1 << column))
+
+    def to_character(self) -> Character:
+        return self.roster.to_character(self.row)
+
+    def __eq__(self, other):
+        return isinstance(other, CompactCharacter) and other.roster is self.roster and other.row == self.row
+
+    def __hash__(self):
+        return hash((id(self.roster), self.row))
+
+    def __repr__(self):
+        return f"CompactCharacter({self.character_class.__name__}, {self.name!r}, row={self.row})"
+
+
+def _make_attribute_property(column: int):
+    view_type = _VIEW_TYPES[column]
+    name = ATTRIBUTE_NAMES[column]
+
+    def get_attribute(self):
+        roster = self.roster
+        if not roster.present[self.row] & (1 << column):
+            raise AttributeError(f"{self.character_class.__name__} has no attribute '{name}'")
+        return view_type(roster, self.row * STRIDE + column)
+
+    def set_attribute(self, attribute):
+        self.roster.set_value(self.row, column, attribute.value)
+
+    return property(get_attribute, set_attribute)
+
+
+for _column, _name in enumerate(ATTRIBUTE_NAMES):
+    setattr(CompactCharacter, _name, _make_attribute_property(_column))
+
+
+class CharacterRoster:
+    """Struct-of-arrays storage for a large number of characters.
+
+    Each character costs one byte per attribute, a presence bitmask, a class code and an
+    optional name, instead of a Character plus 10-11 Attribute objects with their own dicts.
+    Values are stored as unsigned bytes, so they must stay within 0-255.
+    """
+
+    def __init__(self):
+        self.stats = array('B')
+        self.present = array('H')
+        self.kind_codes = array('B')
+        self.kinds = []
+        self._kind_lookup = {}
+        self._prototypes = {}
+        # Only characters with a custom name take up space here.
+        self._names = {}
+        self._default_names = {}
+
+    def __len__(self):
+        return len(self.kind_codes)
+
+    def __getitem__(self, row: int) -> CompactCharacter:
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError("roster index out of range")
+        return CompactCharacter(self, row)
+
+    def __iter__(self):
+        for row in range(len(self)):
+            yield CompactCharacter(self, row)
+
+    def _kind_code(self, character_class: type) -> int:
+        code = self._kind_lookup.get(character_class)
+        if code is None:
+            code = self._kind_lookup[character_class] = len(self.kinds)
+            self.kinds.append(character_class)
+        return code
+
+    def _append_row(self, character_class: type, values, mask: int, name: str = None) -> CompactCharacter:
+        row = len(self)
+        self.stats.extend(values)
+        self.present.append(mask)
+        self.kind_codes.append(self._kind_code(character_class))
+        if name is not None:
+            self._names[row] = name
+        return CompactCharacter(self, row)
+
+    @staticmethod
+    def _row_values(character: Character):
+        values = [0] * STRIDE
+        mask = 0
+        for attribute_name, column in COLUMNS.items():
+            attribute = character.__dict__.get(attribute_name)
+            if isinstance(attribute, Attribute):
+                values[column] = attribute.value
+                mask |= 1 << column
+        return values, mask
+
+    def add(self, character: Character) -> CompactCharacter:
+        """Copy an existing Character into the roster."""
+        values, mask = self._row_values(character)
+        return self._append_row(type(character), values, mask, character.name)
+
+    def add_kind(self, character_class: type, name: str = None) -> CompactCharacter:
+        """Add a character with the default stats of a Character subclass such as Sheriff."""
+        prototype = self._prototypes.get(character_class)
+        if prototype is None:
+            prototype = self._prototypes[character_class] = self._row_values(character_class())
+        values, mask = prototype
+        return self._append_row(character_class, values, mask, name)
+
+    def add_values(self, character_class: type, values, name: str = None) -> CompactCharacter:
+        """Add a character from raw stat values in ATTRIBUTE_NAMES order, e.g. rolled stats.
+
+        The character class decides which attributes the character actually has. Raises
+        ValueError, leaving the roster unchanged, unless there are STRIDE values from 0 to 255.
+        """
+        try:
+            values = bytes(values)
+        except ValueError:
+            raise ValueError("stat values must be between 0 and 255") from None
+        if len(values) != STRIDE:
+            raise ValueError(f"expected {STRIDE} stat values, got {len(values)}")
+        prototype = self._prototypes.get(character_class)
+        if prototype is None:
+            prototype = self._prototypes[character_class] = self._row_values(character_class())
+        return self._append_row(character_class, values, prototype[1], name)
+
+    def add_block(self, character_class: type, block: bytes) -> range:
+        """Add many characters of one class from STRIDE bytes each, e.g. from CharacterRoller.
+
+        Returns the rows that were added.
+        """
+        count, remainder = divmod(len(block), STRIDE)
+        if remainder:
+            raise ValueError(f"block length must be a multiple of {STRIDE}")
+        prototype = self._prototypes.get(character_class)
+        if prototype is None:
+            prototype = self._prototypes[character_class] = self._row_values(character_class())
+        start = len(self)
+        self.stats.frombytes(block)
+        self.present.extend([prototype[1]] * count)
+        self.kind_codes.extend([self._kind_code(character_class)] * count)
+        return range(start, start + count)
+
+    def name(self, row: int) -> str:
+        name = self._names.get(row)
+        if name is None:
+            character_class = self.kinds[self.kind_codes[row]]
+            name = self._default_names.get(character_class)
+            if name is None:
+                name = self._default_names[character_class] = character_class().name
+        return name
+
+    def value(self, row: int, column: int) -> int:
+        return self.stats[row * STRIDE + column]
+
+    def set_value(self, row: int, column: int, value: int):
+        self.stats[row * STRIDE + column] = value
+        self.present[row] |= 1 << column
+
+    def to_character(self, row: int) -> Character:
+        """Build a regular Character with its own Attribute objects from a roster row."""
+        character = self.kinds[self.kind_codes[row]](self._names.get(row))
+        mask = self.present[row]
+        base = row * STRIDE
+        for column, attribute_type in enumerate(ATTRIBUTE_TYPES):
+            if mask & (1 << column):
+                setattr(character, ATTRIBUTE_NAMES[column], attribute_type(self.stats[base + column]))
+        return character
+
+    def nbytes(self) -> int:
+        """Approximate memory used by the stat arrays."""
+        return sum(len(column) * column.itemsize for column in (self.stats, self.present, self.kind_codes))
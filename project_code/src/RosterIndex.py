@@ -0,0 +1,180 @@
+# RosterIndex.py
+from bisect import bisect_left, insort
+
+from project_code.src.Roster import ATTRIBUTE_NAMES
+
+# Sorted attribute entries pack (value, slot) into one int, which compares much faster than a tuple.
+SLOT_BITS = 32
+
+
+def _class_of(character) -> type:
+    """A Character's class, or the class a CompactCharacter handle stands for."""
+    return getattr(character, "character_class", None) or type(character)
+
+
+class RosterIndex:
+    """Indexes characters by location, by class and by attribute value.
+
+    "Who is at X", "where is Y" and "every Z" are dict lookups. Each attribute also keeps a
+    sorted list of value/slot entries, so "strength >= 80" is two binary searches and a slice
+    instead of a scan. The index is kept up to date as it is told about changes: move() when a
+    character travels, set_value() or refresh() when stats change.
+    """
+
+    def __init__(self, attribute_names=ATTRIBUTE_NAMES):
+        self.attribute_names = tuple(attribute_names)
+        # Every indexed character has a small integer slot; freed slots are reused. Slots are
+        # found by the character itself, so equal CompactCharacter handles find the same slot.
+        self._slot_of = {}
+        self._characters = []
+        self._free_slots = []
+        self._location_of = {}
+        self._at = {}
+        self._by_class = {}
+        # Per attribute: sorted (value << SLOT_BITS | slot) entries, and each slot's indexed value.
+        self._sorted = {name: [] for name in self.attribute_names}
+        self._values = {name: {} for name in self.attribute_names}
+
+    def __len__(self):
+        return len(self._slot_of)
+
+    def __contains__(self, character):
+        return character in self._slot_of
+
+    def _new_slot(self, character) -> int:
+        if character in self._slot_of:
+            raise ValueError(f"{character!r} is already indexed")
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            self._characters[slot] = character
+        else:
+            slot = len(self._characters)
+            self._characters.append(character)
+        self._slot_of[character] = slot
+        self._by_class.setdefault(_class_of(character), {})[slot] = character
+        self._location_of[slot] = None
+        return slot
+
+    def add(self, character, location=None):
+        slot = self._new_slot(character)
+        for name in self.attribute_names:
+            attribute = getattr(character, name, None)
+            if attribute is not None:
+                self._values[name][slot] = attribute.value
+                insort(self._sorted[name], attribute.value << SLOT_BITS | slot)
+        if location is not None:
+            self.move(character, location)
+
+    def add_many(self, characters, location=None):
+        """Add many characters at once, sorting each attribute once instead of inserting one by one."""
+        added = []
+        for character in characters:
+            added.append((self._new_slot(character), character))
+            if location is not None:
+                self.move(character, location)
+        for name in self.attribute_names:
+            values = self._values[name]
+            entries = self._sorted[name]
+            for slot, character in added:
+                attribute = getattr(character, name, None)
+                if attribute is not None:
+                    values[slot] = attribute.value
+                    entries.append(attribute.value << SLOT_BITS | slot)
+            entries.sort()
+
+    def remove(self, character):
+        self.move(character, None)
+        slot = self._slot_of.pop(character)
+        del self._location_of[slot]
+        character_class = _class_of(character)
+        members = self._by_class[character_class]
+        del members[slot]
+        if not members:
+            del self._by_class[character_class]
+        for name in self.attribute_names:
+            value = self._values[name].pop(slot, None)
+            if value is not None:
+                self._remove_sorted(name, value, slot)
+        self._characters[slot] = None
+        self._free_slots.append(slot)
+
+    def move(self, character, location):
+        """Put a character at a location (None for nowhere)."""
+        slot = self._slot_of[character]
+        previous = self._location_of[slot]
+        if previous is location:
+            return
+        if previous is not None:
+            here = self._at[previous]
+            del here[slot]
+            if not here:
+                del self._at[previous]
+        if location is not None:
+            self._at.setdefault(location, {})[slot] = character
+        self._location_of[slot] = location
+
+    def where(self, character):
+        """The location of a character, or None."""
+        slot = self._slot_of.get(character)
+        return self._location_of[slot] if slot is not None else None
+
+    def at(self, location) -> list:
+        """Every character at a location, in the order they arrived."""
+        return list(self._at.get(location, {}).values())
+
+    def count_at(self, location) -> int:
+        return len(self._at.get(location, ()))
+
+    def of_class(self, character_class: type) -> list:
+        return list(self._by_class.get(character_class, {}).values())
+
+    def set_value(self, character, name: str, value: int):
+        """Change one of a character's attributes and its place in the index."""
+        getattr(character, name).value = value
+        self._reindex(character, name)
+
+    def refresh(self, characters=None):
+        """Re-read attribute values after they were changed directly, e.g. by a StatMutator.
+        Only the characters given are looked at (all of them if None)."""
+        if characters is None:
+            characters = [character for character in self._characters if character is not None]
+        for character in characters:
+            for name in self.attribute_names:
+                self._reindex(character, name)
+
+    def _reindex(self, character, name: str):
+        slot = self._slot_of[character]
+        attribute = getattr(character, name, None)
+        new = attribute.value if attribute is not None else None
+        values = self._values[name]
+        old = values.get(slot)
+        if new == old:
+            return
+        if old is not None:
+            self._remove_sorted(name, old, slot)
+            del values[slot]
+        if new is not None:
+            values[slot] = new
+            insort(self._sorted[name], new << SLOT_BITS | slot)
+
+    def _remove_sorted(self, name: str, value: int, slot: int):
+        entries = self._sorted[name]
+        del entries[bisect_left(entries, value << SLOT_BITS | slot)]
+
+    def _bounds(self, name: str, low: int, high: int) -> tuple:
+        entries = self._sorted[name]
+        start = 0 if low is None else bisect_left(entries, low << SLOT_BITS)
+        stop = len(entries) if high is None else bisect_left(entries, (high + 1) << SLOT_BITS)
+        return entries, start, max(stop, start)
+
+    def range(self, name: str, low: int = None, high: int = None) -> list:
+        """Characters whose attribute is between low and high (both inclusive), lowest first.
+        Leave either end out for an open range, e.g. range("strength", 80)."""
+        entries, start, stop = self._bounds(name, low, high)
+        mask = (1 << SLOT_BITS) - 1
+        characters = self._characters
+        return [characters[entry & mask] for entry in entries[start:stop]]
+
+    def count_range(self, name: str, low: int = None, high: int = None) -> int:
+        _, start, stop = self._bounds(name, low, high)
+        return stop - start
@@ -0,0 +1,214 @@
+# SaveGame.py
+import json
+import os
+import queue
+import threading
+
+from project_code.src import main
+from project_code.src.main import Attribute, EventStatus
+
+SNAPSHOT_FILE = "snapshot.json"
+JOURNAL_FILE = "journal.jsonl"
+
+
+def event_key(event):
+    """How a saved game refers to an event: by its id, which stays the same from run to run."""
+    return event.key if event is not None else None
+
+
+def character_state(character) -> dict:
+    return {
+        "class": type(character).__name__,
+        "name": character.name,
+        "attributes": {name: value.value for name, value in character.__dict__.items() if isinstance(value, Attribute)},
+    }
+
+
+def capture_state(game) -> dict:
+    """Everything a saved game needs from a Game, as plain JSON-friendly data."""
+    statuses = {}
+    for location in getattr(game, "locations", []):
+        for event in _known_events(location):
+            if event.status != EventStatus.UNKNOWN:
+                statuses[event_key(event)] = event.status.value
+    return {
+        "seq": 0,
+        "party": [character_state(character) for character in game.party],
+        "current_location": game.current_location.name if game.current_location else None,
+        "current_event": event_key(game.current_event),
+        "event_statuses": statuses,
+    }
+
+
+def apply_entry(state: dict, entry: dict) -> dict:
+    """Fold one journal entry into a state dict. Used both for compaction and for resuming."""
+    op = entry["op"]
+    if op == "party":
+        state["party"] = entry["party"]
+    elif op == "location":
+        state["current_location"] = entry["name"]
+    elif op == "event":
+        state["current_event"] = entry["key"]
+    elif op == "status":
+        state["event_statuses"][entry["key"]] = entry["status"]
+    state["seq"] = entry["seq"]
+    return state
+
+
+def _known_events(location):
+    """Events of a location that are held in memory. Unvisited locations and lazily loaded
+    packs are not scanned."""
+    if not getattr(location, "loaded", True):
+        return []
+    deck = getattr(location, "deck", None)
+    if deck is None:
+        return getattr(location, "events", [])
+    return deck.cards if isinstance(deck.cards, list) else []
+
+
+def restore_game(game, state: dict):
+    """Put a Game back into a saved state."""
+    character_classes = {name: value for name, value in vars(main).items()
+                         if isinstance(value, type) and issubclass(value, main.Character)}
+    attribute_classes = {name.lower(): value for name, value in vars(main).items()
+                         if isinstance(value, type) and issubclass(value, Attribute)}
+    party = []
+    for saved in state["party"]:
+        character = character_classes.get(saved["class"], main.Character)(saved["name"])
+        for name, value in saved["attributes"].items():
+            setattr(character, name, attribute_classes.get(name, Attribute)(value))
+        party.append(character)
+    game.party = party
+
+    locations = {location.name: location for location in getattr(game, "locations", [])}
+    game.current_location = locations.get(state["current_location"])
+    game.current_event = None
+    statuses = state["event_statuses"]
+    # Event ids start with their location's name. Statuses saved by prompt text cannot be
+    # placed, so then every location is built.
+    named = {key.partition("/")[0] for key in statuses}
+    build_all = not named <= locations.keys()
+    for location in locations.values():
+        if build_all or location.name in named or location is game.current_location:
+            # Build the events this save refers to; other locations stay unbuilt.
+            getattr(location, "deck", None)
+        for event in _known_events(location):
+            key = event_key(event)
+            if key in statuses:
+                event.set_status(EventStatus(statuses[key]))
+            if key == state["current_event"] and location is game.current_location:
+                game.current_event = event
+    return game
+
+
+def load_state(directory: str):
+    """Read the last snapshot and replay only the journal entries written after it."""
+    snapshot_path = os.path.join(directory, SNAPSHOT_FILE)
+    journal_path = os.path.join(directory, JOURNAL_FILE)
+    if not os.path.exists(snapshot_path) and not os.path.exists(journal_path):
+        return None
+    state = {"seq": 0, "party": [], "current_location": None, "current_event": None, "event_statuses": {}}
+    if os.path.exists(snapshot_path):
+        with open(snapshot_path, encoding="utf-8") as snapshot_file:
+            state = json.load(snapshot_file)
+    if os.path.exists(journal_path):
+        with open(journal_path, encoding="utf-8") as journal_file:
+            for line in journal_file:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash can leave half a line at the end; everything before it is good.
+                    break
+                if entry["seq"] > state["seq"]:
+                    apply_entry(state, entry)
+    return state
+
+
+class GameJournal:
+    """Append-only save file for one game, written by a background thread.
+
+    record() only puts the change on a queue, so the game loop never waits for the disk.
+    The writer appends each entry to journal.jsonl and also folds it into an in-memory copy
+    of the state. Every compact_every entries, or when compact() is called, it writes that
+    state to snapshot.json and starts a new, empty journal. Every entry carries a sequence
+    number, so resuming after a crash between those two steps replays nothing twice.
+    If the writer fails, it stops, and close() raises its error.
+    """
+
+    _STOP = object()
+    _COMPACT = object()
+
+    def __init__(self, directory: str, initial_state: dict = None, compact_every: int = 1000):
+        self.directory = directory
+        self.compact_every = compact_every
+        os.makedirs(directory, exist_ok=True)
+        self._state = initial_state or load_state(directory) or {
+            "seq": 0, "party": [], "current_location": None, "current_event": None, "event_statuses": {}}
+        self._seq = self._state["seq"]
+        self._since_snapshot = 0
+        self._queue = queue.SimpleQueue()
+        self._error = None
+        self._journal_file = open(os.path.join(directory, JOURNAL_FILE), "a", encoding="utf-8")
+        self._writer = threading.Thread(target=self._write_loop, name=f"journal-{directory}", daemon=True)
+        self._writer.start()
+
+    def record(self, op: str, **data):
+        """Queue one state change. Never blocks."""
+        self._seq += 1
+        data["op"] = op
+        data["seq"] = self._seq
+        self._queue.put(data)
+
+    def record_party(self, party):
+        self.record("party", party=[character_state(character) for character in party])
+
+    def compact(self):
+        """Ask the writer to fold the journal into a new snapshot. Never blocks."""
+        self._queue.put(self._COMPACT)
+
+    def close(self):
+        """Write everything still queued, compact, and stop the writer thread. Raises the
+        error the writer stopped on, if it failed."""
+        self._queue.put(self._COMPACT)
+        self._queue.put(self._STOP)
+        self._writer.join()
+        self._journal_file.close()
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _write_loop(self):
+        try:
+            self._write_entries()
+        except Exception as error:
+            # Nothing on this thread can report it; close() raises it on the caller's thread.
+            self._error = error
+
+    def _write_entries(self):
+        while True:
+            item = self._queue.get()
+            if item is self._STOP:
+                return
+            if item is self._COMPACT:
+                self._write_snapshot()
+                continue
+            self._journal_file.write(json.dumps(item, separators=(",", ":")) + "\n")
+            apply_entry(self._state, item)
+            self._since_snapshot += 1
+            if self._since_snapshot >= self.compact_every:
+                self._write_snapshot()
+            elif self._queue.empty():
+                self._journal_file.flush()
+
+    def _write_snapshot(self):
+        self._journal_file.flush()
+        snapshot_path = os.path.join(self.directory, SNAPSHOT_FILE)
+        temporary_path = snapshot_path + ".tmp"
+        with open(temporary_path, "w", encoding="utf-8") as snapshot_file:
+            json.dump(self._state, snapshot_file)
+            snapshot_file.flush()
+            os.fsync(snapshot_file.fileno())
+        os.replace(temporary_path, snapshot_path)
+        self._journal_file.close()
+        self._journal_file = open(os.path.join(self.directory, JOURNAL_FILE), "w", encoding="utf-8")
+        self._since_snapshot = 0
@@ -0,0 +1,22 @@
+# Seeds.py
+import hashlib
+import random
+
+
+def new_seed() -> int:
+    """A fresh 63-bit seed, for games that were not given one."""
+    return random.SystemRandom().getrandbits(63)
+
+
+def derive_seed(seed: int, *path) -> int:
+    """Seed of an independent sub-stream, e.g. derive_seed(seed, "worker", 3).
+
+    The same seed and path always give the same result, and different paths give unrelated
+    streams, so workers and game components never share or overlap random draws.
+    """
+    key = repr((seed,) + path).encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little") >> 1
+
+
+def make_rng(seed: int, *path) -> random.Random:
+    return random.Random(derive_seed(seed, *path))
@@ -0,0 +1,161 @@
+# Simulation.py
+import argparse
+import os
+import time
+from collections import Counter
+from multiprocessing import Pool
+
+from project_code.src.main import Game, CommandParser, EventStatus
+from project_code.src.OutputSink import NullSink
+from project_code.src.Seeds import derive_seed, new_seed
+
+
+class SimulationReport:
+    """PASS/PARTIAL_PASS/FAIL counts for every event seen across a batch of games."""
+
+    def __init__(self):
+        self.games = 0
+        self.turns = 0
+        self.elapsed = 0.0
+        self.outcomes = {}
+
+    def record(self, event_key: str, status: EventStatus):
+        counts = self.outcomes.get(event_key)
+        if counts is None:
+            counts = self.outcomes[event_key] = Counter()
+        counts[status.value] += 1
+
+    def merge(self, other: "SimulationReport"):
+        """Fold the counts of another report (usually from a worker) into this one."""
+        self.games += other.games
+        self.turns += other.turns
+        for event_key, counts in other.outcomes.items():
+            mine = self.outcomes.get(event_key)
+            if mine is None:
+                self.outcomes[event_key] = Counter(counts)
+            else:
+                mine.update(counts)
+
+    def totals(self) -> Counter:
+        total = Counter()
+        for counts in self.outcomes.values():
+            total.update(counts)
+        return total
+
+    def games_per_second(self) -> float:
+        return self.games / self.elapsed if self.elapsed else 0.0
+
+    def __str__(self):
+        statuses = (EventStatus.PASS, EventStatus.PARTIAL_PASS, EventStatus.FAIL)
+        lines = [f"{self.games} games, {self.turns} turns in {self.elapsed:.2f}s "
+                 f"({self.games_per_second():.0f} games/s)"]
+        for event_key, counts in sorted(self.outcomes.items()):
+            seen = sum(counts.values())
+            lines.append(f"{event_key}")
+            for status in statuses:
+                share = counts[status.value] / seen if seen else 0.0
+                lines.append(f"    {status.value:<13}{counts[status.value]:>10} ({share:.1%})")
+        return "\n".join(lines)
+
+
+class HeadlessGame(Game):
+    """A Game that plays itself with automated choices and never touches the terminal."""
+
+    def play(self, report: SimulationReport, max_turns: int = None):
+        """Play one full game, recording each event outcome in the report.
+
+        A game lasts until every location has run out of events, or until max_turns if given.
+        """
+        turns = 0
+        sink = NullSink()
+        while self.party and (max_turns is None or turns < max_turns):
+            open_locations = [location for location in self.locations if location.deck.remaining]
+            if not open_locations:
+                break
+            self.current_location = self.rng.choice(open_locations)
+            event = self.current_event = self.current_location.get_event()
+
+            # The same resolution as a played event, with nothing written.
+            event.execute(self.party, sink)
+            report.record(event.key, event.status)
+
+            self.current_event = None
+            turns += 1
+        self.continue_playing = False
+        report.games += 1
+        report.turns += turns
+        return report
+
+
+def run_games(games: int, seed: int = None, max_turns: int = None, mcts_iterations: int = None) -> SimulationReport:
+    """Play a number of headless games in this process.
+
+    Game i is seeded with derive_seed(seed, i), so any single game of a batch can be replayed.
+    Choices are random, or with mcts_iterations, made by an MCTSParser searching that many
+    iterations per event, to see how the events play against a strong player.
+    """
+    if seed is None:
+        seed = new_seed()
+    report = SimulationReport()
+    sink = NullSink()
+    start = time.perf_counter()
+    for game_index in range(games):
+        if mcts_iterations is None:
+            HeadlessGame(CommandParser(), sink, derive_seed(seed, game_index)).play(report, max_turns)
+            continue
+        # Imported here so random-play workers never load the search.
+        from project_code.src.MCTSParser import MCTSParser
+        parser = MCTSParser(iterations=mcts_iterations)
+        parser.game = HeadlessGame(parser, sink, derive_seed(seed, game_index))
+        parser.game.play(report, max_turns)
+    report.elapsed = time.perf_counter() - start
+    return report
+
+
+def _run_shard(shard):
+    return run_games(*shard)
+
+
+def _split(games: int, shards: int):
+    base, extra = divmod(games, shards)
+    return [base + (1 if i < extra else 0) for i in range(shards)]
+
+
+def run_simulation(games: int, workers: int = None, seed: int = None, max_turns: int = None,
+                   shards_per_worker: int = 4, mcts_iterations: int = None) -> SimulationReport:
+    """Shard games across a process pool and merge the worker reports into one.
+
+    Workers only send back their aggregated counts, so the cost of merging does not grow
+    with the number of games and throughput scales with the number of cores.
+    """
+    workers = workers or os.cpu_count() or 1
+    if seed is None:
+        seed = new_seed()
+    shard_count = max(1, min(games, workers * shards_per_worker))
+    # Each shard gets an independent sub-stream, so results do not depend on which worker ran it.
+    shards = [(size, derive_seed(seed, "shard", index), max_turns, mcts_iterations)
+              for index, size in enumerate(_split(games, shard_count)) if size]
+
+    report = SimulationReport()
+    start = time.perf_counter()
+    if workers == 1:
+        for shard in shards:
+            report.merge(_run_shard(shard))
+    else:
+        with Pool(workers) as pool:
+            for shard_report in pool.imap_unordered(_run_shard, shards):
+                report.merge(shard_report)
+    report.elapsed = time.perf_counter() - start
+    return report
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Play headless games and report event outcomes.")
+    arg_parser.add_argument("games", type=int, help="number of games to play")
+    arg_parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    arg_parser.add_argument("--seed", type=int, default=None)
+    arg_parser.add_argument("--max-turns", type=int, default=None)
+    arg_parser.add_argument("--mcts", type=int, default=None, metavar="ITERATIONS",
+                            help="play with an MCTS player searching this many iterations per event")
+    args = arg_parser.parse_args()
+    print(run_simulation(args.games, args.workers, args.seed, args.max_turns, mcts_iterations=args.mcts))
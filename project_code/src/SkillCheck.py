@@ -0,0 +1,122 @@
+# SkillCheck.py
+import random
+from array import array
+
+from project_code.src.main import (EventStatus, Strength, Dexterity, Constitution, Vitality, Endurance,
+                                   Intelligence, Wisdom, Knowledge, Willpower, Spirit, Charisma)
+
+# Attribute types get small integer codes so choices can be stored in flat byte arrays.
+# Code 0 is reserved for "no attribute", so an event with a missing primary or secondary never matches.
+ATTRIBUTE_TYPES = (Strength, Dexterity, Constitution, Vitality, Endurance,
+                   Intelligence, Wisdom, Knowledge, Willpower, Spirit, Charisma)
+ATTRIBUTE_CODES = {attribute_type.__name__: code for code, attribute_type in enumerate(ATTRIBUTE_TYPES, start=1)}
+
+# Outcome codes line up with the number of event attributes a skill matches.
+FAIL = 0
+PARTIAL_PASS = 1
+PASS = 2
+OUTCOME_STATUSES = (EventStatus.FAIL, EventStatus.PARTIAL_PASS, EventStatus.PASS)
+
+
+def attribute_code(attribute) -> int:
+    """Code for an Attribute instance, an Attribute class or an attribute name."""
+    if isinstance(attribute, str):
+        return ATTRIBUTE_CODES.get(attribute, 0)
+    if isinstance(attribute, type):
+        return ATTRIBUTE_CODES.get(attribute.__name__, 0)
+    return ATTRIBUTE_CODES.get(attribute.__class__.__name__, 0)
+
+
+def encode_skills(skills):
+    """Turn a sequence of Attribute objects into parallel (codes, values) arrays."""
+    codes = array('B', [attribute_code(skill) for skill in skills])
+    values = array('i', [skill.value for skill in skills])
+    return codes, values
+
+
+def encode_party(party):
+    """Flatten the skills of a party into (codes, values, offsets) arrays. Member i's skills are
+    codes[offsets[i]:offsets[i + 1]], in the order of member.skills."""
+    codes = array('B')
+    values = array('i')
+    offsets = array('I', [0])
+    for member in party:
+        member_codes, member_values = encode_skills(member.skills)
+        codes.extend(member_codes)
+        values.extend(member_values)
+        offsets.append(len(codes))
+    return codes, values, offsets
+
+
+def to_statuses(outcomes):
+    """Map outcome codes back to EventStatus members, for reporting."""
+    return [OUTCOME_STATUSES[outcome] for outcome in outcomes]
+
+
+class BatchResolver:
+    """Resolves many skill checks at once against a fixed list of events.
+
+    Events are compiled once into arrays of attribute codes. A batch of choices is then given
+    as parallel arrays of event indices and attribute codes (and values for numeric checks), or
+    as (event, character, skill) triples against a party compiled by encode_party, and every
+    outcome is computed in a single pass. Inputs and outcomes are flat typed arrays, and each
+    outcome is written straight into the result array without an intermediate list; Python
+    still handles each choice as small ints, so this is a tight loop, not a vectorized one.
+    """
+
+    def __init__(self, events, thresholds=None):
+        self.primary = array('B', [attribute_code(event.primary or "") for event in events])
+        self.secondary = array('B', [attribute_code(event.secondary or "") for event in events])
+        if thresholds is None:
+            thresholds = [0] * len(self.primary)
+        self.thresholds = array('i', thresholds)
+        if len(self.thresholds) != len(self.primary):
+            raise ValueError("thresholds must have one entry per event")
+
+    def __len__(self):
+        return len(self.primary)
+
+    def resolve(self, event_ids, skill_codes) -> array:
+        """Same rule as Event.resolve_choice: match both attributes to pass, one to partially pass."""
+        primary = self.primary
+        secondary = self.secondary
+        return array('B', ((primary[event] == code) + (secondary[event] == code)
+                           for event, code in zip(event_ids, skill_codes)))
+
+    def resolve_party(self, party_table, event_ids, character_ids, skill_indices) -> array:
+        """Resolve (event, character, skill) triples: character i of the party encoded as
+        party_table by encode_party uses its skill_indices[i]-th skill, as in member.skills."""
+        codes, _, offsets = party_table
+        return self.resolve(event_ids, (codes[offsets[character] + skill]
+                                        for character, skill in zip(character_ids, skill_indices)))
+
+    def resolve_numeric(self, event_ids, skill_codes, skill_values, rolls=None,
+                        rng: random.Random = None, roll_sides: int = 20) -> array:
+        """Resolve choices with a real skill check on top of the attribute match.
+
+        Each choice rolls 1..roll_sides and adds the attribute value. If the total is below the
+        event's threshold, the outcome drops one level (PASS to PARTIAL_PASS, PARTIAL_PASS to FAIL).
+        Pre-rolled dice can be passed in as rolls to make a batch repeatable.
+        """
+        if rolls is None:
+            rng = rng or random
+            rolls = rng.choices(range(1, roll_sides + 1), k=len(event_ids))
+        primary = self.primary
+        secondary = self.secondary
+        thresholds = self.thresholds
+        return array('B', (max((primary[event] == code) + (secondary[event] == code)
+                               - (value + roll < thresholds[event]), FAIL)
+                           for event, code, value, roll in zip(event_ids, skill_codes, skill_values, rolls)))
+
+    def resolve_party_numeric(self, party_table, event_ids, character_ids, skill_indices, rolls=None,
+                              rng: random.Random = None, roll_sides: int = 20) -> array:
+        """resolve_numeric for (event, character, skill) triples against an encode_party table."""
+        codes, values, offsets = party_table
+        cells = array('I', (offsets[character] + skill for character, skill in zip(character_ids, skill_indices)))
+        return self.resolve_numeric(event_ids, (codes[cell] for cell in cells), (values[cell] for cell in cells),
+                                    rolls, rng, roll_sides)
+
+    @staticmethod
+    def counts(outcomes) -> dict:
+        """Number of choices per EventStatus in an outcome array."""
+        return {OUTCOME_STATUSES[outcome]: outcomes.count(outcome) for outcome in (FAIL, PARTIAL_PASS, PASS)}
@@ -0,0 +1,243 @@
+# StatMutation.py
+import operator
+import struct
+import sys
+from array import array
+
+# Bounds used for stats that do not define min_value/max_value, such as main.Attribute.
+DEFAULT_MIN = 0
+DEFAULT_MAX = 100
+
+MAGIC = b"STJ1"
+# magic, number of changes, next batch id
+HEADER = struct.Struct("<4sII")
+
+_DEFAULT_BOUNDS = (DEFAULT_MIN, DEFAULT_MAX)
+# Types whose instances carry their own min_value/max_value, as every Statistic does.
+_bounded_types = {}
+
+
+def _bounds(stat) -> tuple:
+    bounded = _bounded_types.get(type(stat))
+    if bounded is None:
+        bounded = _bounded_types[type(stat)] = hasattr(stat, "min_value") and hasattr(stat, "max_value")
+    return (stat.min_value, stat.max_value) if bounded else _DEFAULT_BOUNDS
+
+
+def _whole(delta) -> int:
+    """A delta as an int. Stats are whole numbers, so fractional deltas are refused."""
+    try:
+        return operator.index(delta)
+    except TypeError:
+        raise TypeError(f"stat deltas must be whole numbers, not {delta!r}") from None
+
+
+class StatJournal:
+    """A compact record of stat changes, grouped into batches, for undo and saving.
+
+    Each change is one row of five parallel integer arrays: batch id, target, key, old value
+    and new value. A target is a stat object (key -1) or an array such as a CharacterRoster's
+    stats (key is the cell), and is stored once no matter how many changes it has.
+    """
+
+    def __init__(self):
+        self.batches = array("I")
+        self.targets = array("I")
+        self.keys = array("q")
+        self.old_values = array("i")
+        self.new_values = array("i")
+        self._target_list = []
+        self._target_index = {}
+        self._next_batch = 0
+
+    def __len__(self):
+        return len(self.batches)
+
+    def begin_batch(self) -> int:
+        batch = self._next_batch
+        self._next_batch += 1
+        return batch
+
+    def target(self, container) -> int:
+        """Index of a target: a stat object, or an array whose cells are changed."""
+        index = self._target_index.get(id(container))
+        if index is None:
+            index = self._target_index[id(container)] = len(self._target_list)
+            self._target_list.append(container)
+        return index
+
+    def record(self, batch: int, target: int, old_value: int, new_value: int, key: int = -1):
+        self.batches.append(batch)
+        self.targets.append(target)
+        self.keys.append(key)
+        self.old_values.append(old_value)
+        self.new_values.append(new_value)
+
+    def record_stats(self, batch: int, changes):
+        """Record many (stat object, old value, new value) changes at once. Values that do not
+        fit a column raise before anything is recorded."""
+        old_values = array(self.old_values.typecode, [old for _, old, _ in changes])
+        new_values = array(self.new_values.typecode, [new for _, _, new in changes])
+        index = self._target_index
+        for stat, _, _ in changes:
+            if id(stat) not in index:
+                self.target(stat)
+        self._extend(batch, [index[id(stat)] for stat, _, _ in changes], [-1] * len(changes), old_values, new_values)
+
+    def record_cells(self, batch: int, target: int, cells, old_values, new_values):
+        """Record many changes to cells of one array target at once."""
+        self._extend(batch, [target] * len(cells), cells, old_values, new_values)
+
+    def _extend(self, batch: int, targets, keys, old_values, new_values):
+        # Every row is converted before any column grows, so a bad value leaves the columns as they were.
+        rows = [array(column.typecode, values) for column, values in
+                zip(self._columns(), ([batch] * len(targets), targets, keys, old_values, new_values))]
+        for column, values in zip(self._columns(), rows):
+            column.extend(values)
+
+    def undo(self) -> int:
+        """Revert the most recent batch and drop it from the journal. Returns its id, or None."""
+        if not self.batches:
+            return None
+        batch = self.batches[-1]
+        start = len(self.batches)
+        while start > 0 and self.batches[start - 1] == batch:
+            start -= 1
+        for row in range(len(self.batches) - 1, start - 1, -1):
+            container = self._target_list[self.targets[row]]
+            key = self.keys[row]
+            if key < 0:
+                container.value = self.old_values[row]
+            else:
+                container[key] = self.old_values[row]
+        for column in self._columns():
+            del column[start:]
+        return batch
+
+    def to_bytes(self) -> bytes:
+        """The change columns in little-endian order. Targets are live objects and are not included."""
+        columns = [array(column.typecode, column) for column in self._columns()]
+        if sys.byteorder != "little":
+            for column in columns:
+                column.byteswap()
+        return HEADER.pack(MAGIC, len(self), self._next_batch) + b"".join(column.tobytes() for column in columns)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, targets) -> "StatJournal":
+        """Load a journal saved by to_bytes. targets is the target list, in the order the
+        original journal first saw them (see target_list)."""
+        magic, count, next_batch = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("not a stat journal")
+        journal = cls()
+        offset = HEADER.size
+        for column in journal._columns():
+            size = count * column.itemsize
+            column.frombytes(data[offset:offset + size])
+            offset += size
+            if sys.byteorder != "little":
+                column.byteswap()
+        for container in targets:
+            journal.target(container)
+        journal._next_batch = next_batch
+        return journal
+
+    @property
+    def target_list(self) -> list:
+        """Targets in index order."""
+        return list(self._target_list)
+
+    def _columns(self):
+        return self.batches, self.targets, self.keys, self.old_values, self.new_values
+
+    def changes(self):
+        """Yield (batch, target, key, old value, new value) for every recorded change."""
+        for row in range(len(self.batches)):
+            yield (self.batches[row], self._target_list[self.targets[row]], self.keys[row],
+                   self.old_values[row], self.new_values[row])
+
+
+class StatMutator:
+    """Applies one change to many stats at once, clamping each to its bounds.
+
+    Party-wide effects (damage, buffs, fatigue, aging) become one call instead of a Python
+    loop over characters calling Statistic.increase/decrease. Every changed value is written
+    to the journal under one batch id, so the whole effect can be undone in one step.
+    """
+
+    def __init__(self, journal: StatJournal = None):
+        self.journal = journal if journal is not None else StatJournal()
+
+    def apply(self, stats, deltas) -> int:
+        """Add deltas (one whole number, or one per stat) to a sequence of Statistic/Attribute objects.
+
+        Either every stat changes and the batch is journalled, or, if anything fails, nothing
+        changes. Returns the journal batch id.
+        """
+        stats = list(stats)
+        if isinstance(deltas, (int, float)):
+            deltas = [deltas] * len(stats)
+        elif len(deltas) != len(stats):
+            raise ValueError("deltas must be a number or have one entry per stat")
+        deltas = [_whole(delta) for delta in deltas]
+        old_values = [stat.value for stat in stats]
+        new_values = [min(max(old + delta, low), high)
+                      for old, delta, (low, high) in zip(old_values, deltas, map(_bounds, stats))]
+        changed = [(stat, old, new) for stat, old, new in zip(stats, old_values, new_values) if new != old]
+        batch = self.journal.begin_batch()
+        self.journal.record_stats(batch, changed)
+        try:
+            for stat, _, new in changed:
+                stat.value = new
+        except BaseException:
+            # Put back the stats already changed, and drop the batch.
+            self.journal.undo()
+            raise
+        return batch
+
+    def apply_to_party(self, party, attribute_name: str, delta) -> int:
+        """Add delta to one attribute (e.g. "vitality") of every character that has it."""
+        stats = [getattr(character, attribute_name, None) for character in party]
+        return self.apply([stat for stat in stats if stat is not None], delta)
+
+    def apply_to_roster(self, roster, attribute_name: str, delta, rows=None,
+                        min_value: int = DEFAULT_MIN, max_value: int = DEFAULT_MAX) -> int:
+        """Add delta to one attribute of many CharacterRoster rows, working on the stat array directly."""
+        from project_code.src.Roster import COLUMNS, STRIDE
+        delta = _whole(delta)
+        column = COLUMNS[attribute_name]
+        bit = 1 << column
+        stats = roster.stats
+        present = roster.present
+        if rows is None:
+            # The whole column is one strided slice of the stat array: read and write it in one go.
+            column_values = stats[column::STRIDE]
+            new_column = array(stats.typecode, [min(max(old + delta, min_value), max_value) if flags & bit else old
+                                                for old, flags in zip(column_values, present)])
+            changed = [(row * STRIDE + column, old, new) for row, (old, new) in enumerate(zip(column_values, new_column))
+                       if old != new]
+        else:
+            changed = []
+            for row in rows:
+                if present[row] & bit:
+                    cell = row * STRIDE + column
+                    old = stats[cell]
+                    new = min(max(old + delta, min_value), max_value)
+                    if new != old:
+                        changed.append((cell, old, new))
+        batch = self.journal.begin_batch()
+        if not changed:
+            return batch
+        cells, old_values, new_values = zip(*changed)
+        # Checked against the stat array's type before the journal or the roster changes.
+        new_values = array(stats.typecode, new_values)
+        self.journal.record_cells(batch, self.journal.target(stats), cells, old_values, new_values)
+        if rows is None:
+            stats[column::STRIDE] = new_column
+        else:
+            for cell, new in zip(cells, new_values):
+                stats[cell] = new
+        return batch
+
+    def undo(self) -> int:
+        return self.journal.undo()
@@ -2,8 +2,8 @@ import random
 
 
 class Statistic:
-    def __init__(self, legacy_points: int):
-        self.value = self._generate_starting_value(legacy_points)
+    def __init__(self, legacy_points: int, rng: random.Random = None):
+        self.value = self._generate_starting_value(legacy_points, rng or random)
         self.description = None
         self.min_value = 0
         self.max_value = 100
@@ -21,17 +21,17 @@ class Statistic:
         if self.value < self.min_value:
             self.value = self.min_value
 
-    def _generate_starting_value(self, legacy_points: int):
+    def _generate_starting_value(self, legacy_points: int, rng=random):
         """Generate a starting value for the statistic based on random number and user properties."""
         """This is just a placeholder for now. Perhaps some statistics will be based on user properties, and others 
         will be random."""
-        return legacy_points % 100 + random.randint(1, 3)
+        return legacy_points % 100 + rng.randint(1, 3)
 
 
 class Strength(Statistic):
 
-    def __init__(self, value):
-        super().__init__(value)
+    def __init__(self, value, rng: random.Random = None):
+        super().__init__(value, rng)
         self.description = "Strength is a measure of physical power."
 
 # and so on for the other statistics
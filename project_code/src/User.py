@@ -1,17 +1,64 @@
 # User.py
-from project_code.src.Game import Game
+import os
+
+from project_code.src.main import CommandParser, Game
+from project_code.src.PartyOptimizer import PartyOptimizer
+from project_code.src.SaveGame import GameJournal, capture_state, load_state, restore_game
+
 
 class User:
 
-    def __init__(self, username: str, password: str, legacy_points: int = 0):
+    def __init__(self, username: str, password: str, legacy_points: int = 0, save_directory: str = None):
         self.username = username
         self.password = password
         self.legacy_points = legacy_points
-        self.current_game = self._get_retrieve_saved_game_state_or_create_new_game()
+        self.save_directory = save_directory
+        self.journal = None
+        self._current_game = None
+        # (candidate ids, event ids) -> (events, PartyOptimizer). The entry holds the events and
+        # the optimizer holds the candidates, so their ids are not reused while it is cached.
+        self._optimizers = {}
+
+    @property
+    def current_game(self) -> Game:
+        """The user's game, loaded or created the first time it is asked for, so a login that
+        only needs legacy_points never builds a world."""
+        if self._current_game is None:
+            self._current_game = self._get_retrieve_saved_game_state_or_create_new_game()
+        return self._current_game
 
     def _get_retrieve_saved_game_state_or_create_new_game(self) -> Game:
-        new_game = Game()
+        new_game = Game(CommandParser())
+        if self.save_directory is None:
+            return new_game
+        directory = os.path.join(self.save_directory, self.username)
+        state = load_state(directory)
+        if state is not None:
+            restore_game(new_game, state)
+        else:
+            state = capture_state(new_game)
+        self.journal = GameJournal(directory, state)
+        new_game.journal = self.journal
         return new_game
 
     def save_game(self):
-        pass
+        """Fold the journal into a snapshot. The writing happens on the journal's own thread."""
+        if self.journal is not None:
+            self.journal.compact()
+
+    def close(self):
+        """Save the game and wait for the journal to finish writing."""
+        if self.journal is not None:
+            journal, self.journal = self.journal, None
+            self._current_game.journal = None
+            journal.close()
+
+    def suggest_parties(self, candidates, events, k: int = 5) -> list:
+        """The top k starting parties this user can buy with their legacy points. The optimizer,
+        and its cache of results, is kept for the next call with the same candidates and events."""
+        candidates, events = tuple(candidates), tuple(events)
+        key = (tuple(map(id, candidates)), tuple(map(id, events)))
+        entry = self._optimizers.get(key)
+        if entry is None:
+            entry = self._optimizers[key] = (events, PartyOptimizer(candidates, events))
+        return entry[1].best(self.legacy_points, k)
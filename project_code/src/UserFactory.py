@@ -1,4 +1,5 @@
 # UserFactory.py
+from project_code.src.AccountStore import AccountStore
 from project_code.src.UserInputParser import UserInputParser
 from project_code.src.User import User
 
@@ -6,8 +7,17 @@ from project_code.src.User import User
 class UserFactory:
 
     @staticmethod
-    def create_user(parser: UserInputParser) -> User:
-        username = parser.parse("Enter a username: ")
-        password = parser.parse("Enter a password: ")
-        # Here you can add more logic as needed, e.g., validate input
+    def create_user(parser: UserInputParser, account_store: AccountStore = None) -> User:
+        prompt = "Enter a username: "
+        while True:
+            username = parser.parse(prompt)
+            password = parser.parse("Enter a password: ")
+            # Here you can add more logic as needed, e.g., validate input
+            if account_store is None:
+                break
+            try:
+                account_store.create_account(username, password)
+                break
+            except ValueError as error:
+                prompt = f"{error} Enter a different username: "
         return User(username, password)
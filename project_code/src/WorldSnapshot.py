@@ -0,0 +1,57 @@
+# WorldSnapshot.py
+import argparse
+import os
+import pickle
+import tempfile
+from functools import partial
+
+from project_code.src.main import LocationSpec, World
+
+MAGIC = b"WORLD01\n"
+SUFFIX = ".world"
+
+
+def pack_world(world: World) -> bytes:
+    """Serialize a World so that loading it costs one read and one small unpickle.
+
+    Each location's event data is pickled into its own blob, and the outer snapshot holds the
+    blobs as bytes. Loading the snapshot only copies those bytes; a location's events are
+    unpickled when the location is first visited.
+    """
+    locations = [LocationSpec(spec.name, spec.description,
+                              partial(pickle.loads, pickle.dumps(list(spec.event_data()), pickle.HIGHEST_PROTOCOL)),
+                              spec.location_class)
+                 for spec in world.locations]
+    packed = World(world.character_classes, world.party, locations)
+    return MAGIC + pickle.dumps(packed, pickle.HIGHEST_PROTOCOL)
+
+
+def unpack_world(data: bytes) -> World:
+    if not data.startswith(MAGIC):
+        raise ValueError("not a world snapshot")
+    return pickle.loads(memoryview(data)[len(MAGIC):])
+
+
+def save_world(world: World, path: str):
+    """Write a world snapshot, replacing any old one atomically."""
+    directory = os.path.dirname(os.path.abspath(path))
+    descriptor, temp_path = tempfile.mkstemp(dir=directory, suffix=SUFFIX)
+    try:
+        with os.fdopen(descriptor, "wb") as snapshot_file:
+            snapshot_file.write(pack_world(world))
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def load_world(path: str) -> World:
+    """Load a prebuilt world in one read. Only trusted snapshots should be loaded: they are pickles."""
+    with open(path, "rb") as snapshot_file:
+        return unpack_world(snapshot_file.read())
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Write the default world as a snapshot.")
+    arg_parser.add_argument("path", help=f"where to write the snapshot (e.g. world{SUFFIX})")
+    save_world(World.default(), arg_parser.parse_args().path)
@@ -1,47 +1,96 @@
 from enum import Enum
+from functools import partial
 from typing import List
 import random
 import sys
 
+from project_code.src.CommandRegistry import CommandRegistry
+from project_code.src.EventDeck import EventDeck
+from project_code.src.Metrics import METRICS, SamplingProfiler
+from project_code.src.OutputSink import CONSOLE, BufferedSink, OutputSink
+from project_code.src.Seeds import make_rng, new_seed
+from project_code.src.StatMutation import StatMutator
+
 
 class Location:
-    def __init__(self, name, description):
+    def __init__(self, name, description, load_events=None):
         self.name = name
         self.description = description
-        self.events = []
-        self.events_we_have_seen = []
+        # Called on first visit to build this location's events, so content is only made when needed.
+        self.load_events = load_events
+        self._rng = None
+        self._deck = None
+
+    @property
+    def deck(self) -> EventDeck:
+        if self._deck is None:
+            self._deck = EventDeck(rng=self._rng)
+            if self.load_events is not None:
+                load_events, self.load_events = self.load_events, None
+                self._deck.extend(load_events())
+        return self._deck
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the deck (and so every event here) has been built yet."""
+        return self._deck is not None
+
+    def set_rng(self, rng: random.Random):
+        """The stream the deck shuffles with. Setting it does not build the deck."""
+        self._rng = rng
+        if self._deck is not None:
+            self._deck.rng = rng
+
+    @property
+    def events(self):
+        """Events still waiting to be drawn, built one at a time as they are read, so an
+        adopted EventPack is never built in full."""
+        return self.deck.iter_remaining()
+
+    @property
+    def events_we_have_seen(self):
+        """The most recently drawn events. See deck.summary() for counts over every draw."""
+        return list(self.deck.history)
 
     def add_event(self, event):
-        self.events.append(event)
+        self.deck.add(event)
+
+    def add_events(self, events):
+        """Add a sequence of events, such as an EventPack, without materializing it."""
+        self.deck.extend(events)
 
-    def describe_location(self):
-        print(f"{self.name}: {self.description}")
+    def describe_location(self, sink: OutputSink = CONSOLE):
+        sink.write(f"{self.name}: {self.description}")
 
     def get_event(self):
-        event = self.events.pop(0)
-        self.events_we_have_seen.append(event)
-        return event
+        return self.deck.draw()
 
 
 class WildWestLocation(Location):
-    def __init__(self, name, description, inhabitants=None):
-        super().__init__(name, description)
+    def __init__(self, name, description, inhabitants=None, load_events=None):
+        super().__init__(name, description, load_events)
         if inhabitants is None:
             inhabitants = []
         self.inhabitants = inhabitants
         self.visited = True  # Marking the location as visited to show the welcome message
 
-    def describe_location(self):
-        print("Welcome to the Wild West!")
-        print(f"{self.name}: {self.description}")
-
-    def describe_inhabitants(self):
-        if self.inhabitants:
-            print(f"The {self.name} is populated by:")
+    def describe_location(self, sink: OutputSink = CONSOLE):
+        sink.write("Welcome to the Wild West!")
+        sink.write(f"{self.name}: {self.description}")
+
+    def describe_inhabitants(self, sink: OutputSink = CONSOLE, index=None):
+        """List the inhabitants, plus the characters a RosterIndex has here, without a scan."""
+        if not sink.enabled:
+            return
+        present = index.at(self) if index is not None else []
+        if self.inhabitants or present:
+            sink.write(f"The {self.name} is populated by:")
             for inhabitant in self.inhabitants:
-                print(f"- {inhabitant}")
+                sink.write(f"- {inhabitant}")
+            for character in present:
+                sink.write(f"- {character.name}")
         else:
-            print(f"The {self.name} is deserted.")
+            sink.write(f"The {self.name} is deserted.")
 
 
 class EventStatus(Enum):
@@ -52,8 +101,10 @@ class EventStatus(Enum):
 
 
 class Event:
-    def __init__(self, parser, data: dict = None):
+    def __init__(self, parser, data: dict = None, event_id: str = None):
         self.parser = parser
+        # Where the event came from, e.g. "Saloon/0". Events built from the same data differ only by this.
+        self.event_id = event_id
         # parse json file
         if data:
             self.primary = data.get('primary_attribute')
@@ -67,30 +118,47 @@ class Event:
         self.default_fail_message = {"message": "You failed."}
         self.default_pass_message = {"message": "You passed."}
         self.default_partial_pass_message = {"message": "You partially passed."}
-        self.prompt_text = "A dragon appears, what will you do?"
+        if not data:
+            self.prompt_text = "A dragon appears, what will you do?"
 
         self.primary_statistic = Attribute(0)
         self.secondary_statistic = Attribute(0)
 
-    def execute(self, party):
+    @property
+    def key(self) -> str:
+        """How saves refer to this event: its id, or its prompt text if it was built without one."""
+        return self.event_id if self.event_id is not None else self.prompt_text
+
+    def execute(self, party, sink: OutputSink = CONSOLE):
         chosen_one = self.parser.select_party_member(party)
         chosen_skill = self.parser.select_skill(chosen_one)
 
-        self.resolve_choice(party, chosen_one, chosen_skill)
+        self.resolve_choice(party, chosen_one, chosen_skill, sink)
 
     def set_status(self, status: EventStatus = EventStatus.UNKNOWN):
         self.status = status
 
-    def resolve_choice(self, party, character, chosen_skill):
-        if self.primary == chosen_skill.__class__.__name__ and self.secondary == chosen_skill.__class__.__name__:
-            self.set_status(EventStatus.PASS)
-            print(self.pass_)
-        elif self.primary == chosen_skill.__class__.__name__ or self.secondary == chosen_skill.__class__.__name__:
-            self.set_status(EventStatus.PARTIAL_PASS)
-            print(self.partial_pass)
+    def check(self, chosen_skill) -> EventStatus:
+        """Work out the outcome of a skill without printing or changing the event."""
+        skill_name = chosen_skill.__class__.__name__
+        if self.primary == skill_name and self.secondary == skill_name:
+            return EventStatus.PASS
+        elif self.primary == skill_name or self.secondary == skill_name:
+            return EventStatus.PARTIAL_PASS
         else:
-            self.set_status(EventStatus.FAIL)
-            print(self.fail)
+            return EventStatus.FAIL
+
+    def resolve_choice(self, party, character, chosen_skill, sink: OutputSink = CONSOLE):
+        status = self.check(chosen_skill)
+        self.set_status(status)
+        if not sink.enabled:
+            return
+        if status == EventStatus.PASS:
+            sink.write(self.pass_)
+        elif status == EventStatus.PARTIAL_PASS:
+            sink.write(self.partial_pass)
+        else:
+            sink.write(self.fail)
 
 
 class Character:
@@ -121,6 +189,23 @@ class Character:
         self.willpower = Willpower(0)
         self.spirit = Spirit(0)
 
+    @property
+    def skills(self):
+        """The Attribute objects this character can use as skills."""
+        skills = self.__dict__.get("_skills")
+        if skills is None:
+            skills = self.__dict__["_skills"] = SkillRegistry.skills(self)
+        return skills
+
+    def __setattr__(self, name, value):
+        # Any assignment may add, replace or remove a skill, so the cached tuple is dropped.
+        object.__setattr__(self, name, value)
+        self.__dict__.pop("_skills", None)
+
+    def __delattr__(self, name):
+        object.__delattr__(self, name)
+        self.__dict__.pop("_skills", None)
+
     def _generate_name(self):
         return "Unnamed Character"
 
@@ -262,160 +347,404 @@ class Horse(Character):
         self.vitality = Vitality(80)
 
 
+class LocationSpec:
+    """The recipe for a location. A Game turns it into a Location, and its events are only built
+    from the recipe when the location is first visited."""
+
+    def __init__(self, name: str, description: str, events=(), location_class: type = WildWestLocation):
+        self.name = name
+        self.description = description
+        # Event data dicts, or a zero-argument callable returning them (e.g. from a world snapshot).
+        self.events = events
+        self.location_class = location_class
+
+    def event_data(self):
+        return self.events() if callable(self.events) else self.events
+
+
+class World:
+    """The content a Game is built from: every character class, the starting party (as indices
+    into the classes) and the location recipes. See WorldSnapshot for saving a prebuilt one."""
+
+    def __init__(self, character_classes, party, locations):
+        self.character_classes = list(character_classes)
+        self.party = list(party)
+        self.locations = list(locations)
+
+    @classmethod
+    def default(cls) -> "World":
+        return cls(
+            [Sheriff, Outlaw, Bartender, Snake, Bandit, Doctor, Mayor, Deputy, Horse],
+            [0, 1, 2],
+            [LocationSpec("Saloon", "A lively saloon filled with patrons and music.",
+                          [{"primary_attribute": "Strength", "secondary_attribute": "Dexterity",
+                            "prompt_text": "A bar fight breaks out. What do you do?",
+                            "pass": "You successfully break up the fight.",
+                            "fail": "You get caught in the middle of the fight.",
+                            "partial_pass": "You manage to dodge the punches but fail to stop the fight."}]),
+             LocationSpec("Jail", "A dusty jail with empty cells.",
+                          [{"primary_attribute": "Intelligence", "secondary_attribute": "Wisdom",
+                            "prompt_text": "A mysterious stranger offers you a secret job. What do you do?",
+                            "pass": "You wisely decline the offer, sensing something isn't right.",
+                            "fail": "You accept the job, not realizing it's a setup.",
+                            "partial_pass": "You hesitate, asking for more information before deciding."}])])
+
+
 class Game:
-    def __init__(self, parser):
+    def __init__(self, parser, sink: OutputSink = None, seed: int = None, world: World = None):
+        # Every random draw in a game comes from streams derived from this seed, so a game can
+        # be replayed exactly and parallel games never share a stream.
+        self.seed = seed if seed is not None else new_seed()
+        self.rng = make_rng(self.seed, "game")
+        # A parser without a stream of its own draws from this game's sub-stream. One that
+        # already has a stream, given to it or bound by an earlier game, keeps it.
+        if isinstance(parser, CommandParser) and parser.rng is None:
+            parser.rng = make_rng(self.seed, "parser")
         self.parser = parser
-        self.characters: List[Character] = []
+        # Everything the game says goes through here. The default buffers a turn and writes it once.
+        self.sink = sink if sink is not None else BufferedSink()
+        self.world = world if world is not None else _DEFAULT_WORLD
+        self._characters: List[Character] = None
         self.locations: List[Location] = []
         self.events: List[Event] = []
         self.party: List[Character] = []
         self.current_location = None
         self.current_event = None
         self.continue_playing = True
+        # A SaveGame.GameJournal, if this game is being saved.
+        self.journal = None
+        # Every command handled, if the game is being recorded for replay.
+        self.command_log = None
+        # A Metrics.SamplingProfiler while the profile command is running.
+        self.profiler = None
+        # A LocationGraph to travel around, if the game is played on a generated map.
+        self.location_graph = None
+        # A RosterIndex of every character, once index_roster() has been called.
+        self.roster_index = None
+        # Applies and journals party-wide stat changes; made on first use.
+        self.stat_mutator = None
 
         self._initialize_game()
 
+    @property
+    def characters(self) -> List[Character]:
+        """Every character in the world. Only the party is built up front; the rest on first use."""
+        if self._characters is None:
+            starting_party = dict(zip(self.world.party, self._starting_party))
+            self._characters = [starting_party.get(index) or character_class()
+                                for index, character_class in enumerate(self.world.character_classes)]
+        return self._characters
+
     def add_character(self, character: Character):
         """Add a character to the game."""
         self.characters.append(character)
 
     def add_location(self, location: Location):
         """Add a location to the game."""
+        # Deck shuffles are game draws too, so they share the game's stream.
+        location.set_rng(self.rng)
         self.locations.append(location)
 
     def add_event(self, event: Event):
         """Add an event to the game."""
         self.events.append(event)
 
+    def _record(self, op: str, **data):
+        """Tell the save journal about a state change, if the game is being saved."""
+        if self.journal is not None:
+            self.journal.record(op, **data)
+
+    def set_party(self, party):
+        """Replace the party, e.g. when a member joins or is lost, and save the change."""
+        self.party = list(party)
+        self._place_party()
+        if self.journal is not None:
+            self.journal.record_party(self.party)
+
+    def apply_to_party(self, attribute_name: str, delta) -> int:
+        """Add delta to one attribute (e.g. "vitality") of every party member, and save the new
+        stats. Returns the StatMutator batch, which can be undone."""
+        if self.stat_mutator is None:
+            self.stat_mutator = StatMutator()
+        batch = self.stat_mutator.apply_to_party(self.party, attribute_name, delta)
+        if self.journal is not None:
+            self.journal.record_party(self.party)
+        return batch
+
     def _initialize_game(self):
-        sheriff = Sheriff()
-        outlaw = Outlaw()
-        bartender = Bartender()
-        snake = Snake()
-        bandit = Bandit()
-        doctor = Doctor()
-        mayor = Mayor()
-        deputy = Deputy()
-        horse = Horse()
-
-        self.add_character(sheriff)
-        self.add_character(outlaw)
-        self.add_character(bartender)
-        self.add_character(snake)
-        self.add_character(bandit)
-        self.add_character(doctor)
-        self.add_character(mayor)
-        self.add_character(deputy)
-        self.add_character(horse)
-
-        saloon = WildWestLocation("Saloon", "A lively saloon filled with patrons and music.")
-        jail = WildWestLocation("Jail", "A dusty jail with empty cells.")
-
-        self.add_location(saloon)
-        self.add_location(jail)
-
-        event1 = Event(self.parser, {"primary_attribute": "Strength", "secondary_attribute": "Dexterity",
-                                     "prompt_text": "A bar fight breaks out. What do you do?",
-                                     "pass": "You successfully break up the fight.",
-                                     "fail": "You get caught in the middle of the fight.",
-                                     "partial_pass": "You manage to dodge the punches but fail to stop the fight."})
-        event2 = Event(self.parser, {"primary_attribute": "Intelligence", "secondary_attribute": "Wisdom",
-                                     "prompt_text": "A mysterious stranger offers you a secret job. What do you do?",
-                                     "pass": "You wisely decline the offer, sensing something isn't right.",
-                                     "fail": "You accept the job, not realizing it's a setup.",
-                                     "partial_pass": "You hesitate, asking for more information before deciding."})
-
-        saloon.add_event(event1)
-        jail.add_event(event2)
-
-        self.party = [sheriff, outlaw, bartender]
+        """Build the party and the locations. Other characters, and the events of each location,
+        are built the first time they are needed."""
+        world = self.world
+        self._starting_party = [world.character_classes[index]() for index in world.party]
+        for spec in world.locations:
+            location = spec.location_class(spec.name, spec.description, load_events=partial(self._build_events, spec))
+            self.add_location(location)
+        self.party = list(self._starting_party)
+
+    def _build_events(self, spec: LocationSpec) -> List[Event]:
+        return [Event(self.parser, data, f"{spec.name}/{index}") for index, data in enumerate(spec.event_data())]
 
     def start_game(self):
         return self._main_game_loop()
 
     def _main_game_loop(self):
         """The main game loop."""
-        print("Welcome to the Wild West Adventure Game!")
-        print("You are the sheriff in town. Your job is to keep peace and order.")
-        print("Type 'help' at any time to see available commands.\n")
+        self._show_welcome()
 
         while self.continue_playing:
             self._check_current_state()
+            self.sink.flush()
             self._get_user_input()
+        self.sink.flush()
 
     def _check_current_state(self):
         """Check the current state of the game."""
         if not self.current_location:
-            self.current_location = random.choice(self.locations)
+            self.current_location = self.rng.choice(self.locations)
+            self._record("location", name=self.current_location.name)
+            self._place_party()
 
         if not self.current_event:
             self.current_event = self.current_location.get_event()
+            self._record("event", key=self.current_event.key if self.current_event else None)
 
         if not self.party:
-            print("Game over. Your party has been defeated.")
+            self.sink.write("Game over. Your party has been defeated.")
             self.continue_playing = False
 
+    def _show_welcome(self):
+        self.sink.write("Welcome to the Wild West Adventure Game!")
+        self.sink.write("You are the sheriff in town. Your job is to keep peace and order.")
+        self.sink.write("Type 'help' at any time to see available commands.\n")
+
     def _get_user_input(self):
         """Get user input."""
-        user_input = input(f"\nWhat would you like to do? ").strip().lower()
-
-        if user_input == 'help':
-            self._show_help()
-        elif user_input == 'quit':
-            self._quit_game()
-        elif user_input == 'status':
-            self._show_status()
-        elif user_input == 'look':
-            self._look_around()
-        elif user_input == 'event':
-            self._show_event()
-        elif user_input == 'execute':
-            self._execute_event()
+        self.handle_command(input(f"\nWhat would you like to do? "))
+
+    def handle_command(self, user_input: str):
+        """Run one command typed by the player. Commands can be abbreviated to any unique prefix."""
+        if self.command_log is not None:
+            self.command_log.append(user_input)
+        words = user_input.strip().lower().split()
+        if not words:
+            self.sink.write("Unknown command. Type 'help' to see available commands.")
+            return
+        command, candidates = self.commands.resolve(words[0])
+        if command is None:
+            if candidates:
+                names = ", ".join(sorted(candidate.name for candidate in candidates))
+                self.sink.write(f"'{words[0]}' could mean: {names}.")
+            else:
+                self.sink.write("Unknown command. Type 'help' to see available commands.")
+            return
+        args = words[1:]
+        if not command.min_args <= len(args) <= command.max_args:
+            self.sink.write(f"Usage: {command.usage}")
+            return
+        profiler = self.profiler
+        if profiler is None:
+            command.handler(self, *args)
         else:
-            print("Unknown command. Type 'help' to see available commands.")
+            with profiler.scope():
+                command.handler(self, *args)
 
-    def _show_help(self):
+    def run_script(self, lines) -> int:
+        """Feed commands from a script file or stream through the normal dispatcher.
+
+        Blank lines and lines starting with # are skipped. Stops when the game ends or the
+        script quits, and returns the number of commands run.
+        """
+        count = 0
+        for line in lines:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            self._check_current_state()
+            if not self.continue_playing:
+                break
+            try:
+                self.handle_command(line)
+            except SystemExit:
+                self.continue_playing = False
+            self.sink.flush()
+            count += 1
+            if not self.continue_playing:
+                break
+        return count
+
+    def _show_help(self, command_name: str = None):
         """Display help information."""
-        print("Available commands:")
-        print("- help: Show available commands")
-        print("- quit: Quit the game")
-        print("- status: Show party status")
-        print("- look: Look around the current location")
-        print("- event: Show details of the current event")
-        print("- execute: Execute the current event")
+        if command_name is not None:
+            command, _ = self.commands.resolve(command_name)
+            if command is None:
+                self.sink.write(f"No command called '{command_name}'.")
+                return
+            aliases = f" (also: {', '.join(command.aliases)})" if command.aliases else ""
+            self.sink.write(f"{command.usage}: {command.help_text}{aliases}")
+            return
+        self.sink.write("Available commands:")
+        for command in self.commands:
+            self.sink.write(f"- {command.name}: {command.help_text}")
 
     def _quit_game(self):
         """Quit the game."""
-        print("Quitting the game.")
+        self.sink.write("Quitting the game.")
+        self.continue_playing = False
+        self.sink.flush()
         sys.exit()
 
     def _show_status(self):
         """Show party status."""
-        print("\nParty Status:")
+        self.sink.write("\nParty Status:")
+        if not self.sink.enabled:
+            return
         for character in self.party:
-            print(f"- {character.name}")
+            self.sink.write(f"- {character.name}")
 
     def _look_around(self):
         """Look around the current location."""
-        print("\nYou look around...")
-        self.current_location.describe_location()
+        self.sink.write("\nYou look around...")
+        self.current_location.describe_location(self.sink)
+        if self.roster_index is not None and isinstance(self.current_location, WildWestLocation):
+            self.current_location.describe_inhabitants(self.sink, self.roster_index)
 
     def _show_event(self):
         """Show details of the current event."""
-        print("\nCurrent Event:")
-        print(self.current_event.prompt_text)
+        self.sink.write("\nCurrent Event:")
+        self.sink.write(self.current_event.prompt_text)
+
+    def _show_prediction(self):
+        """Show the odds of each outcome of the current event."""
+        # Imported here because these modules build on this one.
+        from project_code.src.OutcomeOracle import ORACLE
+        from project_code.src.EventIndex import best_choice
+        self.sink.write("\nPrediction:")
+        for status, probability in ORACLE.distribution(self.current_event, self.party).items():
+            self.sink.write(f"- {status.value}: {float(probability):.0%}")
+        member, skill, status = best_choice(self.current_event, self.party)
+        if member is not None:
+            self.sink.write(f"Best bet: {member.name} using {skill.__class__.__name__} ({status.value}).")
+
+    def attach_map(self, graph, start: int = None):
+        """Play on a generated LocationGraph, starting at node start (by default the corner (0, 0))."""
+        graph.parser = self.parser
+        self.location_graph = graph
+        self._move_to(graph.location(start if start is not None else 0))
+
+    def index_roster(self):
+        """Index every character by location, class and attributes. The party is placed at
+        the current location and moves with it from now on."""
+        if self.roster_index is None:
+            # Imported here because the index module builds on this one.
+            from project_code.src.RosterIndex import RosterIndex
+            self.roster_index = RosterIndex()
+            self.roster_index.add_many(self.characters)
+            self.roster_index.add_many(character for character in self.party if character not in self.roster_index)
+            self._place_party()
+        return self.roster_index
+
+    def fork(self, parser=None, sink: OutputSink = None, rng: random.Random = None) -> "Game":
+        """A cheap copy of this game to look ahead with. It shares this game's objects until it
+        changes them, so the two never affect each other. See GameFork.ForkedGame."""
+        # Imported here because the fork module builds on this one.
+        from project_code.src.GameFork import ForkedGame
+        return ForkedGame(self, parser, sink, rng)
+
+    def _place_party(self):
+        if self.roster_index is not None:
+            for character in self.party:
+                self.roster_index.move(character, self.current_location)
+
+    def _move_to(self, location: Location):
+        location.set_rng(self.rng)
+        self.current_location = location
+        self.current_event = None
+        self._place_party()
+        self._record("location", name=location.name)
+        self._record("event", key=None)
+
+    def _travel(self, x: str, y: str):
+        """Travel to the location at map coordinates (x, y) by the cheapest route."""
+        graph = self.location_graph
+        if graph is None:
+            self.sink.write("There is nowhere to travel to from here.")
+            return
+        try:
+            goal = graph.node(int(x), int(y))
+        except (ValueError, IndexError):
+            self.sink.write(f"There is no place at ({x}, {y}).")
+            return
+        path, cost = graph.find_path(self.current_location.node, goal)
+        if path is None:
+            self.sink.write(f"No trail leads to ({x}, {y}).")
+            return
+        self._move_to(graph.location(goal))
+        self.sink.write(f"\nYou ride {len(path) - 1} miles to {self.current_location.name} (travel cost {cost}).")
+
+    def _show_metrics(self, action: str = None):
+        """Show hot-path metrics, or turn them on, off, or reset them."""
+        if action == "on":
+            try:
+                METRICS.instrument()
+            except RuntimeError as error:
+                self.sink.write(f"Metrics could not be turned on: {error}.")
+                return
+            self.sink.write("Metrics on.")
+        elif action == "off":
+            METRICS.uninstrument()
+            self.sink.write("Metrics off.")
+        elif action == "reset":
+            METRICS.reset()
+            self.sink.write("Metrics reset.")
+        elif action is not None:
+            self.sink.write("Usage: metrics [on|off|reset]")
+        elif not METRICS.enabled and not METRICS.histograms:
+            self.sink.write("Metrics are off. Type 'metrics on' to start measuring.")
+        else:
+            self.sink.write("\nMetrics:")
+            for line in METRICS.summary():
+                self.sink.write(f"- {line}")
+
+    def _toggle_profile(self):
+        """Start sampling this game's stack, or stop and show where the time went."""
+        if self.profiler is None:
+            self.profiler = SamplingProfiler(scoped=True)
+            self.profiler.start()
+            self.sink.write("Profiling this session. Type 'profile' again to stop.")
+            return
+        profiler, self.profiler = self.profiler, None
+        profiler.stop()
+        self.sink.write(f"\nProfile ({profiler.samples} samples):")
+        for function, share in profiler.top():
+            self.sink.write(f"- {share:6.1%} {function}")
 
     def _execute_event(self):
         """Execute the current event."""
-        print("\nExecuting event...")
-        self.current_event.execute(self.party)
-        if self.current_event.status == EventStatus.PASS:
-            print(self.current_event.default_pass_message)
-        elif self.current_event.status == EventStatus.FAIL:
-            print(self.current_event.default_fail_message)
-        elif self.current_event.status == EventStatus.PARTIAL_PASS:
-            print(self.current_event.default_partial_pass_message)
+        self.sink.write("\nExecuting event...")
+        self.current_event.execute(self.party, self.sink)
+        if self.sink.enabled:
+            if self.current_event.status == EventStatus.PASS:
+                self.sink.write(self.current_event.default_pass_message)
+            elif self.current_event.status == EventStatus.FAIL:
+                self.sink.write(self.current_event.default_fail_message)
+            elif self.current_event.status == EventStatus.PARTIAL_PASS:
+                self.sink.write(self.current_event.default_partial_pass_message)
+        self._record("status", key=self.current_event.key, status=self.current_event.status.value)
         self.current_event = None
+        self._record("event", key=None)
+
+
+Game.commands = CommandRegistry()
+Game.commands.register("help", Game._show_help, "Show available commands", aliases=("?",), args=("command?",))
+Game.commands.register("quit", Game._quit_game, "Quit the game", aliases=("exit",))
+Game.commands.register("status", Game._show_status, "Show party status", aliases=("party",))
+Game.commands.register("look", Game._look_around, "Look around the current location", aliases=("l",))
+Game.commands.register("event", Game._show_event, "Show details of the current event")
+Game.commands.register("execute", Game._execute_event, "Execute the current event", aliases=("x", "do"))
+Game.commands.register("predict", Game._show_prediction, "Predict the outcome of the current event", aliases=("hint",))
+Game.commands.register("travel", Game._travel, "Travel to a place on the map", aliases=("go",), args=("x", "y"))
+Game.commands.register("metrics", Game._show_metrics, "Show timing metrics, or turn them on or off", args=("action?",))
+Game.commands.register("profile", Game._toggle_profile, "Start or stop profiling this session")
 
 
 class Attribute:
@@ -467,17 +796,62 @@ class Charisma(Attribute):
     pass
 
 
+class SkillRegistry:
+    """Which Attribute fields each Character class has, worked out once per class.
+
+    The names come from a freshly built instance, so an unusual first instance cannot skew
+    them. Each character caches its own skills tuple (see Character.skills); this registry is
+    only the scan that fills that cache and the per-class list of skill names. Deputy and Horse
+    pick up their extra Charisma attribute automatically.
+    """
+    layouts = {}
+
+    @classmethod
+    def layout(cls, character_class) -> tuple:
+        """Attribute class names of a Character class, in field order."""
+        layout = cls.layouts.get(character_class)
+        if layout is None:
+            try:
+                character = character_class()
+            except TypeError:
+                # A class that cannot be built without arguments has no known layout.
+                return ()
+            layout = cls.layouts[character_class] = tuple(type(skill).__name__ for skill in cls.skills(character))
+        return layout
+
+    @classmethod
+    def skills(cls, character):
+        """Scan __dict__ for the character's Attribute objects."""
+        return tuple(value for value in character.__dict__.values() if isinstance(value, Attribute))
+
+    @classmethod
+    def names(cls, character_class):
+        """Attribute class names of a Character class."""
+        return cls.layout(character_class)
+
+
+_DEFAULT_WORLD = World.default()
+
+
 class CommandParser:
-    @staticmethod
-    def select_party_member(party):
-        return random.choice(party)
+    def __init__(self, rng: random.Random = None):
+        # Without one, the first Game this parser plays binds it to a sub-stream of the game seed.
+        self.rng = rng
+
+    def select_party_member(self, party):
+        return (self.rng or random).choice(party)
 
-    @staticmethod
-    def select_skill(character):
-        return random.choice([attribute for attribute in character.__dict__.values() if isinstance(attribute, Attribute)])
+    def select_skill(self, character):
+        return (self.rng or random).choice(character.skills)
 
 
 if __name__ == "__main__":
     game = Game(CommandParser())
-    game.start_game()
+    if len(sys.argv) > 1:
+        # Batch mode: python -m project_code.src.main <script file>, or - to read commands from stdin.
+        script = sys.stdin if sys.argv[1] == "-" else open(sys.argv[1])
+        with script:
+            game.run_script(script)
+    else:
+        game.start_game()
 
@@ -0,0 +1,7 @@
+# helpers.py
+from project_code.src.main import Event
+
+
+def make_event(primary, secondary):
+    """An event with only the two attributes a skill check looks at."""
+    return Event(None, {"primary_attribute": primary, "secondary_attribute": secondary, "prompt_text": ""})
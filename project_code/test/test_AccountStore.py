@@ -0,0 +1,36 @@
+import sqlite3
+import unittest
+from project_code.src.AccountStore import AccountStore
+
+
+class TestAccountStore(unittest.TestCase):
+    def setUp(self):
+        self.store = AccountStore(iterations=1)
+
+    def test_taken_username_raises(self):
+        self.store.create_account("wyatt", "tombstone")
+        with self.assertRaises(ValueError):
+            self.store.create_account("wyatt", "dodge city")
+
+    def test_bulk_import_skips_taken_usernames(self):
+        self.store.create_account("wyatt", "tombstone")
+
+        added = self.store.import_accounts([("wyatt", "x", 0), ("doc", "y", 3), ("virgil", "z", 1)])
+
+        self.assertEqual(added, 2)
+        self.assertEqual(len(self.store), 3)
+        self.assertEqual(self.store.verify("doc", "y"), 3)
+
+    def test_close_closes_borrowed_connections_too(self):
+        with self.store.connection() as idle:
+            pass
+        with self.store.connection() as borrowed:
+            self.store.close()
+
+        for connection in (idle, borrowed):
+            with self.assertRaises(sqlite3.ProgrammingError):
+                connection.execute("SELECT 1")
+
+
+if __name__ == '__main__':
+    unittest.main()
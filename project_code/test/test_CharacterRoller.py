@@ -0,0 +1,52 @@
+import unittest
+
+from project_code.src.main import Deputy, Sheriff
+from project_code.src.CharacterRoller import (MAX_LEGACY_BONUS, MAX_VALUE, MIN_VALUE, CharacterRoller,
+                                              ClassDistribution, legacy_bonus)
+from project_code.src.Roster import ATTRIBUTE_NAMES, STRIDE
+
+
+class TestCharacterRoller(unittest.TestCase):
+
+    def test_same_seed_rolls_the_same_characters(self):
+        first = CharacterRoller(seed=9)
+        second = CharacterRoller(seed=9)
+
+        self.assertEqual(first.roll(Sheriff, 500), second.roll(Sheriff, 500))
+        self.assertEqual(list(first.stream(2000, batch_size=300)), list(second.stream(2000, batch_size=300)))
+        self.assertNotEqual(CharacterRoller(seed=10).roll(Sheriff, 500), CharacterRoller(seed=9).roll(Sheriff, 500))
+
+    def test_rolls_stay_within_the_spread_and_the_stat_bounds(self):
+        for legacy_points in (0, 35, 10_000):
+            roller = CharacterRoller(seed=3, legacy_points=legacy_points, spread=15)
+            bonus = legacy_bonus(legacy_points)
+            distribution = roller.distribution(Deputy)
+            block = roller.roll(Deputy, 2000)
+            for column, name in enumerate(ATTRIBUTE_NAMES):
+                values = block[column::STRIDE]
+                with self.subTest(legacy_points=legacy_points, attribute=name):
+                    if not distribution.mask & (1 << column):
+                        self.assertEqual(set(values), {0})
+                        continue
+                    base = distribution.values[column] + bonus
+                    self.assertGreaterEqual(min(values), max(MIN_VALUE, base - 15))
+                    self.assertLessEqual(max(values), min(MAX_VALUE, base + 15))
+
+    def test_stats_near_the_top_are_clamped(self):
+        distribution = ClassDistribution(Sheriff, spread=30)
+
+        tables = distribution.tables(MAX_LEGACY_BONUS)
+
+        self.assertTrue(all(max(table) <= MAX_VALUE for table in tables))
+        self.assertIn(MAX_VALUE, tables[ATTRIBUTE_NAMES.index("strength")])
+
+    def test_roster_has_the_requested_characters(self):
+        roster = CharacterRoller(seed=4).roster(1000, classes=(Sheriff, Deputy), batch_size=128)
+
+        self.assertEqual(len(roster), 1000)
+        self.assertEqual({character.character_class for character in roster}, {Sheriff, Deputy})
+        self.assertTrue(all(MIN_VALUE <= value <= MAX_VALUE for value in roster.stats))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+from project_code.src.CommandRegistry import CommandRegistry
+from project_code.src.main import CommandParser, Game
+
+
+class TestCommandRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = CommandRegistry()
+        self.registry.register("look", lambda target: "look", aliases=("l",))
+        self.registry.register("loot", lambda target: "loot", args=("item", "count?"))
+        self.registry.register("quit", lambda target: "quit")
+
+    def test_unique_prefix_resolves(self):
+        command, _ = self.registry.resolve("q")
+        self.assertEqual(command.name, "quit")
+
+    def test_exact_alias_wins_over_prefix(self):
+        command, _ = self.registry.resolve("l")
+        self.assertEqual(command.name, "look")
+
+    def test_ambiguous_prefix_returns_candidates(self):
+        command, candidates = self.registry.resolve("lo")
+        self.assertIsNone(command)
+        self.assertEqual({candidate.name for candidate in candidates}, {"look", "loot"})
+
+    def test_optional_arguments(self):
+        command = self.registry.commands["loot"]
+        self.assertEqual((command.min_args, command.max_args), (1, 2))
+        self.assertEqual(command.usage, "loot <item> [count]")
+
+
+class TestGameScript(unittest.TestCase):
+    def test_run_script_dispatches_until_quit(self):
+        game = Game(CommandParser())
+        output = io.StringIO()
+
+        with redirect_stdout(output):
+            count = game.run_script(["# comment", "", "stat", "x", "quit", "look"])
+
+        self.assertEqual(count, 3)
+        self.assertFalse(game.continue_playing)
+        self.assertIn("Party Status:", output.getvalue())
+        self.assertIn("Executing event...", output.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
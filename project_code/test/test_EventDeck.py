@@ -0,0 +1,100 @@
+import random
+import unittest
+from project_code.src.EventDeck import EventDeck, ReshufflePolicy
+
+
+class TestEventDeck(unittest.TestCase):
+    def test_draws_in_order_and_exhausts(self):
+        deck = EventDeck(["a", "b", "c"], policy=ReshufflePolicy.EXHAUST)
+
+        self.assertEqual([deck.draw() for _ in range(3)], ["a", "b", "c"])
+        self.assertIsNone(deck.draw(), "An exhausted deck should return None instead of raising")
+
+    def test_reshuffle_policy_keeps_drawing(self):
+        deck = EventDeck(["a", "b", "c"], policy=ReshufflePolicy.RESHUFFLE, rng=random.Random(1))
+
+        drawn = [deck.draw() for _ in range(9)]
+
+        self.assertEqual(deck.reshuffles, 2)
+        for start in (0, 3, 6):
+            self.assertEqual(sorted(drawn[start:start + 3]), ["a", "b", "c"])
+
+    def test_cycle_policy_repeats_order(self):
+        deck = EventDeck(list(range(5)), shuffle=True, policy=ReshufflePolicy.CYCLE, rng=random.Random(2))
+
+        first = [deck.draw() for _ in range(5)]
+        second = [deck.draw() for _ in range(5)]
+
+        self.assertEqual(first, second)
+
+    def test_weighted_draws_follow_weights(self):
+        deck = EventDeck(["common", "rare"], weights=[9, 1], rng=random.Random(3))
+
+        drawn = [deck.draw() for _ in range(10000)]
+
+        self.assertAlmostEqual(drawn.count("common") / len(drawn), 0.9, delta=0.02)
+
+    def test_history_is_bounded_but_counts_are_kept(self):
+        deck = EventDeck(list(range(10)), policy=ReshufflePolicy.CYCLE, history_size=3)
+
+        for _ in range(25):
+            deck.draw()
+
+        self.assertEqual(list(deck.history), [2, 3, 4])
+        self.assertEqual(deck.draws, 25)
+        self.assertEqual(deck.draw_counts[0], 3)
+
+    def test_fork_draws_independently_of_the_original(self):
+        deck = EventDeck(list(range(10)), shuffle=True, rng=random.Random(4))
+        deck.draw()
+        fork = deck.fork()
+        fork.rng = random.Random(5)
+
+        forked = [fork.draw() for _ in range(9)]
+        fork.add(10)
+
+        self.assertEqual(deck.remaining, 9)
+        self.assertEqual(len(deck), 10)
+        self.assertEqual(deck.draws, 1)
+        self.assertEqual(sorted(forked + [deck.history[0]]), list(range(10)))
+
+    def test_forks_of_a_large_deck_share_its_order(self):
+        deck = EventDeck(list(range(100_000)), shuffle=True, rng=random.Random(6))
+        drawn = [deck.draw() for _ in range(3)]
+        order = deck._order
+        fork = deck.fork()
+        fork.rng = random.Random(7)
+
+        forked = [fork.draw() for _ in range(50)]
+        grandchild = fork.fork()
+        deeper = [grandchild.draw() for _ in range(50)]
+        more = [deck.draw() for _ in range(50)]
+
+        self.assertIs(fork._order, order)
+        self.assertIs(grandchild._order, order)
+        self.assertLessEqual(len(fork._order_changes), 100)
+        self.assertEqual(len(set(drawn + forked + deeper)), 103)
+        self.assertEqual(len(set(drawn + more)), 53)
+        self.assertEqual(fork.draw_counts[drawn[0]], 1)
+        self.assertEqual(fork.draws, 53)
+        self.assertEqual(sorted(drawn + more + deck.remaining_cards()), list(range(100_000)))
+        self.assertEqual(sorted(drawn + forked + deeper + grandchild.remaining_cards()), list(range(100_000)))
+
+    def test_a_fork_copies_its_order_once_its_changes_outgrow_the_overlay(self):
+        deck = EventDeck(list(range(64)), shuffle=True, rng=random.Random(8))
+        deck.draw()
+        fork = deck.fork()
+
+        forked = [fork.draw() for _ in range(63)]
+        fork.reshuffle()
+        again = [fork.draw() for _ in range(64)]
+
+        self.assertIsNone(fork._order_changes)
+        self.assertIsNot(fork._order, deck._order)
+        self.assertEqual(sorted(forked + [deck.history[0]]), list(range(64)))
+        self.assertEqual(sorted(again), list(range(64)))
+        self.assertEqual(deck.remaining, 63)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+import unittest
+
+from project_code.src.EventIndex import EventIndex, best_choice, party_mask
+from project_code.src.main import EventStatus, Deputy, Snake
+from project_code.test.helpers import make_event
+
+
+class TestEventIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.events = [make_event("Charisma", "Charisma"), make_event("Strength", "Strength"),
+                       make_event("Charisma", "Wisdom"), make_event(None, None)]
+        self.index = EventIndex(self.events)
+
+    def test_answers_match_event_check(self):
+        for party in ([Snake()], [Deputy()]):
+            for status in (EventStatus.PASS, EventStatus.PARTIAL_PASS, EventStatus.FAIL):
+                expected = [event_id for event_id, event in enumerate(self.events)
+                            if max((event.check(skill) for member in party for skill in member.skills),
+                                   key=[EventStatus.FAIL, EventStatus.PARTIAL_PASS, EventStatus.PASS].index) == status]
+                self.assertEqual(sorted(self.index.event_ids(party, status)), expected)
+
+    def test_counts_and_requirements(self):
+        self.assertEqual(self.index.counts(party_mask([Snake()]))[EventStatus.PASS], 1)
+        self.assertEqual(sorted(self.index.requiring("Charisma")), [0, 2])
+
+    def test_best_choice_picks_the_member_with_the_matching_skill(self):
+        snake, deputy = Snake(), Deputy()
+        member, skill, status = best_choice(self.events[0], [snake, deputy])
+        self.assertIs(member, deputy)
+        self.assertEqual((skill.__class__.__name__, status), ("Charisma", EventStatus.PASS))
+
+
+if __name__ == '__main__':
+    unittest.main()
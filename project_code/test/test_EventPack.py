@@ -0,0 +1,96 @@
+import json
+import os
+import tempfile
+import unittest
+
+from project_code.src.main import CommandParser, Location
+from project_code.src.EventPack import EventPack, iter_event_records, load_event_pack
+
+EVENTS = [
+    {"primary_attribute": "Strength", "secondary_attribute": "Dexterity",
+     "prompt_text": "A stranger says \"draw\", then tips his hat élégamment. What do you do?",
+     "pass": {"message": "You win, {fair} and [square]", "rewards": [1, {"gold": "]}"}]},
+     "fail": "Back\\slash\ttab"},
+    {"primary_attribute": "Wisdom", "prompt_text": "", "partial_pass": {"nested": {"deeper": {"deepest": []}}}},
+    {"primary_attribute": "Spirit", "prompt_text": "Snake eyes 🐍"},
+]
+
+
+class TestEventPack(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def write(self, name: str, text: str) -> str:
+        path = os.path.join(self.directory, name)
+        with open(path, "w", encoding="utf-8") as pack_file:
+            pack_file.write(text)
+        return path
+
+    def test_small_chunks_split_strings_escapes_and_nesting(self):
+        # Leading whitespace longer than a chunk, \uXXXX escapes, and indentation between records.
+        path = self.write("events.json", "   \n\n  " + json.dumps(EVENTS, indent=1))
+        for chunk_size in range(1, 12):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(list(iter_event_records(path, chunk_size)), EVENTS)
+
+    def test_unicode_is_read_as_is(self):
+        path = self.write("events.json", json.dumps(EVENTS, ensure_ascii=False))
+        for chunk_size in (1, 2, 5):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(list(iter_event_records(path, chunk_size)), EVENTS)
+
+    def test_malformed_input_raises(self):
+        cases = {
+            "truncated.json": '[{"prompt_text": "Half an event"}, {"prompt_text": "no end"',
+            "unterminated.json": '[{"prompt_text": "never closed}]',
+            "unclosed_list.json": '[{"prompt_text": "fine"}',
+            "not_an_object.json": '[{"prompt_text": "fine"}, 12345]',
+        }
+        for name, text in cases.items():
+            path = self.write(name, text)
+            for chunk_size in (1, 4, 1 << 16):
+                with self.subTest(name=name, chunk_size=chunk_size):
+                    with self.assertRaises(ValueError):
+                        list(iter_event_records(path, chunk_size))
+
+    def test_jsonl_lines_must_be_objects(self):
+        path = self.write("events.jsonl", '{"prompt_text": "fine"}\n[1, 2]\n')
+        with self.assertRaises(ValueError):
+            list(iter_event_records(path))
+
+    def test_not_a_list_raises(self):
+        path = self.write("event.json", '   {"prompt_text": "A single event"}')
+        with self.assertRaises(ValueError):
+            list(iter_event_records(path, 2))
+
+    def test_compiled_pack_builds_events_with_ids(self):
+        path = self.write("frontier.json", json.dumps(EVENTS))
+        with load_event_pack(path, CommandParser()) as pack:
+            self.assertEqual(len(pack), 3)
+            self.assertEqual(pack[0].prompt_text, EVENTS[0]["prompt_text"])
+            self.assertEqual(pack[-1].key, "frontier.json/2")
+
+    def test_reading_a_locations_events_builds_only_those_read(self):
+        built = []
+
+        class CountingPack(EventPack):
+            def __getitem__(self, index):
+                built.append(index)
+                return super().__getitem__(index)
+
+        path = self.write("frontier.json", json.dumps(EVENTS))
+        load_event_pack(path, CommandParser()).close()
+        with CountingPack(path + ".evpk", CommandParser()) as pack:
+            location = Location("Frontier", "Open country.")
+            location.add_events(pack)
+            location.get_event()
+
+            first = next(iter(location.events))
+
+            self.assertEqual(first.key, "frontier.json/1")
+            self.assertEqual(built, [0, 1])
+            self.assertEqual([event.key for event in location.events], ["frontier.json/1", "frontier.json/2"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import timeit
+import unittest
+from project_code.src.main import Game, CommandParser
+from project_code.src.GameFork import ForkGroup
+from project_code.src.OutputSink import NullSink
+
+
+def snapshot(game):
+    decks = [(location.name, location.deck.draws, location.deck.remaining) for location in game.locations]
+    return decks, [character.strength.value for character in game.party]
+
+
+class TestGameFork(unittest.TestCase):
+    def setUp(self):
+        self.game = Game(CommandParser(), NullSink(), seed=7)
+        self.game._check_current_state()
+
+    def test_fork_leaves_the_original_untouched(self):
+        before = snapshot(self.game)
+        event = self.game.current_event
+
+        fork = self.game.fork()
+        fork.run_script(["execute"] * 5)
+
+        self.assertEqual(snapshot(self.game), before)
+        self.assertIs(self.game.current_event, event)
+        self.assertNotEqual(snapshot(fork), before)
+
+    def test_fork_plays_on_exactly_as_the_original_would(self):
+        fork = self.game.fork()
+        fork.run_script(["execute"] * 5)
+        self.game.run_script(["execute"] * 5)
+
+        self.assertEqual(snapshot(fork), snapshot(self.game))
+
+    def test_owned_characters_are_private_to_the_fork(self):
+        sheriff = self.game.party[0]
+        fork = self.game.fork()
+
+        fork.own(sheriff).strength.value = 1
+
+        self.assertEqual(sheriff.strength.value, 90)
+        self.assertEqual(fork.party[0].strength.value, 1)
+        self.assertIs(fork.own(sheriff), fork.party[0])
+
+    def test_party_stat_changes_stay_in_the_fork(self):
+        fork = self.game.fork()
+
+        fork.apply_to_party("strength", -10)
+
+        self.assertEqual(self.game.party[0].strength.value, 90)
+        self.assertEqual(fork.party[0].strength.value, 80)
+        self.assertIsNone(self.game.stat_mutator)
+
+    def test_owned_copies_replace_the_originals_in_the_forks_lists(self):
+        location = self.game.current_location
+        fork = self.game.fork()
+
+        copy = fork.own(location)
+        self.assertIsNot(copy, location)
+        self.assertIn(copy, fork.locations)
+        self.assertNotIn(location, fork.locations)
+        self.assertIn(location, self.game.locations)
+        self.assertEqual(len(fork.locations), len(self.game.locations))
+
+    def test_fork_cost_does_not_grow_with_the_world(self):
+        def fork_cost(game):
+            return min(timeit.repeat(lambda: game.fork().run_script(["execute", "execute"]), number=20, repeat=5))
+
+        small = fork_cost(self.game)
+        big = Game(CommandParser(), NullSink(), seed=7)
+        big._check_current_state()
+        # A million more locations; sharing one object keeps the test fast to set up.
+        big.locations.extend([big.locations[-1]] * 1_000_000)
+        big.events.extend([None] * 1_000_000)
+
+        self.assertLess(fork_cost(big), small * 3)
+
+    def test_group_discards_every_fork(self):
+        with ForkGroup(self.game) as group:
+            forks = [group.fork() for _ in range(3)]
+            for fork in forks:
+                fork.run_script(["execute"])
+            self.assertEqual(len(group), 3)
+
+        self.assertEqual(len(group), 0)
+        self.assertTrue(all(not fork.locations and not fork.continue_playing for fork in forks))
+
+
+if __name__ == '__main__':
+    unittest.main()
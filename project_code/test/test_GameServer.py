@@ -0,0 +1,73 @@
+import asyncio
+import unittest
+from project_code.src.GameServer import PROMPT, GameServer
+from project_code.src.Metrics import Metrics
+
+
+class TestGameServer(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.server = GameServer(port=0)
+        await self.server.start()
+        self.reader, self.writer = await asyncio.open_connection(self.server.host, self.server.port)
+
+    async def asyncTearDown(self):
+        self.writer.close()
+        await self.server.close()
+
+    async def send(self, command: str) -> str:
+        self.writer.write(f"{command}\n".encode("utf-8"))
+        await self.writer.drain()
+        return await self.read_until_prompt()
+
+    async def read_until_prompt(self) -> str:
+        data = await asyncio.wait_for(self.reader.readuntil(PROMPT.encode("utf-8")), 5)
+        return data.decode("utf-8")
+
+    async def quit(self) -> str:
+        self.writer.write(b"quit\n")
+        await self.writer.drain()
+        farewell = await asyncio.wait_for(self.reader.read(), 5)
+        return farewell.decode("utf-8")
+
+    async def test_session_plays_commands_and_closes_on_quit(self):
+        welcome = await self.read_until_prompt()
+        self.assertIn("Welcome to the Wild West Adventure Game!", welcome)
+        self.assertEqual(len(self.server.sessions), 1)
+
+        self.assertIn("Party Status:", await self.send("status"))
+        self.assertIn("Current Event:", await self.send("event"))
+        self.assertIn("Executing event...", await self.send("execute"))
+
+        self.assertIn("Quitting the game.", await self.quit())
+        self.assertEqual(self.server.sessions, set())
+
+
+class TestGameServerMetrics(TestGameServer):
+    async def asyncSetUp(self):
+        self.metrics = Metrics()
+        self.metrics.instrument()
+        await super().asyncSetUp()
+
+    async def asyncTearDown(self):
+        self.metrics.uninstrument()
+        await super().asyncTearDown()
+
+    async def test_session_commands_are_timed(self):
+        await self.read_until_prompt()
+        await self.send("status")
+        await self.send("look")
+        await self.quit()
+
+        self.assertEqual(self.metrics.histograms["Game.handle_command"].count, 3)
+
+    async def test_players_cannot_change_the_metrics(self):
+        await self.read_until_prompt()
+
+        reply = await self.send("metrics off")
+
+        self.assertIn("Unknown command", reply)
+        self.assertTrue(self.metrics.enabled)
+
+
+if __name__ == '__main__':
+    unittest.main()
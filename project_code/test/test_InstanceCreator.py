@@ -1,6 +1,8 @@
 import unittest
 from unittest.mock import MagicMock
+from project_code.src.AccountStore import AccountStore
 from project_code.src.InstanceCreator import InstanceCreator
+from project_code.src.OutputSink import BufferedSink
 from project_code.src.UserFactory import UserFactory
 from project_code.src.UserInputParser import UserInputParser
 from project_code.src.User import User
@@ -32,7 +34,50 @@ class TestInstanceCreator(unittest.TestCase):
         # Verify the results
         self.assertIsNone(user, "The method should return None for a 'no' response")
 
-    # You can add more tests to cover other scenarios, such as handling login
+    def test_get_user_info_login_loads_user_from_account_store(self):
+        store = AccountStore(iterations=1)
+        store.create_account("wyatt", "tombstone", legacy_points=7)
+        instance_creator = InstanceCreator(self.mock_user_factory, self.mock_parser, store)
+        self.mock_parser.parse.side_effect = ["login", "wyatt", "tombstone"]
+
+        user = instance_creator.get_user_info("yes")
+
+        self.assertEqual(user.username, "wyatt")
+        self.assertEqual(user.legacy_points, 7)
+        self.mock_user_factory.create_user.assert_not_called()
+
+    def test_get_user_info_login_wrong_password_returns_none(self):
+        store = AccountStore(iterations=1)
+        store.create_account("wyatt", "tombstone")
+        sink = BufferedSink()
+        instance_creator = InstanceCreator(self.mock_user_factory, self.mock_parser, store, sink)
+        self.mock_parser.parse.side_effect = ["login", "wyatt", "dodge city"]
+
+        self.assertIsNone(instance_creator.get_user_info("yes"))
+        self.assertEqual(sink.getvalue(), "Wrong username or password.\n")
+
+    def test_get_user_info_new_user_is_created_in_the_account_store(self):
+        store = AccountStore(iterations=1)
+        instance_creator = InstanceCreator(UserFactory(), self.mock_parser, store)
+        self.mock_parser.parse.side_effect = ["new", "virgil", "dodge city"]
+
+        user = instance_creator.get_user_info("yes")
+
+        self.assertEqual(user.username, "virgil")
+        self.assertEqual(store.verify("virgil", "dodge city"), 0)
+
+    def test_create_user_asks_again_for_a_taken_username(self):
+        store = AccountStore(iterations=1)
+        store.create_account("wyatt", "tombstone")
+        self.mock_parser.parse.side_effect = ["wyatt", "dodge city", "virgil", "dodge city"]
+
+        user = UserFactory.create_user(self.mock_parser, store)
+
+        self.assertEqual(user.username, "virgil")
+        self.assertEqual(store.verify("virgil", "dodge city"), 0)
+        self.assertEqual(store.verify("wyatt", "tombstone"), 0)
+        self.assertEqual(self.mock_parser.parse.call_args_list[2].args[0],
+                         "The username 'wyatt' is already taken. Enter a different username: ")
 
 if __name__ == '__main__':
     unittest.main()
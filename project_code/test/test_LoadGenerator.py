@@ -0,0 +1,56 @@
+import unittest
+from project_code.src.AccountStore import AccountStore
+from project_code.src.InstanceCreator import InstanceCreator
+from project_code.src.LoadGenerator import (ScriptedInputParser, StageTimer, make_accounts, make_scripts,
+                                            measure_memory, percentile, run_load, run_session)
+from project_code.src.UserFactory import UserFactory
+from project_code.src.main import Game
+
+
+class TestLoadGenerator(unittest.TestCase):
+    def test_scripted_sessions_sign_up_and_log_in_for_real(self):
+        store = AccountStore(iterations=1)
+        self.addCleanup(store.close)
+        make_accounts(store, 1, iterations=1)
+        factory = UserFactory()
+
+        newcomer = run_session(store, factory, ["new", "calamity", "jane"])
+        rider = run_session(store, factory, ["login", "rider0", "password0"])
+        stranger = run_session(store, factory, ["login", "rider0", "wrong"])
+
+        self.assertEqual(store.verify("calamity", "jane"), 0)
+        self.assertEqual(rider.username, "rider0")
+        # The game the load is measured on is the one players get, not a placeholder.
+        self.assertIsInstance(rider.current_game, Game)
+        self.assertEqual(len(rider.current_game.party), 3)
+        self.assertIsNone(stranger)
+
+    def test_run_load_times_every_stage(self):
+        report = run_load(40, threads=2, hash_iterations=1, seed=5)
+        calls = {name: len(samples) for name, samples in report.samples.items()}
+
+        self.assertEqual((report.rejected, sum(report.errors.values())), (0, 0))
+        self.assertEqual(calls["InstanceCreator.get_user_info"], 40)
+        self.assertEqual(calls["InstanceCreator._load_user"] + calls["UserFactory.create_user"], 40)
+        self.assertEqual(calls["session"], 40)
+        self.assertGreater(measure_memory(10), 0)
+
+    def test_timer_restores_the_pipeline(self):
+        original = InstanceCreator.get_user_info
+        with StageTimer():
+            self.assertIsNot(InstanceCreator.get_user_info, original)
+        self.assertIs(InstanceCreator.get_user_info, original)
+
+    def test_percentile_picks_the_nearest_rank(self):
+        self.assertEqual(percentile([1, 2, 3, 4], 0.5), 2)
+        self.assertEqual(percentile([1, 2, 3, 4], 0.99), 4)
+
+    def test_scripts_start_with_the_menu_choice(self):
+        self.assertEqual(make_scripts(3, 0, seed=1)[0][0], "new")
+
+    def test_scripted_parser_ends_input_when_the_script_runs_out(self):
+        with self.assertRaises(EOFError):
+            ScriptedInputParser([]).parse("Enter a username: ")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+
+from project_code.src.LocationGraph import LocationGraph
+
+
+class TestLocationGraph(unittest.TestCase):
+
+    def test_unloaded_chunks_regenerate_identically(self):
+        graph = LocationGraph(128, 128, seed=5, max_chunks=2)
+        costs = [graph.cost(node) for node in range(0, len(graph), 97)]
+        self.assertGreater(graph.chunks_unloaded, 0)
+        self.assertLessEqual(len(graph._chunks), 2)
+        self.assertEqual([graph.cost(node) for node in range(0, len(graph), 97)], costs)
+
+    def test_route_follows_passable_neighbours_and_costs_add_up(self):
+        graph = LocationGraph(96, 96, seed=8)
+        path, cost = graph.find_path(graph.node(0, 0), graph.node(88, 72), weight=1)
+        self.assertEqual(path[0], graph.node(0, 0))
+        self.assertEqual(path[-1], graph.node(88, 72))
+        total = 0
+        for node, next_node in zip(path, path[1:]):
+            steps = dict(graph.neighbours(node))
+            self.assertIn(next_node, steps)
+            total += steps[next_node]
+        self.assertEqual(total, cost)
+        # Travelling only by road costs 88 + 72; the optimal route can be no dearer.
+        self.assertLessEqual(cost, 160)
+        _, weighted_cost = graph.find_path(graph.node(0, 0), graph.node(88, 72))
+        self.assertLessEqual(weighted_cost, cost * 1.2)
+
+    def test_walled_in_goal_is_unreachable_without_a_search(self):
+        graph = LocationGraph(400, 400, seed=1)
+        goal = graph.node(94, 50)
+        self.assertEqual(graph._pocket(goal), {goal})
+
+        self.assertEqual(graph.find_path(graph.node(0, 0), goal), (None, None))
+        # Only the chunks at either end were generated, not the map in between.
+        self.assertLessEqual(graph.chunks_loaded, 2)
+        self.assertEqual(graph.find_path(goal, goal), ([goal], 0))
+
+    def test_walled_in_start_cannot_leave_without_a_search(self):
+        graph = LocationGraph(400, 400, seed=1)
+        start = graph.node(94, 50)
+
+        self.assertEqual(graph.find_path(start, graph.node(0, 0)), (None, None))
+        self.assertLessEqual(graph.chunks_loaded, 2)
+
+    def test_visited_locations_outlive_their_chunk(self):
+        graph = LocationGraph(128, 128, seed=5, max_chunks=1)
+        visited = graph.location(graph.node(1, 1))
+        event = visited.get_event()
+        unvisited = graph.location(graph.node(2, 1))
+
+        graph.location(graph.node(100, 100))
+
+        self.assertGreater(graph.chunks_unloaded, 0)
+        self.assertIs(graph.location(graph.node(1, 1)), visited)
+        self.assertEqual(visited.deck.draws, 1)
+        self.assertIsNot(graph.location(graph.node(2, 1)), unvisited)
+        self.assertIsNotNone(event)
+
+    def test_only_walled_in_places_are_unreachable(self):
+        graph = LocationGraph(64, 64, seed=3)
+        reachable = {0}
+        pending = [0]
+        while pending:
+            for neighbour, _ in graph.neighbours(pending.pop()):
+                if neighbour not in reachable:
+                    reachable.add(neighbour)
+                    pending.append(neighbour)
+        for node in range(len(graph)):
+            if graph.cost(node):
+                self.assertEqual(graph._pocket(node) is None, node in reachable, graph.coordinates(node))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import tempfile
+import unittest
+from project_code.src.main import Event, EventStatus, Game, Location
+from project_code.src.MCTSParser import MCTSParser, TranspositionTable
+from project_code.src.OutputSink import NullSink
+from project_code.src.SaveGame import GameJournal, capture_state
+
+
+def make_game(parser):
+    game = Game(parser, NullSink(), seed=11)
+    parser.game = game
+    location = Location("Stage", "A stage for one kind of trouble.")
+    location.add_events([Event(parser, {"primary_attribute": "Strength", "secondary_attribute": "Strength",
+                                        "prompt_text": "Lift the wagon."})] * 5)
+    game.locations = []
+    game.add_location(location)
+    game._check_current_state()
+    return game
+
+
+class TestMCTSParser(unittest.TestCase):
+    def test_plays_the_move_that_passes(self):
+        parser = MCTSParser(iterations=60)
+        game = make_game(parser)
+
+        game.current_event.execute(game.party, game.sink)
+
+        self.assertEqual(game.current_event.status, EventStatus.PASS)
+        self.assertEqual(parser.searches, 1)
+
+    def test_search_leaves_the_game_untouched(self):
+        parser = MCTSParser(iterations=30)
+        game = make_game(parser)
+        deck = game.current_location.deck
+        before = (deck.draws, deck.remaining, game.current_event)
+
+        parser.best_move()
+
+        self.assertEqual((deck.draws, deck.remaining, game.current_event), before)
+
+    def test_workers_search_a_saved_game(self):
+        parser = MCTSParser(iterations=60, workers=2)
+        self.addCleanup(parser.close)
+        game = make_game(parser)
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        game.journal = GameJournal(directory.name, capture_state(game))
+        self.addCleanup(game.journal.close)
+
+        game.current_event.execute(game.party, game.sink)
+        game.current_event = None
+        game._check_current_state()
+        game.current_event.execute(game.party, game.sink)
+
+        self.assertEqual(game.current_event.status, EventStatus.PASS)
+        self.assertEqual(parser.searches, 2)
+
+    def test_table_evicts_least_recently_used(self):
+        table = TranspositionTable(maxsize=2)
+        first = table.get("a", 3)
+        table.get("b", 3)
+        table.get("a", 3)
+        table.get("c", 3)
+
+        self.assertIs(table.get("a", 3), first)
+        self.assertEqual((len(table), table.evictions), (2, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import time
+import unittest
+
+from project_code.src.main import Game, CommandParser, Event
+from project_code.src.Metrics import Metrics, SamplingProfiler
+from project_code.src.OutputSink import NullSink
+
+
+class TestMetrics(unittest.TestCase):
+
+    def setUp(self):
+        self.metrics = Metrics()
+        self.original_execute = Game.__dict__["_execute_event"]
+        self.original_resolve = Event.__dict__["resolve_choice"]
+
+    def tearDown(self):
+        self.metrics.uninstrument()
+
+    def test_instrumented_commands_are_timed_and_counted(self):
+        self.metrics.instrument()
+        game = Game(CommandParser(), NullSink(), seed=7)
+        game.run_script(["execute", "execute"])
+        self.assertEqual(self.metrics.histograms["Game._execute_event"].count, 2)
+        self.assertEqual(self.metrics.histograms["Event.resolve_choice"].count, 2)
+        self.assertEqual(sum(count for name, count in self.metrics.counters.items() if name.startswith("outcome.")), 2)
+        self.assertIn('game_call_seconds_count{function="Game._execute_event"} 2', self.metrics.to_prometheus())
+
+    def test_uninstrument_restores_the_original_methods(self):
+        self.metrics.instrument()
+        self.metrics.uninstrument()
+        self.assertIs(Game.__dict__["_execute_event"], self.original_execute)
+        self.assertIs(Event.__dict__["resolve_choice"], self.original_resolve)
+        self.assertIs(Game.commands.commands["execute"].handler, self.original_execute)
+
+    def test_a_second_metrics_object_cannot_instrument(self):
+        self.metrics.instrument()
+        other = Metrics()
+
+        with self.assertRaises(RuntimeError):
+            other.instrument()
+        other.uninstrument()
+
+        self.assertTrue(self.metrics.enabled)
+        self.assertFalse(other.enabled)
+        self.metrics.uninstrument()
+        other.instrument()
+        self.addCleanup(other.uninstrument)
+        self.assertTrue(other.enabled)
+
+
+class TestSamplingProfiler(unittest.TestCase):
+    def spin(self, seconds: float):
+        deadline = time.perf_counter() + seconds
+        while time.perf_counter() < deadline:
+            pass
+
+    def test_scoped_profiler_keeps_only_samples_inside_a_scope(self):
+        profiler = SamplingProfiler(interval=0.001, scoped=True)
+        profiler.start()
+        self.spin(0.05)
+        outside = profiler.samples
+        with profiler.scope():
+            self.spin(0.05)
+        profiler.stop()
+
+        self.assertEqual(outside, 0)
+        self.assertGreater(profiler.samples, 0)
+        self.assertEqual(profiler.top(1)[0][0], "test_Metrics.py:spin")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import math
+import unittest
+from collections import Counter
+from fractions import Fraction
+
+from project_code.src.main import Bartender, CommandParser, Deputy, Event, EventStatus, Horse, Outlaw, Sheriff, Snake
+from project_code.src.OutcomeOracle import OutcomeOracle
+from project_code.src.OutputSink import NullSink
+from project_code.src.Seeds import make_rng
+
+TRIALS = 20_000
+
+
+class TestOutcomeOracle(unittest.TestCase):
+
+    def setUp(self):
+        self.oracle = OutcomeOracle()
+
+    def monte_carlo(self, event, party, seed: int) -> Counter:
+        event.parser = CommandParser(make_rng(seed, "oracle test"))
+        sink = NullSink()
+        outcomes = Counter()
+        for _ in range(TRIALS):
+            event.execute(party, sink)
+            outcomes[event.status] += 1
+        return outcomes
+
+    def assert_matches_monte_carlo(self, event, party, seed: int):
+        odds = self.oracle.distribution(event, party)
+        self.assertEqual(sum(odds.values()), 1)
+        outcomes = self.monte_carlo(event, party, seed)
+        for status, probability in odds.items():
+            # Within five standard errors of the exact probability.
+            tolerance = 5 * math.sqrt(float(probability * (1 - probability)) / TRIALS)
+            with self.subTest(status=status):
+                self.assertAlmostEqual(outcomes[status] / TRIALS, float(probability), delta=max(tolerance, 1e-9))
+
+    def test_default_party_matches_monte_carlo(self):
+        event = Event(None, {"primary_attribute": "Strength", "secondary_attribute": "Dexterity"})
+        self.assert_matches_monte_carlo(event, [Sheriff(), Outlaw(), Bartender()], seed=1)
+
+    def test_party_with_uneven_skills_matches_monte_carlo(self):
+        event = Event(None, {"primary_attribute": "Charisma", "secondary_attribute": "Charisma"})
+        self.assert_matches_monte_carlo(event, [Deputy(), Horse(), Snake(), Sheriff()], seed=2)
+
+    def test_exact_odds_of_a_single_member(self):
+        event = Event(None, {"primary_attribute": "Strength", "secondary_attribute": "Wisdom"})
+
+        odds = self.oracle.distribution(event, [Sheriff()])
+
+        self.assertEqual(odds, {EventStatus.PASS: 0, EventStatus.PARTIAL_PASS: Fraction(2, 10),
+                                EventStatus.FAIL: Fraction(8, 10)})
+
+    def test_answers_are_cached_by_party_make_up(self):
+        event = Event(None, {"primary_attribute": "Strength", "secondary_attribute": "Dexterity"})
+        self.oracle.distribution(event, [Sheriff(), Outlaw()])
+        self.oracle.distribution(event, [Outlaw("Billy"), Sheriff("Wyatt")])
+
+        self.assertEqual(self.oracle.cache_info().hits, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import io
+import unittest
+from unittest.mock import patch
+
+from project_code.src.main import Game, CommandParser
+from project_code.src.OutputSink import BatchedSink, BufferedSink, OutputSink
+
+
+class CapturingSink(OutputSink):
+    """Records every write and flush, in order."""
+
+    def __init__(self):
+        self.calls = []
+
+    def write(self, text=""):
+        self.calls.append(("write", str(text)))
+
+    def flush(self):
+        self.calls.append(("flush",))
+
+
+class TestOutputSink(unittest.TestCase):
+
+    def test_buffered_lines_come_out_in_order_in_one_write(self):
+        stream = io.StringIO()
+        sink = BufferedSink(stream)
+        for line in ("one", 2, "three"):
+            sink.write(line)
+        self.assertEqual(stream.getvalue(), "")
+
+        sink.flush()
+        sink.flush()
+
+        self.assertEqual(stream.getvalue(), "one\n2\nthree\n")
+
+    def test_batched_sink_flushes_every_batch(self):
+        stream = io.StringIO()
+        sink = BatchedSink(stream, batch_size=2)
+        for line in "abcde":
+            sink.write(line)
+        self.assertEqual(stream.getvalue(), "a\nb\nc\nd\n")
+        sink.flush()
+        self.assertEqual(stream.getvalue(), "a\nb\nc\nd\ne\n")
+
+    def test_game_output_is_in_order(self):
+        sink = CapturingSink()
+        game = Game(CommandParser(), sink, seed=5)
+        game.run_script(["status", "event", "execute"])
+
+        written = [call[1] for call in sink.calls if call[0] == "write"]
+        status = written.index("\nParty Status:")
+        event = written.index("\nCurrent Event:")
+        execute = written.index("\nExecuting event...")
+        self.assertLess(status, event)
+        self.assertLess(event, execute)
+        self.assertEqual(written[status + 1:event], [f"- {character.name}" for character in game.party])
+        # run_script flushes once after each command.
+        self.assertEqual(sink.calls.count(("flush",)), 3)
+        self.assertEqual(sink.calls[-1], ("flush",))
+
+    def test_buffer_is_flushed_before_input_is_requested(self):
+        stream = io.StringIO()
+        game = Game(CommandParser(), BufferedSink(stream), seed=5)
+        seen = []
+
+        def fake_input(prompt):
+            seen.append((stream.getvalue(), list(game.sink.lines)))
+            return "quit" if len(seen) > 1 else "status"
+
+        with patch("builtins.input", fake_input), self.assertRaises(SystemExit):
+            game.start_game()
+
+        welcome, pending = seen[0]
+        self.assertTrue(welcome.startswith("Welcome to the Wild West Adventure Game!\n"))
+        self.assertEqual(pending, [])
+        after_status, pending = seen[1]
+        self.assertIn("\nParty Status:\n", after_status)
+        self.assertEqual(pending, [])
+        self.assertTrue(stream.getvalue().endswith("Quitting the game.\n"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,36 @@
+import unittest
+
+from project_code.src.main import Sheriff, Deputy, Snake
+from project_code.src.PartyOptimizer import PartyOptimizer
+from project_code.test.helpers import make_event
+
+
+class TestPartyOptimizer(unittest.TestCase):
+
+    def setUp(self):
+        self.sheriff, self.deputy, self.snake = Sheriff(), Deputy(), Snake()
+        costs = {id(self.sheriff): 3, id(self.deputy): 5, id(self.snake): 1}
+        self.events = [make_event("Charisma", "Charisma"), make_event("Strength", "Dexterity")]
+        self.optimizer = PartyOptimizer([self.sheriff, self.deputy, self.snake], self.events,
+                                        cost=lambda character: costs[id(character)])
+
+    def test_cheapest_of_interchangeable_candidates_is_chosen(self):
+        best = self.optimizer.best(4, k=1)[0]
+        self.assertEqual(best.members, (self.snake,))
+        self.assertEqual((best.score, best.cost), (1, 1))
+
+    def test_larger_budget_buys_a_better_party(self):
+        best = self.optimizer.best(6, k=2)
+        self.assertEqual(best[0].members, (self.deputy,))
+        self.assertEqual((best[0].score, best[0].cost), (3, 5))
+        # Same score, but the extra member makes it dearer.
+        self.assertEqual((best[1].score, best[1].cost), (3, 6))
+
+    def test_results_are_cached_per_budget(self):
+        self.optimizer.best(6)
+        self.optimizer.best(6)
+        self.assertEqual(self.optimizer.cache_info().hits, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
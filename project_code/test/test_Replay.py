@@ -0,0 +1,60 @@
+import random
+import unittest
+from project_code.src.main import CommandParser, Game
+from project_code.src.OutputSink import NullSink
+from project_code.src.Replay import ReplayLog, record_game, record_headless_game, replay
+from project_code.src.Simulation import run_games
+
+
+class TestReplay(unittest.TestCase):
+    def test_same_seed_same_game(self):
+        first = run_games(50, seed=42)
+        second = run_games(50, seed=42)
+
+        self.assertEqual(first.outcomes, second.outcomes)
+
+    def test_headless_replay_matches_recording(self):
+        report, log = record_headless_game(seed=7, max_turns=40)
+
+        replayed = replay(ReplayLog.from_bytes(log.to_bytes()))
+
+        self.assertEqual(replayed.outcomes, report.outcomes)
+        self.assertEqual(replayed.turns, report.turns)
+
+    def test_command_replay_reaches_same_state(self):
+        game, log = record_game(seed=11, sink=NullSink())
+        game.run_script(["look", "execute", "execute", "status", "execute"])
+
+        replayed = replay(log)
+
+        self.assertEqual(replayed.current_location.name, game.current_location.name)
+        self.assertEqual([location.deck.draws for location in replayed.locations],
+                         [location.deck.draws for location in game.locations])
+
+    def test_games_get_independent_parser_streams(self):
+        first = Game(CommandParser(), NullSink(), seed=1)
+        second = Game(CommandParser(), NullSink(), seed=1)
+
+        self.assertIsNot(first.parser.rng, second.parser.rng)
+        self.assertEqual(first.parser.rng.random(), second.parser.rng.random())
+
+    def test_a_reused_parser_keeps_its_stream(self):
+        parser = CommandParser()
+        first = Game(parser, NullSink(), seed=1)
+        stream = parser.rng
+        first.run_script(["execute", "execute", "execute"])
+        state = stream.getstate()
+        reused = Game(parser, NullSink(), seed=2)
+
+        self.assertIs(reused.parser.rng, stream)
+        self.assertEqual(stream.getstate(), state)
+
+    def test_a_parser_given_a_stream_keeps_it(self):
+        stream = random.Random(3)
+
+        game = Game(CommandParser(stream), NullSink(), seed=1)
+
+        self.assertIs(game.parser.rng, stream)
+
+if __name__ == '__main__':
+    unittest.main()
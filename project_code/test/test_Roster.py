@@ -0,0 +1,108 @@
+import gc
+import tracemalloc
+import unittest
+from project_code.src.main import Event, EventStatus, Sheriff, Deputy, Snake, Strength
+from project_code.src.Roster import CharacterRoster, CompactCharacter, COLUMNS, STRIDE
+
+
+def traced_bytes(build) -> int:
+    """Memory still held by what build() returns, while it is alive."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        kept = build()
+        gc.collect()
+        held = tracemalloc.get_traced_memory()[0] - before
+        del kept
+        return held
+    finally:
+        tracemalloc.stop()
+
+
+class TestCharacterRoster(unittest.TestCase):
+    def test_rows_read_like_the_characters_they_hold(self):
+        roster = CharacterRoster()
+        sheriff = Sheriff("Wyatt")
+        handle = roster.add(sheriff)
+        deputy = roster.add_kind(Deputy)
+
+        self.assertEqual(len(roster), 2)
+        self.assertEqual(handle.name, "Wyatt")
+        self.assertIs(handle.character_class, Sheriff)
+        self.assertEqual(handle.strength.value, sheriff.strength.value)
+        self.assertEqual([type(skill).__name__ for skill in handle.skills],
+                         [type(skill).__name__ for skill in sheriff.skills if type(skill).__name__.lower() in COLUMNS])
+        self.assertEqual(deputy.charisma.value, 90)
+        self.assertEqual(roster[1], deputy)
+        self.assertEqual(roster[-1], deputy)
+
+    def test_views_write_through_to_the_roster(self):
+        roster = CharacterRoster()
+        handle = roster.add_kind(Sheriff)
+
+        handle.strength.value = 12
+        handle.wisdom = Strength(34)
+        roster.set_value(0, COLUMNS["spirit"], 56)
+
+        self.assertEqual(roster.value(0, COLUMNS["strength"]), 12)
+        self.assertEqual(roster[0].wisdom.value, 34)
+        self.assertEqual(roster[0].spirit.value, 56)
+
+    def test_missing_attributes_raise_until_set(self):
+        roster = CharacterRoster()
+        handle = roster.add_kind(Sheriff)
+
+        with self.assertRaises(AttributeError):
+            handle.charisma
+        roster.set_value(0, COLUMNS["charisma"], 70)
+        self.assertEqual(handle.charisma.value, 70)
+
+    def test_add_values_refuses_a_bad_row(self):
+        roster = CharacterRoster()
+        roster.add_kind(Sheriff)
+
+        for values in ([1] * (STRIDE - 1), [1] * (STRIDE + 1), [256] + [1] * (STRIDE - 1), [-1] * STRIDE):
+            with self.subTest(values=values), self.assertRaises(ValueError):
+                roster.add_values(Sheriff, values)
+
+        self.assertEqual((len(roster), len(roster.stats)), (1, STRIDE))
+        self.assertEqual(roster.add_values(Sheriff, range(STRIDE)).strength.value, 0)
+
+    def test_to_character_round_trips(self):
+        roster = CharacterRoster()
+        snake = Snake("Slither")
+        snake.strength.value = 42
+
+        rebuilt = roster.add(snake).to_character()
+
+        self.assertIsInstance(rebuilt, Snake)
+        self.assertEqual(rebuilt.name, "Slither")
+        self.assertEqual({name: getattr(rebuilt, name).value for name in COLUMNS if hasattr(rebuilt, name)},
+                         {name: getattr(snake, name).value for name in COLUMNS if hasattr(snake, name)})
+
+    def test_views_resolve_events_like_attributes(self):
+        roster = CharacterRoster()
+        event = Event(None, {"primary_attribute": "Strength", "secondary_attribute": "Strength"})
+
+        self.assertEqual(event.check(roster.add_kind(Sheriff).strength), EventStatus.PASS)
+        self.assertIsInstance(roster[0], CompactCharacter)
+
+    def test_rows_take_a_fraction_of_the_memory_of_characters(self):
+        rows = 10_000
+
+        def build_roster():
+            roster = CharacterRoster()
+            for _ in range(rows):
+                roster.add_kind(Sheriff)
+            return roster
+
+        roster_bytes = traced_bytes(build_roster)
+        character_bytes = traced_bytes(lambda: [Sheriff() for _ in range(rows)])
+
+        self.assertLess(roster_bytes * 10, character_bytes)
+        self.assertLess(roster_bytes / rows, 32)
+
+
+if __name__ == '__main__':
+    unittest.main()
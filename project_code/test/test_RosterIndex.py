@@ -0,0 +1,66 @@
+import unittest
+
+from project_code.src.main import Bartender, Game, CommandParser, Sheriff, Snake
+from project_code.src.OutputSink import NullSink
+from project_code.src.Roster import COLUMNS, CharacterRoster
+from project_code.src.RosterIndex import RosterIndex
+
+
+class TestRosterIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.sheriff, self.bartender, self.snake = Sheriff(), Bartender(), Snake()
+        self.index = RosterIndex()
+        self.index.add_many([self.sheriff, self.bartender], "Saloon")
+        self.index.add(self.snake, "Jail")
+
+    def test_location_and_class_lookups_follow_moves(self):
+        self.index.move(self.bartender, "Jail")
+        self.assertEqual(self.index.at("Saloon"), [self.sheriff])
+        self.assertEqual(self.index.at("Jail"), [self.snake, self.bartender])
+        self.assertEqual(self.index.where(self.bartender), "Jail")
+        self.assertEqual(self.index.of_class(Sheriff), [self.sheriff])
+        self.index.remove(self.snake)
+        self.assertEqual(self.index.at("Jail"), [self.bartender])
+        self.assertIsNone(self.index.where(self.snake))
+
+    def test_range_queries_follow_stat_changes(self):
+        self.assertEqual(self.index.range("strength", 80), [self.bartender, self.snake, self.sheriff])
+        self.index.set_value(self.sheriff, "strength", 10)
+        self.snake.strength.value = 85
+        self.index.refresh([self.snake])
+        self.assertEqual(self.index.range("strength", 80), [self.bartender, self.snake])
+        self.assertEqual(self.index.count_range("strength", 0, 79), 1)
+
+    def test_game_party_moves_with_the_game(self):
+        game = Game(CommandParser(), NullSink(), seed=1)
+        game.run_script(["status"])
+        index = game.index_roster()
+        self.assertEqual(index.at(game.current_location), game.party)
+        self.assertEqual(len(index), 9)
+
+    def test_roster_handles_are_found_by_row(self):
+        roster = CharacterRoster()
+        roster.add(Sheriff())
+        roster.add_kind(Snake)
+        index = RosterIndex()
+        index.add_many(roster, "Saloon")
+
+        # Every access makes a new handle; each must still find its row's slot.
+        index.move(roster[1], "Jail")
+        index.set_value(roster[0], "strength", 10)
+        roster.set_value(1, COLUMNS["strength"], 95)
+        index.refresh([roster[1]])
+
+        self.assertIn(roster[0], index)
+        self.assertEqual(index.where(roster[1]), "Jail")
+        self.assertEqual(index.at("Saloon"), [roster[0]])
+        self.assertEqual(index.of_class(Snake), [roster[1]])
+        self.assertEqual(index.range("strength", 80), [roster[1]])
+        index.remove(roster[0])
+        self.assertNotIn(roster[0], index)
+        self.assertEqual(len(index), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
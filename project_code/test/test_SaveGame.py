@@ -0,0 +1,84 @@
+import os
+import tempfile
+import unittest
+from project_code.src.main import CommandParser, EventStatus, Game, LocationSpec, Sheriff, Strength, World
+from project_code.src.SaveGame import GameJournal, capture_state, load_state, restore_game
+
+
+class TestSaveGame(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.game = Game(CommandParser())
+
+    def test_resume_replays_journal_after_snapshot(self):
+        journal = GameJournal(self.directory, capture_state(self.game))
+        journal.record("location", name="Jail")
+        journal.compact()
+        journal.record("status", key="A bar fight breaks out. What do you do?", status="pass")
+        journal.record("event", key="A mysterious stranger offers you a secret job. What do you do?")
+        journal.close()
+
+        state = load_state(self.directory)
+
+        self.assertEqual(state["current_location"], "Jail")
+        self.assertEqual(state["event_statuses"], {"A bar fight breaks out. What do you do?": "pass"})
+        self.assertEqual(state["seq"], 3)
+
+    def test_restore_game_rebuilds_party_and_location(self):
+        sheriff = Sheriff("Wyatt")
+        sheriff.strength = Strength(12)
+        self.game.party = [sheriff]
+        self.game.current_location = self.game.locations[1]
+        journal = GameJournal(self.directory, capture_state(self.game))
+        journal.close()
+
+        restored = restore_game(Game(CommandParser()), load_state(self.directory))
+
+        self.assertEqual([type(character) for character in restored.party], [Sheriff])
+        self.assertEqual(restored.party[0].name, "Wyatt")
+        self.assertEqual(restored.party[0].strength.value, 12)
+        self.assertEqual(restored.current_location.name, "Jail")
+
+    def test_events_from_the_same_data_keep_their_own_status(self):
+        data = {"primary_attribute": "Strength", "secondary_attribute": "Dexterity",
+                "prompt_text": "A stagecoach is robbed. What do you do?"}
+        world = World([Sheriff], [0], [LocationSpec("Trail", "A dusty trail.", [data, data])])
+        game = Game(CommandParser(), world=world)
+        first, second = game.locations[0].deck.cards
+        first.set_status(EventStatus.PASS)
+        second.set_status(EventStatus.FAIL)
+        journal = GameJournal(self.directory, capture_state(game))
+        journal.close()
+
+        restored = restore_game(Game(CommandParser(), world=world), load_state(self.directory))
+
+        self.assertEqual([event.status for event in restored.locations[0].deck.cards],
+                         [EventStatus.PASS, EventStatus.FAIL])
+
+    def test_restore_builds_only_the_locations_the_save_names(self):
+        data = {"primary_attribute": "Strength", "secondary_attribute": "Dexterity"}
+        world = World([Sheriff], [0], [LocationSpec(name, "A dusty place.", [data]) for name in ("Trail", "Ford", "Mine")])
+        game = Game(CommandParser(), world=world)
+        game.locations[0].deck.cards[0].set_status(EventStatus.PASS)
+        game.current_location = game.locations[1]
+        journal = GameJournal(self.directory, capture_state(game))
+        journal.close()
+
+        restored = restore_game(Game(CommandParser(), world=world), load_state(self.directory))
+
+        self.assertEqual([location.loaded for location in restored.locations], [True, True, False])
+        self.assertEqual(restored.locations[0].deck.cards[0].status, EventStatus.PASS)
+
+    def test_close_raises_the_writers_error(self):
+        journal = GameJournal(self.directory, capture_state(self.game))
+        journal.record("event", key=object())
+
+        with self.assertRaises(TypeError):
+            journal.close()
+
+    def test_no_save_returns_none(self):
+        self.assertIsNone(load_state(os.path.join(self.directory, "nobody")))
+
+
+if __name__ == '__main__':
+    unittest.main()
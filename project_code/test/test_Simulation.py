@@ -0,0 +1,54 @@
+import time
+import unittest
+from project_code.src.main import EventStatus
+from project_code.src.Simulation import SimulationReport, run_games, run_simulation
+
+
+class TestSimulation(unittest.TestCase):
+    def test_run_games_records_every_turn(self):
+        report = run_games(10, seed=1)
+
+        self.assertEqual(report.games, 10)
+        self.assertEqual(sum(report.totals().values()), report.turns)
+
+    def test_outcomes_are_keyed_by_event_id(self):
+        report = run_games(5, seed=1)
+
+        self.assertEqual(sorted(report.outcomes), ["Jail/0", "Saloon/0"])
+
+    def test_a_run_scales_to_many_games(self):
+        def seconds_per_game(games):
+            start = time.perf_counter()
+            report = run_games(games, seed=2)
+            self.assertEqual(report.games, games)
+            return (time.perf_counter() - start) / games
+
+        few = min(seconds_per_game(100) for _ in range(3))
+        many = seconds_per_game(2000)
+
+        self.assertLess(many, few * 2)
+
+    def test_merge_combines_counts(self):
+        first = SimulationReport()
+        first.games = 1
+        first.record("bar fight", EventStatus.PASS)
+        second = SimulationReport()
+        second.games = 2
+        second.record("bar fight", EventStatus.PASS)
+        second.record("stranger", EventStatus.FAIL)
+
+        first.merge(second)
+
+        self.assertEqual(first.games, 3)
+        self.assertEqual(first.outcomes["bar fight"]["pass"], 2)
+        self.assertEqual(first.outcomes["stranger"]["fail"], 1)
+
+    def test_run_simulation_plays_all_games_in_process_pool(self):
+        report = run_simulation(20, workers=2, seed=3)
+
+        self.assertEqual(report.games, 20)
+        self.assertEqual(sum(report.totals().values()), report.turns)
+
+
+if __name__ == '__main__':
+    unittest.main()
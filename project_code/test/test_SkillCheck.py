@@ -0,0 +1,80 @@
+import random
+import unittest
+from array import array
+from project_code.src.main import Event, Sheriff, Deputy, Snake
+from project_code.src.OutputSink import NullSink
+from project_code.src.SkillCheck import BatchResolver, PASS, FAIL, PARTIAL_PASS, encode_party, encode_skills, to_statuses
+
+
+class ScriptedParser:
+    """Picks a given party member and skill, the way a player would."""
+
+    def __init__(self, character, skill_index):
+        self.character = character
+        self.skill_index = skill_index
+
+    def select_party_member(self, party):
+        return self.character
+
+    def select_skill(self, character):
+        return character.skills[self.skill_index]
+
+
+def make_events():
+    attributes = ("Strength", "Charisma", "Wisdom", None)
+    return [Event(None, {"primary_attribute": primary, "secondary_attribute": secondary, "prompt_text": "?"})
+            for primary in attributes for secondary in attributes]
+
+
+class TestBatchResolver(unittest.TestCase):
+    def setUp(self):
+        self.events = make_events()
+        self.party = [Sheriff(), Deputy(), Snake()]
+        self.resolver = BatchResolver(self.events)
+
+    def test_party_triples_match_event_execute(self):
+        rng = random.Random(3)
+        triples = []
+        for _ in range(500):
+            character = rng.randrange(len(self.party))
+            triples.append((rng.randrange(len(self.events)), character,
+                            rng.randrange(len(self.party[character].skills))))
+        event_ids, character_ids, skill_indices = (array('I', column) for column in zip(*triples))
+
+        outcomes = self.resolver.resolve_party(encode_party(self.party), event_ids, character_ids, skill_indices)
+
+        expected = []
+        for event_id, character, skill_index in triples:
+            event = self.events[event_id]
+            event.parser = ScriptedParser(self.party[character], skill_index)
+            event.execute(self.party, NullSink())
+            expected.append(event.status)
+        self.assertEqual(to_statuses(outcomes), expected)
+
+    def test_skill_codes_match_event_check(self):
+        codes, _ = encode_skills(self.party[1].skills)
+        event_ids = array('I', [event_id for event_id in range(len(self.events)) for _ in codes])
+        skill_codes = array('B', list(codes) * len(self.events))
+
+        outcomes = self.resolver.resolve(event_ids, skill_codes)
+
+        expected = [self.events[event_id].check(skill) for event_id in range(len(self.events))
+                    for skill in self.party[1].skills]
+        self.assertEqual(to_statuses(outcomes), expected)
+        self.assertEqual(sum(BatchResolver.counts(outcomes).values()), len(outcomes))
+
+    def test_numeric_check_drops_one_level_below_threshold(self):
+        resolver = BatchResolver(self.events[:1], thresholds=[100])
+        table = encode_party([self.party[0]])
+        names = [skill.__class__.__name__ for skill in self.party[0].skills]
+        strength, wisdom = names.index("Strength"), names.index("Wisdom")
+
+        low = resolver.resolve_party_numeric(table, [0, 0], [0, 0], [strength, wisdom], rolls=[1, 1])
+        high = resolver.resolve_party_numeric(table, [0], [0], [strength], rolls=[10])
+
+        self.assertEqual(list(low), [PARTIAL_PASS, FAIL])
+        self.assertEqual(list(high), [PASS])
+
+
+if __name__ == '__main__':
+    unittest.main()
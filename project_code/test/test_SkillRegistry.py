@@ -0,0 +1,61 @@
+import unittest
+from project_code.src.main import Attribute, Deputy, Sheriff, SkillRegistry, Strength
+
+
+class TestSkillRegistry(unittest.TestCase):
+    def setUp(self):
+        # Start as if no Sheriff had been seen yet.
+        self.saved = dict(SkillRegistry.layouts)
+        SkillRegistry.layouts.pop(Sheriff, None)
+
+    def tearDown(self):
+        SkillRegistry.layouts.clear()
+        SkillRegistry.layouts.update(self.saved)
+
+    def test_an_unusual_first_instance_does_not_skew_the_layout(self):
+        odd = Sheriff()
+        odd.strength = None
+        normal = Sheriff()
+
+        self.assertEqual(len(odd.skills), 9)
+        self.assertEqual(len(normal.skills), 10)
+        self.assertIs(normal.skills[0], normal.strength)
+        self.assertEqual(len(SkillRegistry.names(Sheriff)), 10)
+
+    def test_non_attribute_values_fall_back_to_a_scan(self):
+        sheriff = Sheriff()
+        sheriff.skills
+        sheriff.wisdom = "wise"
+
+        skills = sheriff.skills
+
+        self.assertEqual(len(skills), 9)
+        self.assertTrue(all(isinstance(skill, Attribute) for skill in skills))
+
+    def test_a_replaced_attribute_type_is_still_returned(self):
+        sheriff = Sheriff()
+        sheriff.wisdom = Strength(7)
+
+        self.assertIn(sheriff.wisdom, sheriff.skills)
+        self.assertEqual(len(sheriff.skills), 10)
+
+    def test_cached_skills_follow_assignment_and_deletion(self):
+        sheriff = Sheriff()
+        skills = sheriff.skills
+        self.assertIs(sheriff.skills, skills)
+
+        sheriff.strength = Strength(3)
+        self.assertIn(sheriff.strength, sheriff.skills)
+        self.assertNotIn(skills[0], sheriff.skills)
+
+        del sheriff.dexterity
+        self.assertEqual(len(sheriff.skills), 9)
+
+    def test_fast_path_returns_the_current_attributes(self):
+        deputy = Deputy()
+        self.assertEqual(deputy.skills, SkillRegistry.skills(deputy))
+        self.assertIn("Charisma", SkillRegistry.names(Deputy))
+
+
+if __name__ == '__main__':
+    unittest.main()
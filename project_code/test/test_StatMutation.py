@@ -0,0 +1,101 @@
+import unittest
+
+from project_code.src.main import Sheriff, Bartender
+from project_code.src.Roster import COLUMNS, CharacterRoster
+from project_code.src.StatMutation import StatJournal, StatMutator
+from project_code.src.Statistic import Strength
+
+
+class TestStatMutator(unittest.TestCase):
+
+    def test_apply_clamps_to_bounds(self):
+        stats = [Strength(0), Strength(0), Strength(0)]
+        stats[0].value, stats[1].value, stats[2].value = 5, 50, 98
+        StatMutator().apply(stats, [-10, 10, 10])
+        self.assertEqual([stat.value for stat in stats], [0, 60, 100])
+
+    def test_undo_restores_the_last_batch_only(self):
+        party = [Sheriff(), Bartender()]
+        mutator = StatMutator()
+        mutator.apply_to_party(party, "vitality", -5)
+        mutator.apply_to_party(party, "vitality", -7)
+        mutator.undo()
+        self.assertEqual(party[0].vitality.value, 70)
+        self.assertEqual(party[1].vitality.value, 70)
+        self.assertEqual(len(mutator.journal), 2)
+        mutator.undo()
+        self.assertEqual(party[0].vitality.value, 75)
+        self.assertIsNone(mutator.undo())
+
+    def test_roster_changes_round_trip_through_bytes(self):
+        roster = CharacterRoster()
+        for _ in range(3):
+            roster.add(Sheriff())
+        mutator = StatMutator()
+        mutator.apply_to_roster(roster, "strength", 100)
+        self.assertEqual([roster.value(row, COLUMNS["strength"]) for row in range(3)], [100, 100, 100])
+        journal = StatJournal.from_bytes(mutator.journal.to_bytes(), mutator.journal.target_list)
+        journal.undo()
+        self.assertEqual([roster.value(row, COLUMNS["strength"]) for row in range(3)], [90, 90, 90])
+
+    def test_fractional_deltas_change_nothing(self):
+        party = [Sheriff(), Bartender()]
+        mutator = StatMutator()
+        mutator.apply_to_party(party, "vitality", -5)
+        columns = [list(column) for column in mutator.journal._columns()]
+
+        for delta in (2.5, [1, 0.5], (1, "1")):
+            with self.subTest(delta=delta), self.assertRaises(TypeError):
+                mutator.apply([party[0].vitality, party[1].vitality], delta)
+        with self.assertRaises(TypeError):
+            mutator.apply_to_roster(CharacterRoster(), "strength", 1.5)
+
+        self.assertEqual([character.vitality.value for character in party], [70, 70])
+        self.assertEqual([list(column) for column in mutator.journal._columns()], columns)
+
+    def test_a_failing_batch_is_rolled_back(self):
+        class Brittle(Strength):
+            def __setattr__(self, name, value):
+                if name == "value" and value == 13:
+                    raise RuntimeError("no luck")
+                super().__setattr__(name, value)
+
+        stats = [Strength(0), Brittle(0), Strength(0)]
+        for stat, value in zip(stats, (4, 3, 2)):
+            stat.value = value
+        mutator = StatMutator()
+        mutator.apply(stats, 1)
+
+        with self.assertRaises(RuntimeError):
+            mutator.apply(stats, 9)
+
+        self.assertEqual([stat.value for stat in stats], [5, 4, 3])
+        self.assertEqual(len(mutator.journal), 3)
+        mutator.undo()
+        self.assertEqual([stat.value for stat in stats], [4, 3, 2])
+
+    def test_values_that_do_not_fit_the_journal_change_nothing(self):
+        stats = [Strength(0), Strength(0)]
+        stats[0].value, stats[1].value = 10, 20.5
+        mutator = StatMutator()
+
+        with self.assertRaises(TypeError):
+            mutator.apply(stats, 1)
+
+        self.assertEqual([stat.value for stat in stats], [10, 20.5])
+        self.assertEqual(len(mutator.journal), 0)
+
+    def test_roster_rows_outside_the_byte_range_change_nothing(self):
+        roster = CharacterRoster()
+        roster.add(Sheriff())
+        mutator = StatMutator()
+
+        with self.assertRaises(OverflowError):
+            mutator.apply_to_roster(roster, "strength", 200, rows=[0], max_value=1000)
+
+        self.assertEqual(roster.value(0, COLUMNS["strength"]), 90)
+        self.assertEqual(len(mutator.journal), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import tempfile
+import unittest
+from project_code.src.main import Deputy, Event, EventStatus, Game, Sheriff
+from project_code.src.OutputSink import NullSink
+from project_code.src.User import User
+
+
+class TestUser(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def play(self, user, commands):
+        game = user.current_game
+        game.sink = NullSink()
+        game.run_script(commands)
+        return game
+
+    def test_new_user_gets_a_real_game(self):
+        game = User("wyatt", "tombstone").current_game
+
+        self.assertIsInstance(game, Game)
+        self.assertEqual([character.__class__.__name__ for character in game.party], ["Sheriff", "Outlaw", "Bartender"])
+
+    def test_saved_game_comes_back_on_the_next_login(self):
+        user = User("wyatt", "tombstone", save_directory=self.directory)
+        game = self.play(user, ["look", "execute", "status", "event"])
+        game.set_party(game.party[:2])
+        game.apply_to_party("strength", 5)
+        played = {event.key: event.status for location in game.locations if location.loaded
+                  for event in location.deck.cards if event.status != EventStatus.UNKNOWN}
+        location = game.current_location.name
+        user.close()
+
+        returning = User("wyatt", "tombstone", save_directory=self.directory)
+        self.addCleanup(returning.close)
+        resumed = returning.current_game
+
+        self.assertEqual(len(played), 1)
+        self.assertEqual([character.__class__.__name__ for character in resumed.party],
+                         [character.__class__.__name__ for character in game.party])
+        self.assertEqual(len(resumed.party), 2)
+        self.assertEqual(resumed.party[0].strength.value, 95)
+        self.assertEqual(resumed.current_location.name, location)
+        restored = {event.key: event.status for location in resumed.locations if location.loaded
+                    for event in location.deck.cards if event.status != EventStatus.UNKNOWN}
+        self.assertEqual(restored, played)
+
+    def test_suggestions_reuse_one_optimizer_per_candidates_and_events(self):
+        user = User("wyatt", "tombstone", legacy_points=10)
+        candidates = [Sheriff(), Deputy()]
+        events = [Event(None, {"primary_attribute": "Charisma", "secondary_attribute": "Strength"})]
+
+        first = user.suggest_parties(candidates, events)
+        again = user.suggest_parties(list(candidates), list(events))
+        user.suggest_parties(candidates[:1], events)
+
+        self.assertEqual(again, first)
+        self.assertEqual(len(user._optimizers), 2)
+        optimizer = next(iter(user._optimizers.values()))[1]
+        self.assertEqual(optimizer.cache_info().hits, 1)
+
+if __name__ == '__main__':
+    unittest.main()
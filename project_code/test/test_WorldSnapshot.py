@@ -0,0 +1,37 @@
+import os
+import tempfile
+import unittest
+
+from project_code.src.main import Game, CommandParser, World
+from project_code.src.OutputSink import NullSink
+from project_code.src.WorldSnapshot import load_world, save_world
+
+
+class TestLazyWorld(unittest.TestCase):
+
+    def test_locations_are_built_on_first_visit(self):
+        game = Game(CommandParser(), NullSink(), seed=3)
+        self.assertFalse(any(location.loaded for location in game.locations))
+        game._check_current_state()
+        self.assertEqual([location.loaded for location in game.locations],
+                         [location is game.current_location for location in game.locations])
+
+    def test_characters_include_the_starting_party(self):
+        game = Game(CommandParser(), NullSink(), seed=3)
+        self.assertEqual(len(game.characters), 9)
+        self.assertEqual(game.characters[:3], game.party)
+
+    def test_snapshot_plays_like_the_world_it_was_saved_from(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "default.world")
+            save_world(World.default(), path)
+            world = load_world(path)
+        played = []
+        for game in (Game(CommandParser(), NullSink(), 11), Game(CommandParser(), NullSink(), 11, world)):
+            game.run_script(["execute"] * 5)
+            played.append([(location.name, location.deck.draws) for location in game.locations])
+        self.assertEqual(played[0], played[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
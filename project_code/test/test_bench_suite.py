@@ -0,0 +1,37 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from project_code.bench.bench_suite import compare, load_baseline, save_baseline
+
+
+class TestBenchSuite(unittest.TestCase):
+    def test_compare_flags_only_changes_beyond_the_threshold(self):
+        baseline = {"steady": 100.0, "slower": 100.0, "faster": 100.0}
+        results = {"steady": 105.0, "slower": 125.0, "faster": 50.0, "added": 10.0}
+        out = io.StringIO()
+
+        regressions = compare(baseline, results, threshold=0.10, out=out)
+
+        self.assertEqual(regressions, ["slower"])
+        lines = dict(line.split(None, 1) for line in out.getvalue().splitlines())
+        self.assertIn("+5.0%", lines["steady"])
+        self.assertIn("REGRESSION", lines["slower"])
+        self.assertIn("faster", lines["faster"])
+        self.assertIn("(new)", lines["added"])
+
+    def test_saved_baseline_loads_back(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "baseline.json")
+
+        save_baseline(path, {"game_init[1]": 1234.5})
+
+        self.assertEqual(load_baseline(path), {"game_init[1]": 1234.5})
+        with open(path) as baseline_file:
+            self.assertIn("python", json.load(baseline_file))
+
+
+if __name__ == '__main__':
+    unittest.main()